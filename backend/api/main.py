@@ -9,8 +9,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
-from app.core.database import connect_db, disconnect_db
+from app.core.database import connect_db, disconnect_db, prisma
 from app.routes import event_types_router, availability_router, bookings_router, users_router
+from app.services.booking_coordinator import require_overlap_constraint
 
 
 @asynccontextmanager
@@ -20,6 +21,7 @@ async def lifespan(app: FastAPI):
     print("🚀 Starting Calendly Clone API...")
     await connect_db()
     print("✅ Database connected!")
+    await require_overlap_constraint(prisma)
     
     yield
     
@@ -4,7 +4,7 @@ Uses pydantic-settings for environment variable management.
 """
 import os
 from functools import lru_cache
-from typing import List
+from typing import List, Literal
 from pydantic_settings import BaseSettings
 
 # Find .env file - check current dir, then parent
@@ -35,6 +35,45 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     
+    # Availability cache (per process)
+    availability_cache_enabled: bool = True
+    availability_cache_max_entries: int = 5000
+    availability_cache_max_bytes: int = 16 * 1024 * 1024
+    availability_cache_ttl_seconds: int = 60
+    
+    # Booking interval index (per process): upcoming CONFIRMED bookings per host
+    booking_index_enabled: bool = True
+    booking_index_ttl_seconds: int = 300
+    booking_index_lookback_hours: int = 48
+    
+    # Round-robin assignment: balance bookings started within the last N days
+    round_robin_window_days: int = 30
+    round_robin_ttl_seconds: int = 300
+    
+    # Refuse to start without the booking overlap constraint (applied by migrate.sh);
+    # when false, a missing constraint is only reported
+    require_overlap_constraint: bool = True
+    
+    # Booking coordinator (per process): queue single-host bookings per host, commit in batches
+    booking_coordinator_enabled: bool = True
+    booking_batch_max: int = 50
+    
+    # Slot holds (per process): how long a held slot stays reserved, and how many holds at once
+    slot_hold_ttl_seconds: int = 300
+    slot_hold_max: int = 10000
+    
+    # Idempotency-Key replay for POST /public/bookings (per process)
+    idempotency_ttl_seconds: int = 24 * 60 * 60
+    idempotency_max_entries: int = 10000
+    
+    # Calendar feeds (per process): rendered ICS feeds of this many hosts are kept
+    calendar_feed_cache_max_entries: int = 1000
+    
+    # Slot engine: "python" (sweep line), "bitmap" (NumPy, needs numpy installed) or
+    # "postgres" (GET /public/slots of individual event types computed by the database,
+    # needs prisma/sql/free_slots.sql applied; other slot queries use the sweep line)
+    slot_engine: Literal["python", "bitmap", "postgres"] = "python"
+    
     @property
     def cors_origins_list(self) -> List[str]:
         """Parse CORS origins string into list."""
@@ -1,8 +1,9 @@
 """
 Availability API Router - Prisma Version
 """
+from datetime import datetime, timedelta, timezone as dt_timezone
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from prisma import Prisma, Json
 
 from app.core.database import prisma
@@ -17,14 +18,42 @@ from app.schemas import (
     DateOverrideCreate,
     DateOverrideResponse,
     TimezoneUpdate,
+    FreeBusyResponse,
 )
 from app.routes.event_types import ensure_default_user, DEFAULT_USER_ID
+from app.services.availability_cache import availability_cache
+from app.services.booking_caps import refresh_user_counters
+from app.services.booking_coordinator import booking_coordinator
+from app.services.booking_index import booking_index
+from app.services.calendar_feed import calendar_feed_cache
+from app.services.idempotency import idempotency_store
+from app.services.slot_holds import slot_holds
+from app.services.slots import merge_busy_intervals
+from app.services.timezones import is_valid_timezone
 
 
 router = APIRouter(prefix="/availability", tags=["Availability"])
 
 DAY_NAMES = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
 
+# Longest range /availability/freebusy will return in one request
+MAX_FREEBUSY_RANGE_DAYS = 366
+
+# Buffered CONFIRMED bookings of a host overlapping [$2, $3), sorted by start.
+# Selects just the two buffered endpoints as epoch seconds (timestamps are stored as UTC).
+FREEBUSY_SQL = """
+SELECT
+    EXTRACT(EPOCH FROM b.start_time - make_interval(mins => e.buffer_before_minutes))::float8 AS busy_start,
+    EXTRACT(EPOCH FROM b.end_time + make_interval(mins => e.buffer_after_minutes))::float8 AS busy_end
+FROM bookings b
+JOIN event_types e ON e.id = b.event_type_id
+WHERE b.host_id = $1
+  AND b.status = 'CONFIRMED'
+  AND b.start_time - make_interval(mins => e.buffer_before_minutes) < $3::timestamp
+  AND b.end_time + make_interval(mins => e.buffer_after_minutes) > $2::timestamp
+ORDER BY busy_start
+"""
+
 
 async def get_or_create_default_schedule(db: Prisma, user_id: str):
     """Get or create the default availability schedule for a user."""
@@ -110,10 +139,15 @@ async def update_availability_schedule(update_data: AvailabilityScheduleUpdate):
     
     # Update timezone if provided
     if update_data.timezone:
+        if not is_valid_timezone(update_data.timezone):
+            raise HTTPException(status_code=400, detail="Invalid timezone")
         await prisma.availabilityschedule.update(
             where={"id": schedule.id},
             data={"timezone": update_data.timezone}
         )
+        # Booking caps count days in this timezone
+        if update_data.timezone != schedule.timezone:
+            await refresh_user_counters(user.id)
     
     # Update weekly hours if provided
     if update_data.weekly_hours:
@@ -157,6 +191,8 @@ async def update_availability_schedule(update_data: AvailabilityScheduleUpdate):
                     }
                 )
     
+    availability_cache.invalidate_host(user.id)
+    
     # Refetch and return
     schedule = await prisma.availabilityschedule.find_first(
         where={"id": schedule.id}
@@ -219,7 +255,10 @@ async def list_schedules():
 async def create_schedule(schedule_data: ScheduleCreate):
     """Create a new availability schedule."""
     user = await ensure_default_user(prisma)
-    
+
+    if not is_valid_timezone(schedule_data.timezone):
+        raise HTTPException(status_code=400, detail="Invalid timezone")
+
     # If setting as default, unset current default
     if schedule_data.is_default:
         await prisma.availabilityschedule.update_many(
@@ -250,6 +289,11 @@ async def create_schedule(schedule_data: ScheduleCreate):
             }
         )
     
+    if schedule_data.is_default:
+        availability_cache.invalidate_host(user.id)
+        # Booking caps count days in the default schedule's timezone
+        await refresh_user_counters(user.id)
+    
     # Refetch with weekly hours
     weekly_hours = await prisma.weeklyhours.find_many(
         where={"scheduleId": schedule.id},
@@ -320,6 +364,8 @@ async def add_date_override(override_data: DateOverrideCreate):
             }
         )
     
+    availability_cache.invalidate_host(user.id)
+    
     return DateOverrideResponse(
         id=override.id,
         schedule_id=override.scheduleId,
@@ -347,6 +393,7 @@ async def delete_date_override(override_id: str):
         raise HTTPException(status_code=403, detail="Not authorized")
     
     await prisma.dateoverride.delete(where={"id": override_id})
+    availability_cache.invalidate_host(user.id)
     return None
 
 
@@ -356,17 +403,78 @@ async def update_timezone(timezone_data: TimezoneUpdate):
     user = await ensure_default_user(prisma)
     schedule = await get_or_create_default_schedule(prisma, user.id)
     
-    # Validate timezone (basic check)
-    import pytz
-    try:
-        pytz.timezone(timezone_data.timezone)
-    except pytz.UnknownTimeZoneError:
+    # Validate timezone against the IANA database
+    if not is_valid_timezone(timezone_data.timezone):
         raise HTTPException(status_code=400, detail="Invalid timezone")
     
     await prisma.availabilityschedule.update(
         where={"id": schedule.id},
         data={"timezone": timezone_data.timezone}
     )
+    availability_cache.invalidate_host(user.id)
+    
+    # Booking caps count days in this timezone
+    if timezone_data.timezone != schedule.timezone:
+        await refresh_user_counters(user.id)
     
     return {"timezone": timezone_data.timezone}
 
+
+@router.get("/freebusy", response_model=FreeBusyResponse)
+async def get_free_busy(
+    from_time: datetime = Query(..., alias="from", description="Range start (ISO 8601, UTC if no offset)"),
+    to_time: datetime = Query(..., alias="to", description="Range end (ISO 8601, UTC if no offset)")
+):
+    """Get the current user's merged, buffer-aware busy intervals in a time range."""
+    user = await ensure_default_user(prisma)
+    
+    # Treat naive datetimes as UTC
+    range_start = from_time if from_time.tzinfo else from_time.replace(tzinfo=dt_timezone.utc)
+    range_end = to_time if to_time.tzinfo else to_time.replace(tzinfo=dt_timezone.utc)
+    range_start = range_start.astimezone(dt_timezone.utc)
+    range_end = range_end.astimezone(dt_timezone.utc)
+    
+    if range_end <= range_start:
+        raise HTTPException(status_code=400, detail="'to' must be after 'from'")
+    
+    if range_end - range_start > timedelta(days=MAX_FREEBUSY_RANGE_DAYS):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range cannot exceed {MAX_FREEBUSY_RANGE_DAYS} days"
+        )
+    
+    # Two columns per booking, already sorted - no Booking models are built
+    rows = await prisma.query_raw(
+        FREEBUSY_SQL,
+        user.id,
+        range_start.replace(tzinfo=None).isoformat(),
+        range_end.replace(tzinfo=None).isoformat()
+    )
+    
+    # One pass over the sorted rows merges overlapping intervals
+    busy = merge_busy_intervals(
+        (
+            datetime.fromtimestamp(row["busy_start"], tz=dt_timezone.utc),
+            datetime.fromtimestamp(row["busy_end"], tz=dt_timezone.utc)
+        )
+        for row in rows
+    )
+    
+    return FreeBusyResponse(
+        start=range_start,
+        end=range_end,
+        busy=[(max(start, range_start), min(end, range_end)) for start, end in busy]
+    )
+
+
+@router.get("/cache/stats", response_model=dict)
+async def get_availability_cache_stats():
+    """Get counters and sizes of the availability cache, booking index, booking coordinator, slot holds, idempotency store and calendar feeds (this process)."""
+    return {
+        **availability_cache.stats(),
+        "booking_index": booking_index.stats(),
+        "booking_coordinator": booking_coordinator.stats(),
+        "slot_holds": slot_holds.stats(),
+        "idempotency": idempotency_store.stats(),
+        "calendar_feeds": calendar_feed_cache.stats(),
+    }
@@ -1,20 +1,37 @@
 """
 Bookings and Meetings API Router - Prisma Version
 """
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from datetime import datetime, timedelta, date, timezone as dt_timezone
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 from calendar import monthrange
-from fastapi import APIRouter, HTTPException, Query, status
+from uuid import uuid4
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from prisma import Prisma, Json
+from pydantic import ValidationError
 
+from app.core.config import settings
 from app.core.database import prisma
 from app.schemas import (
     BookingCreate,
     BookingResponse,
     BookingListResponse,
+    BookingChangesResponse,
+    SparseBookingListResponse,
+    BookingImportRow,
+    BookingImportReject,
+    BookingImportResponse,
     CancelBookingRequest,
+    CancelRangeRequest,
+    CancelRangeResponse,
+    RescheduleBookingRequest,
     TimeSlot,
     AvailableSlotsResponse,
+    AvailableSlotsRangeResponse,
+    NextAvailableResponse,
+    SlotHoldCreate,
+    SlotHoldResponse,
     AvailableDatesResponse,
     PublicBookingPageResponse,
     PublicEventTypeResponse,
@@ -22,11 +39,83 @@ from app.schemas import (
     EventTypeResponse,
     MeetingNotesCreate,
 )
-from app.routes.event_types import ensure_default_user, DEFAULT_USER_ID, get_location_type_str
+from app.routes.event_types import (
+    ensure_default_user,
+    DEFAULT_USER_ID,
+    get_location_type_str,
+    get_scheduling_type_str,
+    get_team_host_ids,
+)
+from app.services.availability_cache import availability_cache
+from app.services.booking_caps import (
+    BookingCapReached,
+    CapUsage,
+    count_booking,
+    load_caps,
+    load_usage,
+    refresh_counters,
+    uncount_bookings,
+)
+from app.services.booking_coordinator import SlotUnavailable, booking_coordinator, is_booking_overlap
+from app.services.calendar_feed import CachedFeed, FeedVersion, assemble, calendar_feed_cache
+from app.services.booking_import import IMPORT_CHUNK_SIZE, ImportReject, ImportRow, read_rows, split_conflicts
+from app.services.meeting_export import EXPORT_BATCH_SIZE, ICS_FOOTER, ICS_HEADER, csv_header, csv_lines, csv_row, ics_event
+from app.services.booking_index import booking_index
+from app.services.idempotency import IdempotencyKeyReused, idempotency_store
+from app.services import slot_bitmap, slot_postgres, slots as slot_sweep
+from app.services.round_robin import host_load_balancer
+from app.services.seats import Seats, load_seats, open_seat_slots, release_seats, remaining_seats, take_seat
+from app.services.slot_holds import slot_holds
+from app.services.slots import (
+    HostAvailability,
+    Interval,
+    merge_busy_intervals,
+    schedule_dates,
+    slot_step,
+    union_slots_by_day,
+)
+from app.services.timezones import get_zone, is_valid_timezone, utc_to_local, zone_day
 
 
 router = APIRouter(tags=["Bookings"])
 
+# Longest range /public/slots/range will compute in one request
+MAX_SLOT_RANGE_DAYS = 31
+
+# Days /public/next-available searches first; each further window is twice as long
+NEXT_AVAILABLE_FIRST_WINDOW_DAYS = 2
+
+# Most rows one /meetings/import request may contain
+MAX_IMPORT_ROWS = 100000
+
+# Seconds a booking change waits before /meetings/changes sends it
+CHANGES_SETTLE_SECONDS = 5
+
+# A host's CONFIRMED bookings overlapping [$2, $3) as epoch seconds, sorted by start
+IMPORT_EXISTING_SQL = """
+SELECT
+    EXTRACT(EPOCH FROM start_time)::float8 AS start_epoch,
+    EXTRACT(EPOCH FROM end_time)::float8 AS end_epoch
+FROM bookings
+WHERE host_id = $1
+  AND status = 'CONFIRMED'
+  AND start_time < $3::timestamp
+  AND end_time > $2::timestamp
+ORDER BY start_time
+"""
+
+# Cancel the CONFIRMED bookings among ids $3...; returns the ids it cancelled
+CANCEL_BOOKINGS_SQL = """
+UPDATE bookings
+SET status = 'CANCELLED', cancelled_at = $1::timestamp, cancel_reason = $2, cancelled_by = 'host',
+    updated_at = $1::timestamp
+WHERE id IN ({ids}) AND status = 'CONFIRMED'
+RETURNING id
+"""
+
+if settings.slot_engine == "bitmap" and not slot_bitmap.NUMPY_AVAILABLE:
+    raise RuntimeError("SLOT_ENGINE=bitmap requires numpy (pip install numpy)")
+
 
 def get_status_str(status) -> str:
     """Safely extract string value from Prisma enum or string."""
@@ -37,6 +126,440 @@ def get_status_str(status) -> str:
     return str(status).lower()
 
 
+# ============ Slot Helpers ============
+
+class SlotContext(NamedTuple):
+    """Availability data for an event type's hosts, loaded once for a whole date range."""
+    schedule: Any                   # the first (usually the owner's) default schedule
+    scheduling_type: str
+    invitee_zone: str
+    host_ids: List[str]
+    hosts: List[HostAvailability]   # parallel to host_ids
+    seats: Optional[Seats] = None   # taken seats per slot (group event types only)
+    caps: Optional[CapUsage] = None # booking counters (capped hosts / event types only)
+
+
+def validate_timezone_param(timezone: Optional[str]) -> None:
+    """Reject an unknown `timezone` query parameter."""
+    if timezone is not None and not is_valid_timezone(timezone):
+        raise HTTPException(status_code=400, detail="Invalid timezone")
+
+
+def schedule_zone_name(schedule) -> str:
+    """The schedule's timezone, or UTC if the stored name is not a known zone."""
+    if schedule.timezone and is_valid_timezone(schedule.timezone):
+        return schedule.timezone
+    return "UTC"
+
+
+def availability_cache_hosts(host_ids: List[str]):
+    """Availability cache host key: the host id, or the tuple of a team's host ids."""
+    return host_ids[0] if len(host_ids) == 1 else tuple(host_ids)
+
+
+async def load_host_schedules(event_type, host_ids: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Default schedules (with weekly hours) of an event type's hosts, owner first.
+
+    One query for the whole team. Every host of an individual or collective
+    event type must be available, so a missing default schedule returns
+    None; round-robin pools just leave such hosts out.
+    """
+    schedules = await prisma.availabilityschedule.find_many(
+        where={"userId": {"in": host_ids}, "isDefault": True},
+        include={"weeklyHours": True}
+    )
+    by_host = {schedule.userId: schedule for schedule in schedules}
+    if get_scheduling_type_str(event_type.schedulingType) == "round_robin":
+        host_ids = [host_id for host_id in host_ids if host_id in by_host]
+    if not host_ids or any(host_id not in by_host for host_id in host_ids):
+        return None
+    return {host_id: by_host[host_id] for host_id in host_ids}
+
+
+async def load_slot_context(
+    event_type,
+    schedules: Dict[str, Any],
+    first_date: date,
+    last_date: date,
+    timezone: Optional[str] = None,
+    exclude: Sequence = ()
+) -> SlotContext:
+    """
+    Load everything slot generation needs for a date range.
+
+    `first_date`..`last_date` are invitee dates in `timezone` (default: the
+    owner's schedule timezone). Uses one query each for the date overrides
+    and the CONFIRMED bookings of all hosts that can affect those dates.
+    Booking rows in `exclude` (a meeting being moved) take no time, seat
+    or cap count.
+    """
+    owner_schedule = next(iter(schedules.values()))
+    invitee_zone = timezone or schedule_zone_name(owner_schedule)
+
+    # UTC span of the invitee dates, and each host's schedule dates that overlap it
+    range_start = zone_day(invitee_zone, first_date).start
+    range_end = zone_day(invitee_zone, last_date).end
+    zones = {host_id: schedule_zone_name(schedule) for host_id, schedule in schedules.items()}
+    host_dates = [schedule_dates(range_start, range_end, zone) for zone in zones.values()]
+
+    # Override dates are stored as UTC midnights
+    date_overrides = await prisma.dateoverride.find_many(
+        where={
+            "scheduleId": {"in": [schedule.id for schedule in schedules.values()]},
+            "specificDate": {
+                "gte": datetime.combine(min(d[0] for d in host_dates), datetime.min.time(), tzinfo=dt_timezone.utc),
+                "lt": datetime.combine(max(d[-1] for d in host_dates) + timedelta(days=1), datetime.min.time(), tzinfo=dt_timezone.utc)
+            }
+        }
+    )
+    overrides: Dict[str, Dict[date, list]] = {schedule.id: {} for schedule in schedules.values()}
+    for override in date_overrides:
+        overrides[override.scheduleId][override.specificDate.date()] = override.intervals if override.intervals else []
+
+    # Widen the window by the buffers and the duration so bookings just
+    # outside the range still block slots that start inside it
+    buffer_before = timedelta(minutes=event_type.bufferBeforeMinutes)
+    buffer_after = timedelta(minutes=event_type.bufferAfterMinutes)
+    duration = timedelta(minutes=event_type.durationMinutes)
+    busy_start = range_start - buffer_after
+    busy_end = range_end + duration + buffer_before
+
+    # Group event types need each booking's slot, which the index does not keep
+    group_slots = event_type.capacity > 1
+
+    bookings_by_host: Dict[str, List[Interval]] = {host_id: [] for host_id in schedules}
+    single_host = next(iter(schedules)) if len(schedules) == 1 else None
+    index = await booking_index.get(single_host) if single_host and not group_slots and not exclude else None
+    excluded_ids = {booking.id for booking in exclude}
+    if index is not None and index.covers(busy_start):
+        # Serve a single host from its interval index when it covers the range
+        bookings_by_host[single_host] = index.intervals(busy_start, busy_end)
+    else:
+        # Every host's bookings in one query
+        for booking in await prisma.booking.find_many(
+            where={
+                "hostId": {"in": list(schedules)},
+                "status": "CONFIRMED",
+                "startTime": {"lt": busy_end},
+                "endTime": {"gt": busy_start}
+            }
+        ):
+            # Seats of this group event type leave their own slot open (see open_seat_slots)
+            if group_slots and booking.slotId and booking.eventTypeId == event_type.id:
+                continue
+            if booking.id in excluded_ids:
+                continue
+            bookings_by_host[booking.hostId].append((booking.startTime, booking.endTime))
+
+    # Held slots are busy like bookings
+    for host_id, intervals in bookings_by_host.items():
+        intervals.extend(slot_holds.intervals(host_id, busy_start, busy_end))
+    
+    # Daily/weekly booking caps of the hosts and the event type (their counters in one query)
+    caps = await load_caps(list(schedules), [event_type], zones)
+    usage = await load_usage(caps, event_type.id, list(schedules), range_start, range_end)
+    if usage is not None:
+        for key, count in caps.cancelled_keys(exclude).items():
+            usage.counts[key] = usage.counts.get(key, 0) - count
+    
+    seats = await load_seats(event_type.id, busy_start - duration, busy_end) if group_slots else None
+    if seats:
+        for booking in exclude:
+            seat = seats.get(booking.startTime) if booking.slotId else None
+            if seat is not None:
+                seats[booking.startTime] = (seat[0], seat[1] - 1)
+
+    hosts = []
+    for host_id, schedule in schedules.items():
+        hosts.append(HostAvailability(
+            weekly_hours={
+                wh.dayOfWeek: wh.intervals
+                for wh in (schedule.weeklyHours or [])
+                if wh.isEnabled and wh.intervals
+            },
+            overrides=overrides[schedule.id],
+            # Merge buffered bookings into busy intervals once for the whole range
+            busy=merge_busy_intervals(
+                bookings_by_host[host_id],
+                buffer_before=buffer_before,
+                buffer_after=buffer_after
+            ),
+            schedule_zone=zones[host_id]
+        ))
+
+    return SlotContext(
+        schedule=owner_schedule,
+        scheduling_type=get_scheduling_type_str(event_type.schedulingType),
+        invitee_zone=invitee_zone,
+        host_ids=list(schedules),
+        hosts=hosts,
+        seats=seats,
+        caps=usage
+    )
+
+
+def free_slots_for_dates(
+    event_type,
+    context: SlotContext,
+    dates: List[date],
+    earliest: datetime,
+    limit: Optional[int] = None
+) -> List[List[Interval]]:
+    """
+    Compute the free slots of each (consecutive) invitee date from a loaded context.
+
+    Collective event types intersect all hosts with the sweep-line engine;
+    round-robin pools offer the union of their hosts' slots. Slots on days
+    a host or the event type has reached its booking cap are left out.
+    """
+    if context.scheduling_type == "collective":
+        days = slot_sweep.find_collective_slots_by_day(
+            dates,
+            context.hosts,
+            timedelta(minutes=event_type.durationMinutes),
+            slot_step(event_type.durationMinutes),
+            context.invitee_zone,
+            earliest=earliest,
+            limit=limit if context.caps is None else None
+        )
+        if context.caps is None:
+            return days
+        return [context.caps.open_slots(context.host_ids, day_slots)[:limit] for day_slots in days]
+
+    # Full group slots drop out after slot generation, so their limit is applied afterwards
+    per_host = free_slots_by_host(event_type, context, dates, earliest, limit if context.seats is None else None)
+    if context.scheduling_type == "round_robin":
+        return union_slots_by_day(per_host, limit)
+    if context.seats is not None:
+        return [
+            open_seat_slots(
+                day_slots,
+                context.seats,
+                event_type.capacity,
+                buffer_before=timedelta(minutes=event_type.bufferBeforeMinutes),
+                buffer_after=timedelta(minutes=event_type.bufferAfterMinutes)
+            )[:limit]
+            for day_slots in per_host[0]
+        ]
+    return per_host[0]
+
+
+def free_slots_by_host(
+    event_type,
+    context: SlotContext,
+    dates: List[date],
+    earliest: datetime,
+    limit: Optional[int] = None
+) -> List[List[List[Interval]]]:
+    """
+    Each host's own free slots per invitee date, in `context.host_ids` order.
+
+    Uses the engine selected by `settings.slot_engine`: the sweep-line
+    engine ("python") or the NumPy minute bitmap ("bitmap"). Days a host
+    has reached a booking cap on are left empty.
+    """
+    engine = slot_bitmap if settings.slot_engine == "bitmap" else slot_sweep
+    per_host = [
+        engine.find_free_slots_by_day(
+            dates,
+            host.weekly_hours,
+            host.overrides,
+            host.busy,
+            duration=timedelta(minutes=event_type.durationMinutes),
+            step=slot_step(event_type.durationMinutes),
+            earliest=earliest,
+            # Capped days drop out after slot generation, so their limit is applied afterwards
+            limit=limit if context.caps is None else None,
+            schedule_zone=host.schedule_zone,
+            invitee_zone=context.invitee_zone
+        )
+        for host in context.hosts
+    ]
+    if context.caps is None:
+        return per_host
+    return [
+        [context.caps.open_slots([host_id], day_slots)[:limit] for day_slots in host_days]
+        for host_id, host_days in zip(context.host_ids, per_host)
+    ]
+
+
+def uses_postgres_engine(event_type) -> bool:
+    """Whether the event type's slots are computed in the database (SLOT_ENGINE=postgres, individual event types with one seat)."""
+    return (
+        settings.slot_engine == "postgres"
+        and get_scheduling_type_str(event_type.schedulingType) == "individual"
+        and event_type.capacity == 1
+    )
+
+
+async def free_slots_in_database(
+    event_type,
+    schedules: Dict[str, Any],
+    dates: List[date],
+    earliest: datetime,
+    invitee_zone: str
+) -> List[List[Interval]]:
+    """
+    Free slots of an individual event type per invitee date, from the Postgres engine.
+
+    The host's held slots are passed in and booking caps are applied
+    afterwards, so the slots match what free_slots_for_dates returns.
+    """
+    host_id, schedule = next(iter(schedules.items()))
+    schedule_zone = schedule_zone_name(schedule)
+    range_start = zone_day(invitee_zone, dates[0]).start
+    range_end = zone_day(invitee_zone, dates[-1]).end
+    buffer_before = timedelta(minutes=event_type.bufferBeforeMinutes)
+    buffer_after = timedelta(minutes=event_type.bufferAfterMinutes)
+    duration = timedelta(minutes=event_type.durationMinutes)
+    
+    days = await slot_postgres.find_free_slots_by_day(
+        prisma,
+        host_id,
+        schedule.id,
+        dates,
+        duration,
+        slot_step(event_type.durationMinutes),
+        buffer_before,
+        buffer_after,
+        earliest,
+        held=slot_holds.intervals(host_id, range_start - buffer_after, range_end + duration + buffer_before),
+        schedule_zone=schedule_zone,
+        invitee_zone=invitee_zone
+    )
+    
+    caps = await load_usage(
+        await load_caps([host_id], [event_type], {host_id: schedule_zone}),
+        event_type.id,
+        [host_id],
+        range_start,
+        range_end
+    )
+    if caps is None:
+        return days
+    return [caps.open_slots([host_id], day_slots) for day_slots in days]
+
+
+async def eligible_round_robin_hosts(
+    event_type,
+    host_ids: List[str],
+    start_time: datetime,
+    end_time: datetime,
+    timezone: str
+) -> List[str]:
+    """Hosts of a round-robin pool that offer exactly this slot (schedule, buffers and notice included)."""
+    schedules = await load_host_schedules(event_type, host_ids)
+    if not schedules:
+        return []
+
+    slot_date = start_time.astimezone(get_zone(timezone)).date()
+    context = await load_slot_context(event_type, schedules, slot_date, slot_date, timezone)
+    earliest = datetime.now(dt_timezone.utc) + timedelta(hours=event_type.minNoticeHours)
+    per_host = free_slots_by_host(event_type, context, [slot_date], earliest)
+
+    return [
+        host_id
+        for host_id, host_days in zip(context.host_ids, per_host)
+        if (start_time, end_time) in host_days[0]
+    ]
+
+
+async def slot_offered(
+    event_type,
+    host_ids: List[str],
+    start_time: datetime,
+    end_time: datetime,
+    timezone: str,
+    exclude: Sequence = ()
+) -> bool:
+    """
+    Whether an individual or collective event type offers exactly this slot right now.
+
+    `exclude` are booking rows being moved, which do not block the slot.
+    """
+    schedules = await load_host_schedules(event_type, host_ids)
+    if not schedules:
+        return False
+
+    slot_date = start_time.astimezone(get_zone(timezone)).date()
+    context = await load_slot_context(event_type, schedules, slot_date, slot_date, timezone, exclude)
+    earliest = datetime.now(dt_timezone.utc) + timedelta(hours=event_type.minNoticeHours)
+    return (start_time, end_time) in free_slots_for_dates(event_type, context, [slot_date], earliest)[0]
+
+
+def slot_start_utc(start_time: datetime, timezone: str) -> datetime:
+    """A requested start time in UTC; one without an offset is wall-clock time in `timezone`."""
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=get_zone(timezone))
+    return start_time.astimezone(dt_timezone.utc)
+
+
+def to_time_slots(
+    free_slots: List[Interval],
+    zone_name: str,
+    day: date,
+    seats: Optional[Seats] = None,
+    capacity: int = 1
+) -> List[TimeSlot]:
+    """Format free slot intervals of an invitee date as wall-clock times in their zone (with seats left for group event types)."""
+    return [
+        TimeSlot(
+            start_time=utc_to_local(start, zone_name, day).strftime("%H:%M"),
+            end_time=utc_to_local(end, zone_name, day).strftime("%H:%M"),
+            remaining_seats=remaining_seats(start, seats, capacity) if seats is not None else None
+        )
+        for start, end in free_slots
+    ]
+
+
+def date_windows(
+    first_date: date,
+    last_date: date,
+    size: int = NEXT_AVAILABLE_FIRST_WINDOW_DAYS
+) -> Iterator[Tuple[date, date]]:
+    """Consecutive (first, last) date windows covering the range, each twice as long as the last (up to MAX_SLOT_RANGE_DAYS)."""
+    while first_date <= last_date:
+        window_end = min(first_date + timedelta(days=size - 1), last_date)
+        yield first_date, window_end
+        first_date = window_end + timedelta(days=1)
+        size = min(size * 2, MAX_SLOT_RANGE_DAYS)
+
+
+async def iter_first_slots(
+    event_type,
+    schedules: Dict[str, Any],
+    first_date: date,
+    last_date: date,
+    earliest: datetime,
+    timezone: Optional[str] = None
+) -> AsyncIterator[Tuple[date, Optional[Interval], SlotContext]]:
+    """
+    Yield (invitee date, its first free slot or None, context) day by day.
+
+    Availability is loaded one growing window of dates at a time (see
+    date_windows), so a caller that stops at the first free slot never
+    loads the later windows.
+    """
+    for window_start, window_end in date_windows(first_date, last_date):
+        context = await load_slot_context(event_type, schedules, window_start, window_end, timezone)
+        dates = [window_start + timedelta(days=offset) for offset in range((window_end - window_start).days + 1)]
+        for day, day_slots in zip(dates, free_slots_for_dates(event_type, context, dates, earliest, limit=1)):
+            yield day, (day_slots[0] if day_slots else None), context
+
+
+def parse_date_param(value: str) -> date:
+    """Parse a YYYY-MM-DD query parameter (years 2-9998)."""
+    try:
+        parsed = datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format")
+    # A day's bounds in UTC, and its year's timezone table, reach into the neighbouring years
+    if not 1 < parsed.year < 9999:
+        raise HTTPException(status_code=400, detail="Date out of range")
+    return parsed
+
+
 # ============ Public Endpoints ============
 # NOTE: The /public/{username}/{event_slug} route is defined at the END of this file
 #       because it's a catch-all that would match paths like /public/bookings/{id}
@@ -45,67 +568,74 @@ def get_status_str(status) -> str:
 @router.get("/public/available-dates", response_model=AvailableDatesResponse)
 async def get_available_dates(
     event_type_id: str = Query(...),
-    month: str = Query(..., pattern=r"^\d{4}-\d{2}$", description="Month in YYYY-MM format")
+    month: str = Query(..., pattern=r"^\d{4}-\d{2}$", description="Month in YYYY-MM format"),
+    timezone: Optional[str] = Query(None)
 ):
-    """Get available dates for a month (for calendar view)."""
+    """Get available dates for a month (for calendar view), as dates in `timezone`."""
     # Get event type
-    event_type = await prisma.eventtype.find_unique(where={"id": event_type_id})
+    event_type = await prisma.eventtype.find_unique(
+        where={"id": event_type_id},
+        include={"hosts": True}
+    )
     if not event_type:
         raise HTTPException(status_code=404, detail="Event type not found")
     
     if not event_type.isActive:
         raise HTTPException(status_code=400, detail="Event type is not active")
     
+    validate_timezone_param(timezone)
+    
     # Parse month
     try:
         year, month_num = map(int, month.split("-"))
+        _, days_in_month = monthrange(year, month_num)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid month format")
     
-    # Get user's availability schedule
-    schedule = await prisma.availabilityschedule.find_first(
-        where={"userId": event_type.userId, "isDefault": True}
-    )
+    # Serve repeat visitors from the availability cache; dropping expired holds
+    # first invalidates their hosts, so no cached response hides a released slot
+    slot_holds.expire()
+    host_ids = get_team_host_ids(event_type)
+    cache_hosts = availability_cache_hosts(host_ids)
+    cache_key = ("dates", event_type.id, month, timezone)
+    cache_version = availability_cache.host_version(cache_hosts)
+    cached = availability_cache.get(cache_hosts, cache_key)
+    if cached is not None:
+        return cached
     
-    if not schedule:
+    schedules = await load_host_schedules(event_type, host_ids)
+    if not schedules:
         return AvailableDatesResponse(year=year, month=month_num, dates=[])
-    
-    # Get weekly hours
-    weekly_hours_list = await prisma.weeklyhours.find_many(
-        where={"scheduleId": schedule.id}
-    )
-    
-    # Create a lookup for enabled days
-    enabled_days = {}
-    for wh in weekly_hours_list:
-        if wh.isEnabled and wh.intervals:
-            enabled_days[wh.dayOfWeek] = wh.intervals
+    zone = get_zone(timezone or schedule_zone_name(next(iter(schedules.values()))))
     
     # Calculate min/max booking dates (use timezone-aware datetime)
     now = datetime.now(dt_timezone.utc)
-    min_date = now + timedelta(hours=event_type.minNoticeHours)
-    max_date = now + timedelta(days=event_type.maxDaysAhead)
+    earliest = now + timedelta(hours=event_type.minNoticeHours)
+    latest = now + timedelta(days=event_type.maxDaysAhead)
     
-    # Get all dates in the month
-    _, days_in_month = monthrange(year, month_num)
-    available_dates = []
+    # Only the part of the month inside the booking window needs checking
+    first_date = max(date(year, month_num, 1), earliest.astimezone(zone).date())
+    last_date = min(date(year, month_num, days_in_month), latest.astimezone(zone).date())
     
-    for day in range(1, days_in_month + 1):
-        check_date = date(year, month_num, day)
-        check_datetime = datetime.combine(check_date, datetime.min.time())
-        
-        # Check if date is within booking window
-        if check_datetime.date() < min_date.date() or check_datetime.date() > max_date.date():
-            continue
-        
-        # Check if day of week is enabled (Python: Monday=0, Schema: Sunday=0)
-        python_dow = check_date.weekday()
-        schema_dow = (python_dow + 1) % 7
-        
-        if schema_dow in enabled_days:
-            available_dates.append(check_date.strftime("%Y-%m-%d"))
+    if first_date > last_date:
+        return AvailableDatesResponse(year=year, month=month_num, dates=[])
     
-    return AvailableDatesResponse(year=year, month=month_num, dates=available_dates)
+    # Overrides and bookings for the whole month in one query each
+    context = await load_slot_context(event_type, schedules, first_date, last_date, timezone)
+    
+    # A date is available when it has at least one free slot
+    dates = [first_date + timedelta(days=offset) for offset in range((last_date - first_date).days + 1)]
+    free_slots = free_slots_for_dates(event_type, context, dates, earliest, limit=1)
+    available_dates = [
+        d.strftime("%Y-%m-%d") for d, day_slots in zip(dates, free_slots) if day_slots
+    ]
+    
+    response = AvailableDatesResponse(year=year, month=month_num, dates=available_dates)
+    availability_cache.put(
+        cache_hosts, cache_key, response,
+        size=len(response.model_dump_json()), version=cache_version
+    )
+    return response
 
 
 @router.get("/public/bookings/{booking_id}", response_model=BookingResponse)
@@ -152,6 +682,10 @@ async def get_booking_confirmation(booking_id: str):
             buffer_after_minutes=et.bufferAfterMinutes,
             min_notice_hours=et.minNoticeHours,
             max_days_ahead=et.maxDaysAhead,
+            scheduling_type=get_scheduling_type_str(et.schedulingType),
+            capacity=et.capacity,
+            max_bookings_per_day=et.maxBookingsPerDay,
+            max_bookings_per_week=et.maxBookingsPerWeek,
             is_active=et.isActive,
             created_at=et.createdAt,
             updated_at=et.updatedAt
@@ -168,162 +702,392 @@ async def get_available_slots(
 ):
     """Get available time slots for a specific date."""
     # Get event type
-    event_type = await prisma.eventtype.find_unique(where={"id": event_type_id})
+    event_type = await prisma.eventtype.find_unique(
+        where={"id": event_type_id},
+        include={"hosts": True}
+    )
     if not event_type:
         raise HTTPException(status_code=404, detail="Event type not found")
     
-    # Parse date
-    try:
-        slot_date = datetime.strptime(date, "%Y-%m-%d").date()
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid date format")
+    slot_date = parse_date_param(date)
+    validate_timezone_param(timezone)
     
-    # Get user's availability schedule
-    schedule = await prisma.availabilityschedule.find_first(
-        where={"userId": event_type.userId, "isDefault": True}
-    )
+    # Serve repeat visitors from the availability cache; dropping expired holds
+    # first invalidates their hosts, so no cached response hides a released slot
+    slot_holds.expire()
+    host_ids = get_team_host_ids(event_type)
+    cache_hosts = availability_cache_hosts(host_ids)
+    cache_key = ("slots", event_type.id, date, timezone)
+    cache_version = availability_cache.host_version(cache_hosts)
+    cached = availability_cache.get(cache_hosts, cache_key)
+    if cached is not None:
+        return cached
     
-    if not schedule:
+    schedules = await load_host_schedules(event_type, host_ids)
+    if not schedules:
         return AvailableSlotsResponse(date=date, timezone=timezone or "UTC", slots=[])
     
-    # Check for date override first (takes priority over weekly hours)
-    date_override = await prisma.dateoverride.find_first(
-        where={"scheduleId": schedule.id, "specificDate": slot_date}
-    )
+    # Minimum notice (use timezone-aware datetime)
+    earliest = datetime.now(dt_timezone.utc) + timedelta(hours=event_type.minNoticeHours)
     
-    if date_override:
-        # Use date override intervals (empty = unavailable)
-        intervals = date_override.intervals if date_override.intervals else []
-        if not intervals:
-            return AvailableSlotsResponse(date=date, timezone=timezone or schedule.timezone, slots=[])
+    if uses_postgres_engine(event_type):
+        # Computed in the database: no schedule or bookings are loaded here
+        invitee_zone = timezone or schedule_zone_name(next(iter(schedules.values())))
+        free_slots = (await free_slots_in_database(event_type, schedules, [slot_date], earliest, invitee_zone))[0]
+        seats = None
     else:
-        # Get weekly hours for the day of week (Python Monday=0, Schema Sunday=0)
-        python_dow = slot_date.weekday()  # Monday=0
-        # Convert: Python Monday(0) -> Schema Monday(1), Python Sunday(6) -> Schema Sunday(0)
-        schema_dow = (python_dow + 1) % 7
-        
-        weekly_hours = await prisma.weeklyhours.find_first(
-            where={"scheduleId": schedule.id, "dayOfWeek": schema_dow}
-        )
-        
-        if not weekly_hours or not weekly_hours.isEnabled:
-            return AvailableSlotsResponse(date=date, timezone=timezone or schedule.timezone, slots=[])
-        
-        intervals = weekly_hours.intervals if weekly_hours.intervals else []
+        context = await load_slot_context(event_type, schedules, slot_date, slot_date, timezone)
+        invitee_zone = context.invitee_zone
+        free_slots = free_slots_for_dates(event_type, context, [slot_date], earliest)[0]
+        seats = context.seats
     
-    # Get existing bookings for this date
-    start_of_day = datetime.combine(slot_date, datetime.min.time())
-    end_of_day = datetime.combine(slot_date, datetime.max.time())
+    response = AvailableSlotsResponse(
+        date=date,
+        timezone=invitee_zone,
+        slots=to_time_slots(free_slots, invitee_zone, slot_date, seats, event_type.capacity)
+    )
     
-    existing_bookings = await prisma.booking.find_many(
-        where={
-            "hostId": event_type.userId,
-            "status": "CONFIRMED",
-            "startTime": {"gte": start_of_day, "lte": end_of_day}
-        }
+    availability_cache.put(
+        cache_hosts, cache_key, response,
+        size=len(response.model_dump_json()), version=cache_version
+    )
+    return response
+
+
+@router.get("/public/slots/range", response_model=AvailableSlotsRangeResponse)
+async def get_available_slots_range(
+    event_type_id: str = Query(...),
+    from_date: str = Query(..., alias="from", pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    to_date: str = Query(..., alias="to", pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    timezone: Optional[str] = Query(None)
+):
+    """Get available time slots for every date in a range (e.g. a week view)."""
+    # Get event type
+    event_type = await prisma.eventtype.find_unique(
+        where={"id": event_type_id},
+        include={"hosts": True}
     )
+    if not event_type:
+        raise HTTPException(status_code=404, detail="Event type not found")
     
-    # Generate slots
-    slots = []
-    duration = timedelta(minutes=event_type.durationMinutes)
-    buffer_before = timedelta(minutes=event_type.bufferBeforeMinutes)
-    buffer_after = timedelta(minutes=event_type.bufferAfterMinutes)
+    first_date = parse_date_param(from_date)
+    last_date = parse_date_param(to_date)
     
-    for interval in intervals:
-        start_time_str = interval.get("start_time", "09:00")
-        end_time_str = interval.get("end_time", "17:00")
-        
-        start_hour, start_min = map(int, start_time_str.split(":"))
-        end_hour, end_min = map(int, end_time_str.split(":"))
-        
-        current = datetime.combine(slot_date, datetime.min.time().replace(hour=start_hour, minute=start_min, tzinfo=dt_timezone.utc))
-        interval_end = datetime.combine(slot_date, datetime.min.time().replace(hour=end_hour, minute=end_min, tzinfo=dt_timezone.utc))
-        
-        while current + duration <= interval_end:
-            slot_end = current + duration
-            
-            # Check if slot overlaps with existing booking (including buffer times)
-            is_available = True
-            for booking in existing_bookings:
-                # Account for buffer times around existing bookings
-                booking_start_with_buffer = booking.startTime - buffer_before
-                booking_end_with_buffer = booking.endTime + buffer_after
-                if not (slot_end <= booking_start_with_buffer or current >= booking_end_with_buffer):
-                    is_available = False
-                    break
-            
-            # Check minimum notice (use timezone-aware datetime)
-            now = datetime.now(dt_timezone.utc)
-            min_notice = timedelta(hours=event_type.minNoticeHours)
-            if current < now + min_notice:
-                is_available = False
-            
-            if is_available:
-                slots.append(TimeSlot(
-                    start_time=current.strftime("%H:%M"),
-                    end_time=slot_end.strftime("%H:%M")
-                ))
-            
-            # Move to next slot
-            increment = min(30, event_type.durationMinutes)
-            current += timedelta(minutes=increment)
+    if last_date < first_date:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
     
-    return AvailableSlotsResponse(
-        date=date,
-        timezone=timezone or schedule.timezone,
-        slots=slots
+    validate_timezone_param(timezone)
+    
+    day_count = (last_date - first_date).days + 1
+    if day_count > MAX_SLOT_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range cannot exceed {MAX_SLOT_RANGE_DAYS} days"
+        )
+    
+    dates = [first_date + timedelta(days=offset) for offset in range(day_count)]
+    
+    schedules = await load_host_schedules(event_type, get_team_host_ids(event_type))
+    if not schedules:
+        response_timezone = timezone or "UTC"
+        return AvailableSlotsRangeResponse(
+            timezone=response_timezone,
+            days=[
+                AvailableSlotsResponse(date=d.strftime("%Y-%m-%d"), timezone=response_timezone, slots=[])
+                for d in dates
+            ]
+        )
+    
+    context = await load_slot_context(event_type, schedules, first_date, last_date, timezone)
+    response_timezone = context.invitee_zone
+    earliest = datetime.now(dt_timezone.utc) + timedelta(hours=event_type.minNoticeHours)
+    free_slots = free_slots_for_dates(event_type, context, dates, earliest)
+    
+    return AvailableSlotsRangeResponse(
+        timezone=response_timezone,
+        days=[
+            AvailableSlotsResponse(
+                date=d.strftime("%Y-%m-%d"),
+                timezone=response_timezone,
+                slots=to_time_slots(day_slots, response_timezone, d, context.seats, event_type.capacity)
+            )
+            for d, day_slots in zip(dates, free_slots)
+        ]
     )
 
 
-@router.post("/public/bookings", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
-async def create_booking(booking_data: BookingCreate):
-    """Create a new booking."""
+@router.get("/public/next-available", response_model=NextAvailableResponse)
+async def get_next_available_slot(
+    event_type_id: str = Query(...),
+    timezone: Optional[str] = Query(None)
+):
+    """Get the earliest free slot in the booking window (e.g. "Next available: Tue 10:30")."""
     # Get event type
-    event_type = await prisma.eventtype.find_unique(where={"id": booking_data.event_type_id})
+    event_type = await prisma.eventtype.find_unique(
+        where={"id": event_type_id},
+        include={"hosts": True}
+    )
     if not event_type:
         raise HTTPException(status_code=404, detail="Event type not found")
     
     if not event_type.isActive:
         raise HTTPException(status_code=400, detail="Event type is not active")
     
-    # Calculate end time
-    end_time = booking_data.start_time + timedelta(minutes=event_type.durationMinutes)
+    validate_timezone_param(timezone)
     
-    # Check for conflicts
-    conflict = await prisma.booking.find_first(
-        where={
-            "hostId": event_type.userId,
-            "status": "CONFIRMED",
-            "startTime": {"lt": end_time},
-            "endTime": {"gt": booking_data.start_time}
-        }
+    # Serve repeat visitors from the availability cache; dropping expired holds
+    # first invalidates their hosts, so no cached response hides a released slot
+    slot_holds.expire()
+    host_ids = get_team_host_ids(event_type)
+    cache_hosts = availability_cache_hosts(host_ids)
+    cache_key = ("next", event_type.id, timezone)
+    cache_version = availability_cache.host_version(cache_hosts)
+    cached = availability_cache.get(cache_hosts, cache_key)
+    if cached is not None:
+        return cached
+    
+    schedules = await load_host_schedules(event_type, host_ids)
+    if not schedules:
+        return NextAvailableResponse(timezone=timezone or "UTC")
+    zone_name = timezone or schedule_zone_name(next(iter(schedules.values())))
+    
+    # Booking window as invitee dates
+    now = datetime.now(dt_timezone.utc)
+    earliest = now + timedelta(hours=event_type.minNoticeHours)
+    latest = now + timedelta(days=event_type.maxDaysAhead)
+    first_date = earliest.astimezone(get_zone(zone_name)).date()
+    last_date = latest.astimezone(get_zone(zone_name)).date()
+    
+    # Walk the days lazily and stop at the first free slot
+    response = NextAvailableResponse(timezone=zone_name)
+    async for day, slot, context in iter_first_slots(event_type, schedules, first_date, last_date, earliest, timezone):
+        if slot is not None:
+            response = NextAvailableResponse(
+                timezone=zone_name,
+                date=day.strftime("%Y-%m-%d"),
+                start_time=slot[0],
+                slot=to_time_slots([slot], zone_name, day, context.seats, event_type.capacity)[0]
+            )
+            break
+    
+    availability_cache.put(
+        cache_hosts, cache_key, response,
+        size=len(response.model_dump_json()), version=cache_version
+    )
+    return response
+
+
+@router.post("/public/slots/hold", response_model=SlotHoldResponse, status_code=status.HTTP_201_CREATED)
+async def hold_slot(hold_data: SlotHoldCreate):
+    """Hold a slot for a few minutes while the invitee fills in the booking form."""
+    # Get event type
+    event_type = await prisma.eventtype.find_unique(
+        where={"id": hold_data.event_type_id},
+        include={"hosts": True}
     )
+    if not event_type:
+        raise HTTPException(status_code=404, detail="Event type not found")
+    
+    if not event_type.isActive:
+        raise HTTPException(status_code=400, detail="Event type is not active")
     
-    if conflict:
+    validate_timezone_param(hold_data.timezone)
+    
+    if slot_holds.is_full():
+        raise HTTPException(status_code=503, detail="Too many slots are held right now, please try again")
+    
+    start_time = slot_start_utc(hold_data.start_time, hold_data.timezone)
+    end_time = start_time + timedelta(minutes=event_type.durationMinutes)
+    host_ids = get_team_host_ids(event_type)
+    
+    # Only a slot that is offered right now (not booked or held) can be held
+    if get_scheduling_type_str(event_type.schedulingType) == "round_robin":
+        # Hold the host the booking would go to, leaving the slot open with the others
+        eligible = await eligible_round_robin_hosts(event_type, host_ids, start_time, end_time, hold_data.timezone)
+        pool = await host_load_balancer.get_pool(event_type.id, host_ids)
+        chosen = pool.peek(eligible)
+        held_hosts = [chosen] if chosen is not None else []
+    elif await slot_offered(event_type, host_ids, start_time, end_time, hold_data.timezone):
+        held_hosts = host_ids
+    else:
+        held_hosts = []
+    
+    hold = slot_holds.place(
+        event_type.id,
+        held_hosts,
+        start_time,
+        end_time,
+        buffer_before=timedelta(minutes=event_type.bufferBeforeMinutes),
+        buffer_after=timedelta(minutes=event_type.bufferAfterMinutes)
+    ) if held_hosts else None
+    if hold is None:
         raise HTTPException(status_code=409, detail="Time slot is no longer available")
     
-    # Create booking (wrapped in try-except for race condition handling)
+    return SlotHoldResponse(
+        token=hold.token,
+        event_type_id=hold.event_type_id,
+        start_time=hold.start,
+        end_time=hold.end,
+        expires_at=hold.expires_at
+    )
+
+
+@router.post("/public/bookings", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
+async def create_booking(
+    booking_data: BookingCreate,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255)
+):
+    """Create a new booking. Retries with the same `Idempotency-Key` get the first response back."""
+    if not idempotency_key:
+        return await book_slot(booking_data)
+    
     try:
-        booking = await prisma.booking.create(
-            data={
-                "eventTypeId": event_type.id,
-                "hostId": event_type.userId,
-                "startTime": booking_data.start_time,
-                "endTime": end_time,
-                "inviteeTimezone": booking_data.timezone,
-                "inviteeName": booking_data.invitee.name,
-                "inviteeEmail": booking_data.invitee.email,
-                "guests": Json(booking_data.guests),
-                "status": "CONFIRMED"
-            }
+        booking, replayed = await idempotency_store.run(
+            "POST /public/bookings",
+            idempotency_key,
+            booking_data.model_dump_json(),
+            lambda: book_slot(booking_data)
+        )
+    except IdempotencyKeyReused:
+        raise HTTPException(
+            status_code=422,
+            detail="Idempotency-Key was already used for a different booking request"
         )
+    
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return booking
+
+
+async def book_slot(booking_data: BookingCreate) -> BookingResponse:
+    """Book a slot (hold token, round-robin assignment and team bookings included)."""
+    # Get event type
+    event_type = await prisma.eventtype.find_unique(
+        where={"id": booking_data.event_type_id},
+        include={"hosts": True}
+    )
+    if not event_type:
+        raise HTTPException(status_code=404, detail="Event type not found")
+    
+    if not event_type.isActive:
+        raise HTTPException(status_code=400, detail="Event type is not active")
+    
+    validate_timezone_param(booking_data.timezone)
+    
+    # A start time without an offset is wall-clock time in the invitee's timezone
+    start_time = slot_start_utc(booking_data.start_time, booking_data.timezone)
+    
+    # Calculate end time
+    end_time = start_time + timedelta(minutes=event_type.durationMinutes)
+    
+    # Every host of a collective event type attends
+    host_ids = get_team_host_ids(event_type)
+    
+    # A hold token (from POST /public/slots/hold) books the held slot and hosts;
+    # an expired or unknown token books like no token at all
+    hold = slot_holds.get(booking_data.hold_token) if booking_data.hold_token else None
+    if hold is not None and (hold.event_type_id != event_type.id or hold.start != start_time):
+        raise HTTPException(status_code=400, detail="Hold token does not match this slot")
+    
+    # Round robin: the held host, or the least-loaded host that is free for this slot
+    pool = None
+    if get_scheduling_type_str(event_type.schedulingType) == "round_robin" and hold is not None:
+        host_ids = list(hold.host_ids)
+        pool = await host_load_balancer.get_pool(event_type.id, get_team_host_ids(event_type))
+        pool.adjust(host_ids[0], 1)
+    elif get_scheduling_type_str(event_type.schedulingType) == "round_robin":
+        # Held hosts are busy in the slot context, so they are not eligible
+        eligible = await eligible_round_robin_hosts(event_type, host_ids, start_time, end_time, booking_data.timezone)
+        pool = await host_load_balancer.get_pool(event_type.id, host_ids)
+        chosen = pool.choose(eligible)
+        if chosen is None:
+            raise HTTPException(status_code=409, detail="Time slot is no longer available")
+        host_ids = [chosen]
+    elif hold is None and slot_holds.conflicts(
+        host_ids,
+        start_time,
+        end_time,
+        buffer_before=timedelta(minutes=event_type.bufferBeforeMinutes),
+        buffer_after=timedelta(minutes=event_type.bufferAfterMinutes)
+    ):
+        raise HTTPException(status_code=409, detail="Time slot is temporarily held")
+    
+    booking_fields = {
+        "eventTypeId": event_type.id,
+        "startTime": start_time,
+        "endTime": end_time,
+        "inviteeTimezone": booking_data.timezone,
+        "inviteeName": booking_data.invitee.name,
+        "inviteeEmail": booking_data.invitee.email,
+        "guests": Json(booking_data.guests),
+        "status": "CONFIRMED"
+    }
+    
+    # Daily/weekly caps of the hosts and the event type this booking counts against
+    caps = (await load_caps(host_ids, [event_type])).for_booking(event_type.id, host_ids)
+    
+    # Create booking - the overlap constraint rejects conflicting slots atomically,
+    # so there is no separate conflict check to race against
+    group_slot = event_type.capacity > 1
+    coordinated = len(host_ids) == 1 and booking_coordinator.enabled and not group_slot and not caps
+    try:
+        if coordinated:
+            # Queued per host and committed in a batch with the host's other pending bookings
+            bookings = [
+                await booking_coordinator.submit(
+                    host_ids[0], start_time, end_time, {**booking_fields, "hostId": host_ids[0]}
+                )
+            ]
+        elif len(host_ids) == 1 and not group_slot and not caps:
+            bookings = [await prisma.booking.create(data={**booking_fields, "hostId": host_ids[0]})]
+        else:
+            # The seat, the cap counters and one row per host (linked by a group id) are
+            # written in one transaction; a full slot, a reached cap or an overlap undoes them all
+            row_fields = {"groupId": str(uuid4())} if len(host_ids) > 1 else {}
+            async with prisma.tx() as transaction:
+                if group_slot:
+                    slot_id = await take_seat(transaction, event_type.id, start_time, end_time, event_type.capacity)
+                    if slot_id is None:
+                        raise SlotUnavailable()
+                    row_fields["slotId"] = slot_id
+                if caps:
+                    await count_booking(transaction, caps, start_time)
+                bookings = [
+                    await transaction.booking.create(
+                        data={**booking_fields, **row_fields, "hostId": host_id}
+                    )
+                    for host_id in host_ids
+                ]
+    except SlotUnavailable:
+        if pool is not None:
+            pool.adjust(host_ids[0], -1)
+        raise HTTPException(status_code=409, detail="Time slot is no longer available")
+    except BookingCapReached:
+        if pool is not None:
+            pool.adjust(host_ids[0], -1)
+        raise HTTPException(status_code=409, detail="Booking limit reached for this day or week")
     except Exception as e:
-        # Handle potential race condition where another booking was created
-        # between our conflict check and create
-        if "unique constraint" in str(e).lower() or "conflict" in str(e).lower():
+        if pool is not None:
+            pool.adjust(host_ids[0], -1)
+        if is_booking_overlap(e):
+            for host_id in host_ids:
+                booking_index.booking_rejected(host_id, start_time, end_time)
             raise HTTPException(status_code=409, detail="Time slot is no longer available")
         raise
     
+    for host_booking in bookings:
+        # The coordinator indexes its bookings before committing the next batch
+        if not coordinated:
+            booking_index.add_booking(host_booking.hostId, host_booking.id, host_booking.startTime, host_booking.endTime)
+        availability_cache.invalidate_host(host_booking.hostId)
+    
+    if hold is not None:
+        slot_holds.release(hold.token)
+    
+    # The owner's (or assigned host's) row represents the booking
+    booking = bookings[0]
+    
     return BookingResponse(
         id=booking.id,
         event_type_id=booking.eventTypeId,
@@ -344,86 +1108,535 @@ async def create_booking(booking_data: BookingCreate):
 
 # ============ Host/Admin Endpoints ============
 
-@router.get("/meetings", response_model=BookingListResponse)
+def encode_meetings_cursor(status_filter: str, booking) -> str:
+    """Opaque cursor pointing just past `booking` in a /meetings listing."""
+    raw = f"{status_filter}|{booking.startTime.isoformat()}|{booking.id}"
+    return urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_meetings_cursor(cursor: str, status_filter: str) -> Tuple[datetime, str]:
+    """The (start time, id) a cursor points past; 400 if it is malformed or from another listing."""
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        cursor_filter, start_time, booking_id = raw.split("|", 2)
+        position = (datetime.fromisoformat(start_time), booking_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if cursor_filter != status_filter:
+        raise HTTPException(status_code=400, detail="Cursor belongs to a different status filter")
+    return position
+
+
+def keyset_after(start_time: datetime, booking_id: str, direction: str) -> dict:
+    """Filter for the bookings after (start_time, booking_id) in (startTime, id) order."""
+    op = "gt" if direction == "asc" else "lt"
+    return {
+        "OR": [
+            {"startTime": {op: start_time}},
+            {"startTime": start_time, "id": {op: booking_id}}
+        ]
+    }
+
+
+def meetings_filter(host_id: str, status_filter: str) -> Tuple[dict, str]:
+    """Where clause and (startTime, id) direction of a host's upcoming, past or all meetings."""
+    now = datetime.now(dt_timezone.utc)
+    if status_filter == "upcoming":
+        return {"hostId": host_id, "startTime": {"gt": now}, "status": "CONFIRMED"}, "asc"
+    if status_filter == "past":
+        return {"hostId": host_id, "startTime": {"lte": now}}, "desc"
+    return {"hostId": host_id}, "desc"
+
+
+async def iter_meeting_batches(where: dict, direction: str) -> AsyncIterator[list]:
+    """Bookings matching `where` in (startTime, id) order, one query per EXPORT_BATCH_SIZE rows."""
+    after: Optional[Tuple[datetime, str]] = None
+    while True:
+        batch = await prisma.booking.find_many(
+            where=where if after is None else {"AND": [where, keyset_after(after[0], after[1], direction)]},
+            order=[{"startTime": direction}, {"id": direction}],
+            take=EXPORT_BATCH_SIZE
+        )
+        if batch:
+            yield batch
+        if len(batch) < EXPORT_BATCH_SIZE:
+            return
+        after = (batch[-1].startTime, batch[-1].id)
+
+
+# Booking fields /meetings can return, read straight from a Prisma booking
+MEETING_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "id": lambda booking: booking.id,
+    "event_type_id": lambda booking: booking.eventTypeId,
+    "host_id": lambda booking: booking.hostId,
+    "start_time": lambda booking: booking.startTime,
+    "end_time": lambda booking: booking.endTime,
+    "invitee_timezone": lambda booking: booking.inviteeTimezone,
+    "invitee_name": lambda booking: booking.inviteeName,
+    "invitee_email": lambda booking: booking.inviteeEmail,
+    "guests": lambda booking: booking.guests if booking.guests else [],
+    "status": lambda booking: get_status_str(booking.status),
+    "cancelled_at": lambda booking: booking.cancelledAt,
+    "cancel_reason": lambda booking: booking.cancelReason,
+    "created_at": lambda booking: booking.createdAt,
+    "updated_at": lambda booking: booking.updatedAt,
+}
+
+
+def event_type_response(et) -> EventTypeResponse:
+    """The event type of a listed meeting."""
+    return EventTypeResponse(
+        id=et.id,
+        user_id=et.userId,
+        name=et.name,
+        slug=et.slug,
+        duration_minutes=et.durationMinutes,
+        color=et.color,
+        description=et.description,
+        location_type=get_location_type_str(et.locationType),
+        location_details=et.locationDetails,
+        buffer_before_minutes=et.bufferBeforeMinutes,
+        buffer_after_minutes=et.bufferAfterMinutes,
+        min_notice_hours=et.minNoticeHours,
+        max_days_ahead=et.maxDaysAhead,
+        scheduling_type=get_scheduling_type_str(et.schedulingType),
+        capacity=et.capacity,
+        max_bookings_per_day=et.maxBookingsPerDay,
+        max_bookings_per_week=et.maxBookingsPerWeek,
+        is_active=et.isActive,
+        created_at=et.createdAt,
+        updated_at=et.updatedAt
+    )
+
+
+
+def parse_meeting_fields(fields: Optional[str]) -> Tuple[List[str], Optional[List[str]]]:
+    """
+    Booking fields and event type fields (None: no event types) selected by `?fields=`.
+
+    Without `fields` everything is returned. `event_type` selects every
+    event type field, `event_type.<name>` single ones; `id` is always included.
+    """
+    if fields is None:
+        return list(MEETING_FIELDS), list(EventTypeResponse.model_fields)
+    
+    booking_fields = ["id"]
+    event_type_fields: Optional[List[str]] = None
+    for name in (part.strip() for part in fields.split(",")):
+        if not name:
+            continue
+        if name == "event_type":
+            event_type_fields = list(EventTypeResponse.model_fields)
+        elif name.startswith("event_type."):
+            field = name[len("event_type."):]
+            if field not in EventTypeResponse.model_fields:
+                raise HTTPException(status_code=400, detail=f"Unknown field: {name}")
+            event_type_fields = event_type_fields or ["id"]
+            if field not in event_type_fields:
+                event_type_fields.append(field)
+        elif name in MEETING_FIELDS:
+            if name not in booking_fields:
+                booking_fields.append(name)
+        else:
+            raise HTTPException(status_code=400, detail=f"Unknown field: {name}")
+    return booking_fields, event_type_fields
+
+
+@router.get("/meetings", response_model=Union[BookingListResponse, SparseBookingListResponse])
 async def list_meetings(
     status_filter: str = Query("upcoming", pattern="^(upcoming|past|all)$"),
-    page: int = Query(1, ge=1),
-    limit: int = Query(20, ge=1, le=100)
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    include_total: bool = Query(False, description="Also count all matching meetings"),
+    view: str = Query(
+        "embedded",
+        alias="event_types",
+        pattern="^(embedded|sideloaded)$",
+        description="sideloaded: each event type once, in an `event_types` map keyed by id"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return, e.g. id,start_time,invitee_name,event_type.name"
+    ),
+    page: int = Query(1, ge=1, description="Deprecated: offset pagination, use cursor")
 ):
-    """Get meetings for the current user."""
+    """
+    Get meetings for the current user, a page at a time.
+
+    Pages follow (startTime, id) from the `next_cursor` of the previous
+    page, so deep pages cost the same as the first one (the hostId +
+    startTime index is walked from the cursor). The legacy `page` parameter
+    still skips over earlier pages and returns the total.
+    
+    By default every booking embeds its full event type. With
+    `event_types=sideloaded` bookings carry only `event_type_id` and each
+    event type is returned once in `event_types`; `fields` trims both to
+    what the client renders.
+    """
     user = await ensure_default_user(prisma)
+    booking_fields, event_type_fields = parse_meeting_fields(fields)
+    if view == "sideloaded" and event_type_fields is not None and "event_type_id" not in booking_fields:
+        booking_fields.append("event_type_id")
     
-    now = datetime.now(dt_timezone.utc)
-    where_clause = {"hostId": user.id}
-    order_by = {}
+    where_clause, direction = meetings_filter(user.id, status_filter)
     
-    if status_filter == "upcoming":
-        where_clause["startTime"] = {"gt": now}
-        where_clause["status"] = "CONFIRMED"
-        order_by = {"startTime": "asc"}
-    elif status_filter == "past":
-        where_clause["startTime"] = {"lte": now}
-        order_by = {"startTime": "desc"}
-    else:
-        order_by = {"startTime": "desc"}
+    # Total count only on request (it scans every matching meeting)
+    legacy_page = page > 1 and cursor is None
+    total = await prisma.booking.count(where=where_clause) if include_total or legacy_page else None
     
-    # Get total count
-    total = await prisma.booking.count(where=where_clause)
+    if cursor is not None:
+        start_time, booking_id = decode_meetings_cursor(cursor, status_filter)
+        where_clause = {"AND": [where_clause, keyset_after(start_time, booking_id, direction)]}
     
-    # Get bookings with pagination
-    offset = (page - 1) * limit
+    # One extra row tells whether there is a next page
     bookings = await prisma.booking.find_many(
         where=where_clause,
-        order=order_by,
-        skip=offset,
-        take=limit,
-        include={"eventType": True}
+        order=[{"startTime": direction}, {"id": direction}],
+        skip=(page - 1) * limit if legacy_page else None,
+        take=limit + 1,
+        include={"eventType": True} if event_type_fields is not None else None
     )
+    next_cursor = None
+    if len(bookings) > limit:
+        bookings = bookings[:limit]
+        next_cursor = encode_meetings_cursor(status_filter, bookings[-1])
     
-    # Build response
-    booking_responses = []
-    for booking in bookings:
-        response = BookingResponse(
-            id=booking.id,
-            event_type_id=booking.eventTypeId,
-            host_id=booking.hostId,
-            start_time=booking.startTime,
-            end_time=booking.endTime,
-            invitee_timezone=booking.inviteeTimezone,
-            invitee_name=booking.inviteeName,
-            invitee_email=booking.inviteeEmail,
-            guests=booking.guests if booking.guests else [],
-            status=get_status_str(booking.status),
-            cancelled_at=booking.cancelledAt,
-            cancel_reason=booking.cancelReason,
-            created_at=booking.createdAt,
-            updated_at=booking.updatedAt
-        )
+    if view == "embedded" and fields is None:
+        # Full responses, each booking with its event type
+        booking_responses = []
+        for booking in bookings:
+            response = BookingResponse(
+                id=booking.id,
+                event_type_id=booking.eventTypeId,
+                host_id=booking.hostId,
+                start_time=booking.startTime,
+                end_time=booking.endTime,
+                invitee_timezone=booking.inviteeTimezone,
+                invitee_name=booking.inviteeName,
+                invitee_email=booking.inviteeEmail,
+                guests=booking.guests if booking.guests else [],
+                status=get_status_str(booking.status),
+                cancelled_at=booking.cancelledAt,
+                cancel_reason=booking.cancelReason,
+                created_at=booking.createdAt,
+                updated_at=booking.updatedAt
+            )
+            if booking.eventType:
+                response.event_type = event_type_response(booking.eventType)
+            booking_responses.append(response)
         
-        if booking.eventType:
+        return BookingListResponse(bookings=booking_responses, total=total, next_cursor=next_cursor)
+    
+    # Plain dicts: no models per booking, and each event type is built once
+    event_type_dicts: Dict[str, dict] = {}
+    if event_type_fields is not None:
+        for booking in bookings:
             et = booking.eventType
-            response.event_type = EventTypeResponse(
-                id=et.id,
-                user_id=et.userId,
-                name=et.name,
-                slug=et.slug,
-                duration_minutes=et.durationMinutes,
-                color=et.color,
-                description=et.description,
-                location_type=get_location_type_str(et.locationType),
-                location_details=et.locationDetails,
-                buffer_before_minutes=et.bufferBeforeMinutes,
-                buffer_after_minutes=et.bufferAfterMinutes,
-                min_notice_hours=et.minNoticeHours,
-                max_days_ahead=et.maxDaysAhead,
-                is_active=et.isActive,
-                created_at=et.createdAt,
-                updated_at=et.updatedAt
+            if et is not None and et.id not in event_type_dicts:
+                dumped = event_type_response(et).model_dump()
+                event_type_dicts[et.id] = {name: dumped[name] for name in event_type_fields}
+    
+    rows = []
+    for booking in bookings:
+        row = {name: MEETING_FIELDS[name](booking) for name in booking_fields}
+        if view == "embedded" and event_type_fields is not None:
+            row["event_type"] = event_type_dicts.get(booking.eventTypeId)
+        rows.append(row)
+    
+    return SparseBookingListResponse(
+        bookings=rows,
+        total=total,
+        next_cursor=next_cursor,
+        event_types=event_type_dicts if view == "sideloaded" and event_type_fields is not None else None
+    )
+
+
+def validate_import_row(row_number: int, fields: dict, event_types: Dict[str, Any]):
+    """An `ImportRow` (times in UTC) for a parsed row, or an `ImportReject` saying what is wrong."""
+    try:
+        item = BookingImportRow.model_validate(fields)
+    except ValidationError as e:
+        error = e.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        return ImportReject(row_number, f"{location}: {error['msg']}" if location else error["msg"])
+
+    event_type = event_types.get(item.event_type_id)
+    if event_type is None:
+        return ImportReject(row_number, "Unknown event type")
+    if not is_valid_timezone(item.invitee_timezone):
+        return ImportReject(row_number, "Invalid timezone")
+
+    # Times without an offset are wall-clock times in the invitee's timezone
+    start_time = slot_start_utc(item.start_time, item.invitee_timezone)
+    if item.end_time is not None:
+        end_time = slot_start_utc(item.end_time, item.invitee_timezone)
+    else:
+        end_time = start_time + timedelta(minutes=event_type.durationMinutes)
+    if end_time <= start_time:
+        return ImportReject(row_number, "end_time must be after start_time")
+
+    cancelled_at = None
+    if item.status == "cancelled":
+        cancelled_at = slot_start_utc(item.cancelled_at, "UTC") if item.cancelled_at else datetime.now(dt_timezone.utc)
+
+    return ImportRow(
+        row=row_number,
+        event_type_id=item.event_type_id,
+        start=start_time,
+        end=end_time,
+        invitee_name=item.invitee_name,
+        invitee_email=item.invitee_email,
+        invitee_timezone=item.invitee_timezone,
+        guests=list(item.guests),
+        cancelled_at=cancelled_at,
+        cancel_reason=item.cancel_reason if cancelled_at else None
+    )
+
+
+@router.get("/meetings/export")
+async def export_meetings(
+    file_format: str = Query("csv", alias="format", pattern="^(csv|ics)$"),
+    status_filter: str = Query("all", pattern="^(upcoming|past|all)$")
+):
+    """
+    Download the current user's meetings as CSV or an iCalendar file, oldest first.
+
+    The body is streamed while bookings are read in keyset-ordered batches
+    of EXPORT_BATCH_SIZE, so memory stays flat however many meetings the
+    host has. The CSV can be imported again with POST /meetings/import
+    (cancelled meetings stay cancelled); free-text cells a spreadsheet would
+    run as formulas start with `'`, which the import strips.
+    """
+    user = await ensure_default_user(prisma)
+    event_type_names = {
+        et.id: et.name
+        for et in await prisma.eventtype.find_many(where={"userId": user.id})
+    }
+    where_clause, _ = meetings_filter(user.id, status_filter)
+    
+    async def render() -> AsyncIterator[str]:
+        yield csv_header() if file_format == "csv" else ICS_HEADER
+        async for batch in iter_meeting_batches(where_clause, "asc"):
+            if file_format == "csv":
+                yield csv_lines(
+                    csv_row(booking, get_status_str(booking.status), event_type_names.get(booking.eventTypeId, ""))
+                    for booking in batch
+                )
+            else:
+                yield "".join(
+                    ics_event(booking, get_status_str(booking.status), event_type_names.get(booking.eventTypeId, "Meeting"))
+                    for booking in batch
+                )
+        if file_format == "ics":
+            yield ICS_FOOTER
+    
+    if file_format == "csv":
+        media_type, filename = "text/csv; charset=utf-8", "meetings.csv"
+    else:
+        media_type, filename = "text/calendar; charset=utf-8", "meetings.ics"
+    return StreamingResponse(
+        render(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+def encode_changes_token(reset_at: datetime, position: Optional[Tuple[datetime, str]]) -> str:
+    """Opaque sync token: the host's bookingsResetAt and the (updatedAt, id) of the last change sent."""
+    updated_at, booking_id = (position[0].isoformat(), position[1]) if position else ("", "")
+    raw = f"{reset_at.isoformat()}|{updated_at}|{booking_id}"
+    return urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_changes_token(token: str) -> Tuple[datetime, Optional[Tuple[datetime, str]]]:
+    """The reset stamp and last (updatedAt, id) of a sync token; 400 if it is malformed."""
+    try:
+        raw = urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        reset_at, updated_at, booking_id = raw.split("|", 2)
+        position = (datetime.fromisoformat(updated_at), booking_id) if updated_at else None
+        return datetime.fromisoformat(reset_at), position
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid sync token")
+
+
+@router.get("/meetings/changes", response_model=BookingChangesResponse)
+async def list_meeting_changes(
+    since: Optional[str] = Query(None, description="next_token of the previous sync; omit for a full sync"),
+    limit: int = Query(100, ge=1, le=500)
+):
+    """
+    Bookings of the current user created, updated or cancelled since the `since` token.
+
+    Changes come oldest first in (updatedAt, id) order, read from the
+    hostId + updatedAt index. Clients upsert them by id and pass
+    `next_token` back as `since` (right away while `has_more`). Without
+    `since` every booking is sent. Deleting an event type deletes its
+    bookings, which leaves no row to send, so it moves the host's
+    bookingsResetAt and tokens from before get `reset`: drop the local
+    copy, this response starts a full sync.
+    """
+    user = await ensure_default_user(prisma)
+    
+    position = None
+    reset = False
+    if since is not None:
+        reset_at, position = decode_changes_token(since)
+        if reset_at != user.bookingsResetAt:
+            position, reset = None, True
+    
+    # Changes younger than the settle time are left for the next sync: a
+    # transaction stamped earlier may still commit behind them
+    settled = datetime.now(dt_timezone.utc) - timedelta(seconds=CHANGES_SETTLE_SECONDS)
+    where_clause = {"hostId": user.id, "updatedAt": {"lte": settled}}
+    if position is not None:
+        where_clause = {
+            "AND": [
+                where_clause,
+                {
+                    "OR": [
+                        {"updatedAt": {"gt": position[0]}},
+                        {"updatedAt": position[0], "id": {"gt": position[1]}}
+                    ]
+                }
+            ]
+        }
+    
+    # One extra row tells whether more changes are waiting
+    bookings = await prisma.booking.find_many(
+        where=where_clause,
+        order=[{"updatedAt": "asc"}, {"id": "asc"}],
+        take=limit + 1
+    )
+    has_more = len(bookings) > limit
+    bookings = bookings[:limit]
+    if bookings:
+        position = (bookings[-1].updatedAt, bookings[-1].id)
+    
+    return BookingChangesResponse(
+        bookings=[
+            BookingResponse(**{name: extract(booking) for name, extract in MEETING_FIELDS.items()})
+            for booking in bookings
+        ],
+        next_token=encode_changes_token(user.bookingsResetAt, position),
+        has_more=has_more,
+        reset=reset
+    )
+
+
+@router.post("/meetings/import", response_model=BookingImportResponse)
+async def import_meetings(
+    request: Request,
+    file_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$")
+):
+    """
+    Import existing meetings from NDJSON or CSV (with a header line), one booking per line.
+
+    Rows that are invalid or overlap an existing booking or an earlier row
+    are reported back instead of imported. Rows with `status=cancelled` are
+    imported as cancelled meetings, so a CSV export can be imported again.
+    """
+    user = await ensure_default_user(prisma)
+    event_types = {et.id: et for et in await prisma.eventtype.find_many(where={"userId": user.id})}
+    
+    # Parse and validate the body as it streams in
+    rows: List[ImportRow] = []
+    rejects: List[ImportReject] = []
+    received = 0
+    async for row_number, fields in read_rows(request.stream(), file_format):
+        received += 1
+        if received > MAX_IMPORT_ROWS:
+            raise HTTPException(status_code=413, detail=f"Import cannot exceed {MAX_IMPORT_ROWS} rows")
+        
+        if isinstance(fields, str):
+            result = ImportReject(row_number, fields)
+        else:
+            result = validate_import_row(row_number, fields, event_types)
+        if isinstance(result, ImportReject):
+            rejects.append(result)
+        else:
+            rows.append(result)
+    
+    # Existing bookings over the imported span, then one merge pass over both sorted lists;
+    # cancelled rows take no time and cannot conflict
+    confirmed = [row for row in rows if row.cancelled_at is None]
+    existing = []
+    if confirmed:
+        existing_rows = await prisma.query_raw(
+            IMPORT_EXISTING_SQL,
+            user.id,
+            min(row.start for row in confirmed).replace(tzinfo=None).isoformat(),
+            max(row.end for row in confirmed).replace(tzinfo=None).isoformat()
+        )
+        existing = [
+            (
+                datetime.fromtimestamp(existing_row["start_epoch"], tz=dt_timezone.utc),
+                datetime.fromtimestamp(existing_row["end_epoch"], tz=dt_timezone.utc)
             )
+            for existing_row in existing_rows
+        ]
+    accepted, conflicts = split_conflicts(confirmed, existing)
+    accepted += [row for row in rows if row.cancelled_at is not None]
+    rejects.extend(conflicts)
+    
+    # Insert in chunks; a chunk that collides with a booking made meanwhile goes row by row
+    imported = 0
+    for offset in range(0, len(accepted), IMPORT_CHUNK_SIZE):
+        chunk = accepted[offset:offset + IMPORT_CHUNK_SIZE]
+        data = []
+        for row in chunk:
+            booking_fields = {
+                "eventTypeId": row.event_type_id,
+                "hostId": user.id,
+                "startTime": row.start,
+                "endTime": row.end,
+                "inviteeTimezone": row.invitee_timezone,
+                "inviteeName": row.invitee_name,
+                "inviteeEmail": row.invitee_email,
+                "guests": Json(row.guests),
+                "status": "CONFIRMED"
+            }
+            if row.cancelled_at is not None:
+                booking_fields.update({
+                    "status": "CANCELLED",
+                    "cancelledAt": row.cancelled_at,
+                    "cancelReason": row.cancel_reason,
+                    "cancelledBy": "host"
+                })
+            data.append(booking_fields)
+        try:
+            imported += await prisma.booking.create_many(data=data)
+        except Exception as e:
+            if not is_booking_overlap(e):
+                raise
+            for row, booking_fields in zip(chunk, data):
+                try:
+                    await prisma.booking.create(data=booking_fields)
+                    imported += 1
+                except Exception as row_error:
+                    if not is_booking_overlap(row_error):
+                        raise
+                    rejects.append(ImportReject(row.row, "Overlaps an existing booking"))
+    
+    if imported:
+        booking_index.invalidate_host(user.id)
+        availability_cache.invalidate_host(user.id)
+        for event_type_id in {row.event_type_id for row in accepted}:
+            host_load_balancer.invalidate(event_type_id)
         
-        booking_responses.append(response)
+        # Imported meetings are not refused by booking caps, but they count towards them
+        imported_types = [event_types[event_type_id] for event_type_id in {row.event_type_id for row in accepted}]
+        caps = await load_caps([user.id], imported_types)
+        if caps.hosts or caps.event_types:
+            await refresh_counters(caps.hosts, [event_types[event_type_id] for event_type_id in caps.event_types])
     
-    return BookingListResponse(bookings=booking_responses, total=total)
+    return BookingImportResponse(
+        received=received,
+        imported=imported,
+        rejected=[
+            BookingImportReject(row=reject.row, reason=reject.reason)
+            for reject in sorted(rejects)
+        ]
+    )
 
 
 @router.get("/meetings/{booking_id}", response_model=BookingResponse)
@@ -472,6 +1685,10 @@ async def get_meeting_details(booking_id: str):
             buffer_after_minutes=et.bufferAfterMinutes,
             min_notice_hours=et.minNoticeHours,
             max_days_ahead=et.maxDaysAhead,
+            scheduling_type=get_scheduling_type_str(et.schedulingType),
+            capacity=et.capacity,
+            max_bookings_per_day=et.maxBookingsPerDay,
+            max_bookings_per_week=et.maxBookingsPerWeek,
             is_active=et.isActive,
             created_at=et.createdAt,
             updated_at=et.updatedAt
@@ -480,13 +1697,220 @@ async def get_meeting_details(booking_id: str):
     return response
 
 
+@router.post("/meetings/cancel-range", response_model=CancelRangeResponse)
+async def cancel_meetings_in_range(cancel_data: CancelRangeRequest):
+    """Cancel every CONFIRMED meeting starting in [start, end), e.g. for time off."""
+    user = await ensure_default_user(prisma)
+    
+    # Times without an offset are UTC
+    range_start = cancel_data.start if cancel_data.start.tzinfo else cancel_data.start.replace(tzinfo=dt_timezone.utc)
+    range_end = cancel_data.end if cancel_data.end.tzinfo else cancel_data.end.replace(tzinfo=dt_timezone.utc)
+    if range_end <= range_start:
+        raise HTTPException(status_code=400, detail="'end' must be after 'start'")
+    
+    meetings = await prisma.booking.find_many(
+        where={
+            "hostId": user.id,
+            "status": "CONFIRMED",
+            "startTime": {"gte": range_start, "lt": range_end}
+        },
+        include={"eventType": True}
+    )
+    event_types = {booking.eventTypeId: booking.eventType for booking in meetings}
+    
+    # The other hosts' rows of team bookings are cancelled with them
+    group_ids = list({booking.groupId for booking in meetings if booking.groupId})
+    if group_ids:
+        meetings += await prisma.booking.find_many(
+            where={
+                "groupId": {"in": group_ids},
+                "hostId": {"not": user.id},
+                "status": "CONFIRMED"
+            }
+        )
+    
+    if meetings:
+        caps = await load_caps({booking.hostId for booking in meetings}, event_types.values())
+        now = datetime.utcnow().isoformat()
+        
+        # One statement for all of them. Seats and cap counts are only given back
+        # for the rows it flipped: a concurrent cancel gives back its own
+        async with prisma.tx() as transaction:
+            rows = await transaction.query_raw(
+                CANCEL_BOOKINGS_SQL.format(ids=", ".join(f"${n}" for n in range(3, len(meetings) + 3))),
+                now,
+                cancel_data.reason,
+                *[booking.id for booking in meetings]
+            )
+            cancelled_ids = {row["id"] for row in rows}
+            meetings = [booking for booking in meetings if booking.id in cancelled_ids]
+            await release_seats(transaction, meetings)
+            await uncount_bookings(transaction, caps.cancelled_keys(meetings))
+    
+    for host_booking in meetings:
+        booking_index.remove_booking(host_booking.hostId, host_booking.id, host_booking.endTime)
+        host_load_balancer.booking_cancelled(host_booking.eventTypeId, host_booking.hostId, host_booking.startTime)
+        availability_cache.invalidate_host(host_booking.hostId)
+    
+    own_ids = [booking.id for booking in meetings if booking.hostId == user.id]
+    return CancelRangeResponse(cancelled=len(own_ids), booking_ids=own_ids)
+
+
+@router.post("/meetings/{booking_id}/reschedule", response_model=BookingResponse)
+async def reschedule_meeting(booking_id: str, reschedule_data: RescheduleBookingRequest):
+    """
+    Move a meeting to a new start time.
+
+    The new time must be a slot the event type offers (schedule, buffers,
+    minimum notice and booking window), not counting the meeting itself.
+    The old booking is cancelled and the new one created in one transaction,
+    which also moves the meeting notes; if the new time overlaps another
+    booking nothing changes (409).
+    """
+    user = await ensure_default_user(prisma)
+    
+    booking = await prisma.booking.find_first(
+        where={"id": booking_id, "hostId": user.id},
+        include={"eventType": True}
+    )
+    
+    if not booking:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    if get_status_str(booking.status) == "cancelled":
+        raise HTTPException(status_code=400, detail="Meeting is cancelled")
+    
+    timezone = reschedule_data.timezone or booking.inviteeTimezone
+    validate_timezone_param(timezone)
+    start_time = slot_start_utc(reschedule_data.start_time, timezone)
+    end_time = start_time + timedelta(minutes=booking.eventType.durationMinutes)
+    
+    # A team booking moves for every host
+    old_rows = [booking]
+    if booking.groupId:
+        old_rows = await prisma.booking.find_many(
+            where={"groupId": booking.groupId, "status": "CONFIRMED"}
+        )
+    host_ids = [row.hostId for row in old_rows]
+    
+    if slot_holds.conflicts(
+        host_ids,
+        start_time,
+        end_time,
+        buffer_before=timedelta(minutes=booking.eventType.bufferBeforeMinutes),
+        buffer_after=timedelta(minutes=booking.eventType.bufferAfterMinutes)
+    ):
+        raise HTTPException(status_code=409, detail="Time slot is temporarily held")
+    
+    latest = datetime.now(dt_timezone.utc) + timedelta(days=booking.eventType.maxDaysAhead)
+    if start_time > latest or not await slot_offered(
+        booking.eventType, host_ids, start_time, end_time, timezone, exclude=old_rows
+    ):
+        raise HTTPException(status_code=409, detail="Time slot is not available")
+    
+    caps = await load_caps(host_ids, [booking.eventType])
+    
+    # Cancel first so the new time may overlap the old one; the overlap
+    # constraint on the insert is the conflict check, and a conflict rolls back both
+    group_id = str(uuid4()) if booking.groupId else None
+    try:
+        async with prisma.tx() as transaction:
+            moved = await transaction.booking.update_many(
+                where={"id": {"in": [row.id for row in old_rows]}, "status": "CONFIRMED"},
+                data={
+                    "status": "CANCELLED",
+                    "cancelledAt": datetime.utcnow(),
+                    "cancelReason": reschedule_data.reason or "Rescheduled",
+                    "cancelledBy": "host"
+                }
+            )
+            if moved != len(old_rows):
+                # Cancelled by someone else since it was read
+                raise HTTPException(status_code=409, detail="Meeting was changed, please retry")
+            
+            # A seat of a group event type moves to the new slot
+            await release_seats(transaction, old_rows)
+            slot_id = None
+            if booking.eventType.capacity > 1:
+                slot_id = await take_seat(transaction, booking.eventTypeId, start_time, end_time, booking.eventType.capacity)
+                if slot_id is None:
+                    raise HTTPException(status_code=409, detail="Time slot is full")
+            
+            # The booking counts against its caps in the new day and week instead
+            await uncount_bookings(transaction, caps.cancelled_keys(old_rows))
+            new_caps = caps.for_booking(booking.eventTypeId, host_ids)
+            if new_caps:
+                await count_booking(transaction, new_caps, start_time)
+            
+            new_rows = [
+                await transaction.booking.create(
+                    data={
+                        "eventTypeId": row.eventTypeId,
+                        "hostId": row.hostId,
+                        "startTime": start_time,
+                        "endTime": end_time,
+                        "inviteeTimezone": row.inviteeTimezone,
+                        "inviteeName": row.inviteeName,
+                        "inviteeEmail": row.inviteeEmail,
+                        "guests": Json(row.guests if row.guests else []),
+                        "status": "CONFIRMED",
+                        **({"groupId": group_id} if group_id else {}),
+                        **({"slotId": slot_id} if slot_id else {})
+                    }
+                )
+                for row in old_rows
+            ]
+            
+            # Notes stay with the meeting (one row per booking, kept on the host's row)
+            notes = await transaction.meetingnotes.find_unique(where={"bookingId": booking.id})
+            if notes:
+                await transaction.meetingnotes.update(
+                    where={"id": notes.id},
+                    data={"booking": {"connect": {"id": next(row.id for row in new_rows if row.hostId == booking.hostId)}}}
+                )
+    except BookingCapReached:
+        raise HTTPException(status_code=409, detail="Booking limit reached for this day or week")
+    except Exception as e:
+        if is_booking_overlap(e):
+            raise HTTPException(status_code=409, detail="Time slot is not available")
+        raise
+    
+    for old_row in old_rows:
+        booking_index.remove_booking(old_row.hostId, old_row.id, old_row.endTime)
+    for new_row in new_rows:
+        booking_index.add_booking(new_row.hostId, new_row.id, new_row.startTime, new_row.endTime)
+        availability_cache.invalidate_host(new_row.hostId)
+    host_load_balancer.invalidate(booking.eventTypeId)
+    
+    # The current user's row represents the booking
+    updated = next(row for row in new_rows if row.hostId == user.id)
+    
+    return BookingResponse(
+        id=updated.id,
+        event_type_id=updated.eventTypeId,
+        host_id=updated.hostId,
+        start_time=updated.startTime,
+        end_time=updated.endTime,
+        invitee_timezone=updated.inviteeTimezone,
+        invitee_name=updated.inviteeName,
+        invitee_email=updated.inviteeEmail,
+        guests=updated.guests if updated.guests else [],
+        status=get_status_str(updated.status),
+        cancelled_at=updated.cancelledAt,
+        cancel_reason=updated.cancelReason,
+        created_at=updated.createdAt,
+        updated_at=updated.updatedAt
+    )
+
+
 @router.post("/meetings/{booking_id}/cancel", response_model=BookingResponse)
 async def cancel_meeting(booking_id: str, cancel_data: CancelBookingRequest):
     """Cancel a meeting."""
     user = await ensure_default_user(prisma)
     
     booking = await prisma.booking.find_first(
-        where={"id": booking_id, "hostId": user.id}
+        where={"id": booking_id, "hostId": user.id},
+        include={"eventType": True}
     )
     
     if not booking:
@@ -495,16 +1919,49 @@ async def cancel_meeting(booking_id: str, cancel_data: CancelBookingRequest):
     if get_status_str(booking.status) == "cancelled":
         raise HTTPException(status_code=400, detail="Meeting is already cancelled")
     
-    # Cancel the booking
-    updated = await prisma.booking.update(
-        where={"id": booking_id},
-        data={
-            "status": "CANCELLED",
-            "cancelledAt": datetime.utcnow(),
-            "cancelReason": cancel_data.reason,
-            "cancelledBy": "host"
-        }
-    )
+    cancel_fields = {
+        "status": "CANCELLED",
+        "cancelledAt": datetime.utcnow(),
+        "cancelReason": cancel_data.reason,
+        "cancelledBy": "host"
+    }
+    
+    # Cancel the booking (and the other hosts' rows of a team booking)
+    cancelled = [booking]
+    if booking.groupId:
+        cancelled = await prisma.booking.find_many(
+            where={"groupId": booking.groupId, "status": "CONFIRMED"}
+        )
+    caps = await load_caps({b.hostId for b in cancelled}, [booking.eventType])
+    cap_keys = caps.cancelled_keys(cancelled)
+    
+    if booking.slotId or cap_keys:
+        # Give the seat and the cap counts back in the same transaction,
+        # unless a concurrent cancel got there first
+        async with prisma.tx() as transaction:
+            if await transaction.booking.update_many(
+                where={"id": {"in": [b.id for b in cancelled]}, "status": "CONFIRMED"},
+                data=cancel_fields
+            ):
+                await release_seats(transaction, cancelled)
+                await uncount_bookings(transaction, cap_keys)
+        updated = await prisma.booking.find_unique(where={"id": booking_id})
+    elif booking.groupId:
+        await prisma.booking.update_many(
+            where={"id": {"in": [b.id for b in cancelled]}},
+            data=cancel_fields
+        )
+        updated = await prisma.booking.find_unique(where={"id": booking_id})
+    else:
+        updated = await prisma.booking.update(
+            where={"id": booking_id},
+            data=cancel_fields
+        )
+    
+    for host_booking in cancelled:
+        booking_index.remove_booking(host_booking.hostId, host_booking.id, host_booking.endTime)
+        host_load_balancer.booking_cancelled(host_booking.eventTypeId, host_booking.hostId, host_booking.startTime)
+        availability_cache.invalidate_host(host_booking.hostId)
     
     return BookingResponse(
         id=updated.id,
@@ -590,6 +2047,105 @@ async def delete_meeting_notes(booking_id: str):
     return None
 
 
+# ============ Calendar Feed ============
+
+
+async def load_event_type_names(bookings, names: Dict[str, str]) -> None:
+    """Add the names of the bookings' event types that are not in `names` yet."""
+    missing = {booking.eventTypeId for booking in bookings} - names.keys()
+    if missing:
+        for et in await prisma.eventtype.find_many(where={"id": {"in": list(missing)}}):
+            names[et.id] = et.name
+
+
+def feed_event(booking, names: Dict[str, str]) -> str:
+    return ics_event(booking, get_status_str(booking.status), names.get(booking.eventTypeId, "Meeting"))
+
+
+async def render_calendar_feed(host_id: str, version: FeedVersion) -> CachedFeed:
+    """
+    The host's feed at `version`.
+
+    With a cached feed and only bookings changed, just the bookings updated
+    since CHANGES_SETTLE_SECONDS before the cached version are rendered
+    (bookings stamped earlier can still have committed after it was read);
+    otherwise all bookings are rendered, in keyset batches.
+    """
+    cached = calendar_feed_cache.get(host_id)
+    if cached is not None and cached.version == version and version.unsettled_at is None:
+        return cached
+    
+    names: Dict[str, str] = {}
+    if cached is not None and cached.version[1:3] == version[1:3]:
+        where_clause = {"hostId": host_id}
+        if cached.version.bookings is not None:
+            where_clause["updatedAt"] = {"gte": cached.version.bookings - timedelta(seconds=CHANGES_SETTLE_SECONDS)}
+        changed = await prisma.booking.find_many(where=where_clause)
+        await load_event_type_names(changed, names)
+        
+        events = dict(cached.events)
+        for booking in changed:
+            events[booking.id] = feed_event(booking, names)
+        calendar_feed_cache.incremental_renders += 1
+    else:
+        events = {}
+        async for batch in iter_meeting_batches({"hostId": host_id}, "asc"):
+            await load_event_type_names(batch, names)
+            for booking in batch:
+                events[booking.id] = feed_event(booking, names)
+        calendar_feed_cache.full_renders += 1
+    
+    feed = assemble(version, events)
+    calendar_feed_cache.put(host_id, feed)
+    return feed
+
+
+@router.get("/public/feeds/{feed_token}.ics", name="calendar_feed")
+async def get_calendar_feed(feed_token: str, request: Request):
+    """
+    Subscribable iCalendar feed of a host's meetings (the URL comes from GET /me/calendar-feed).
+
+    The ETag and Last-Modified come from the host's latest booking (and
+    event type) update and its bookingsResetAt, so polls with
+    If-None-Match / If-Modified-Since get a 304 without rendering while
+    nothing changed. Within CHANGES_SETTLE_SECONDS of the latest booking
+    update the version is unsettled and always sent in full. The latest booking
+    is read from the hostId + updatedAt index; the event types are found
+    through the userId + isActive index and sorted, which stays cheap as a
+    host has few. Changed feeds are rebuilt from the cached one (see
+    render_calendar_feed).
+    """
+    host = await prisma.user.find_unique(where={"calendarFeedToken": feed_token})
+    if not host:
+        raise HTTPException(status_code=404, detail="Calendar feed not found")
+    
+    latest_booking = await prisma.booking.find_first(where={"hostId": host.id}, order={"updatedAt": "desc"})
+    latest_event_type = await prisma.eventtype.find_first(where={"userId": host.id}, order={"updatedAt": "desc"})
+    now = datetime.now(dt_timezone.utc)
+    version = FeedVersion(
+        bookings=latest_booking.updatedAt if latest_booking else None,
+        event_types=latest_event_type.updatedAt if latest_event_type else None,
+        reset=host.bookingsResetAt,
+        # Earlier-stamped bookings may still commit behind a recent one
+        unsettled_at=(
+            now if latest_booking and latest_booking.updatedAt > now - timedelta(seconds=CHANGES_SETTLE_SECONDS) else None
+        )
+    )
+    
+    headers = {
+        "ETag": version.etag(host.id),
+        "Last-Modified": version.http_date(),
+        "Cache-Control": "private, no-cache"
+    }
+    
+    if version.unchanged_for(host.id, request.headers.get("if-none-match"), request.headers.get("if-modified-since")):
+        calendar_feed_cache.not_modified += 1
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    feed = await render_calendar_feed(host.id, version)
+    return Response(content=feed.body, media_type="text/calendar; charset=utf-8", headers=headers)
+
+
 # ============ Catch-All Public Route (must be last) ============
 # This route catches /public/{username}/{event_slug} and must be defined AFTER
 # all other /public/* routes to avoid matching /public/available-dates etc.
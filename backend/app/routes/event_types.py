@@ -2,11 +2,16 @@
 Event Types API Router - Prisma Version
 """
 import re
-from typing import Optional
+from datetime import datetime, timezone as dt_timezone
+from typing import List, Optional
 from fastapi import APIRouter, HTTPException, status, Depends
 from prisma import Prisma
 
 from app.core.database import get_db, prisma
+from app.services.availability_cache import availability_cache
+from app.services.booking_caps import EVENT_TYPE_SCOPE, rebuild_counters, refresh_counters
+from app.services.booking_index import booking_index
+from app.services.round_robin import host_load_balancer
 from app.schemas import (
     EventTypeCreate,
     EventTypeUpdate,
@@ -20,6 +25,9 @@ router = APIRouter(prefix="/event-types", tags=["Event Types"])
 DEFAULT_USER_ID = "default-user-001"
 DEFAULT_USERNAME = "abhishek"
 
+# Largest team (owner included) a collective or round-robin event type can have
+MAX_TEAM_HOSTS = 50
+
 
 async def ensure_default_user(db: Prisma):
     """Ensure default user exists for development."""
@@ -55,6 +63,52 @@ def get_location_type_str(location_type) -> str:
     return str(location_type).lower()
 
 
+def get_scheduling_type_str(scheduling_type) -> str:
+    """Safely extract string value from Prisma enum or string."""
+    if scheduling_type is None:
+        return "individual"
+    if hasattr(scheduling_type, 'value'):
+        return scheduling_type.value.lower()
+    return str(scheduling_type).lower()
+
+
+def get_team_host_ids(event_type) -> List[str]:
+    """All hosts of an event type, owner first (only the owner unless it is a team event type)."""
+    host_ids = [event_type.userId]
+    if get_scheduling_type_str(event_type.schedulingType) != "individual":
+        host_ids.extend(h.userId for h in (event_type.hosts or []) if h.userId != event_type.userId)
+    return host_ids
+
+
+def validate_capacity(scheduling_type: str, capacity: int) -> None:
+    """Only individual event types can seat several invitees per slot."""
+    if capacity > 1 and scheduling_type != "individual":
+        raise HTTPException(status_code=400, detail="Only individual event types can have a capacity above 1")
+
+
+async def validate_team_hosts(owner_id: str, host_ids: List[str]) -> List[str]:
+    """Deduplicate team member ids (owner excluded) and check they are known users."""
+    member_ids = list(dict.fromkeys(host_id for host_id in host_ids if host_id != owner_id))
+    if len(member_ids) + 1 > MAX_TEAM_HOSTS:
+        raise HTTPException(status_code=400, detail=f"A team cannot have more than {MAX_TEAM_HOSTS} hosts")
+    
+    if member_ids:
+        users = await prisma.user.find_many(where={"id": {"in": member_ids}})
+        unknown = set(member_ids) - {u.id for u in users}
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown host ids: {', '.join(sorted(unknown))}")
+    return member_ids
+
+
+async def set_event_type_hosts(event_type_id: str, member_ids: List[str]) -> None:
+    """Replace the team members (besides the owner) of an event type."""
+    await prisma.eventtypehost.delete_many(where={"eventTypeId": event_type_id})
+    if member_ids:
+        await prisma.eventtypehost.create_many(
+            data=[{"eventTypeId": event_type_id, "userId": member_id} for member_id in member_ids]
+        )
+
+
 @router.get("", response_model=EventTypeListResponse)
 async def list_event_types(active_only: bool = False):
     """Get all event types for the current user."""
@@ -66,7 +120,8 @@ async def list_event_types(active_only: bool = False):
     
     event_types = await prisma.eventtype.find_many(
         where=where_clause,
-        order={"createdAt": "desc"}
+        order={"createdAt": "desc"},
+        include={"hosts": True}
     )
     
     result = []
@@ -85,10 +140,15 @@ async def list_event_types(active_only: bool = False):
             buffer_after_minutes=et.bufferAfterMinutes,
             min_notice_hours=et.minNoticeHours,
             max_days_ahead=et.maxDaysAhead,
+            scheduling_type=get_scheduling_type_str(et.schedulingType),
+            capacity=et.capacity,
+            max_bookings_per_day=et.maxBookingsPerDay,
+            max_bookings_per_week=et.maxBookingsPerWeek,
             is_active=et.isActive,
             created_at=et.createdAt,
             updated_at=et.updatedAt,
-            booking_url=f"/{user.username}/{et.slug}"
+            booking_url=f"/{user.username}/{et.slug}",
+            host_ids=get_team_host_ids(et)[1:]
         ))
     
     return EventTypeListResponse(event_types=result, total=len(result))
@@ -100,7 +160,8 @@ async def get_event_type(event_type_id: str):
     user = await ensure_default_user(prisma)
     
     event_type = await prisma.eventtype.find_first(
-        where={"id": event_type_id, "userId": user.id}
+        where={"id": event_type_id, "userId": user.id},
+        include={"hosts": True}
     )
     
     if not event_type:
@@ -120,10 +181,15 @@ async def get_event_type(event_type_id: str):
         buffer_after_minutes=event_type.bufferAfterMinutes,
         min_notice_hours=event_type.minNoticeHours,
         max_days_ahead=event_type.maxDaysAhead,
+        scheduling_type=get_scheduling_type_str(event_type.schedulingType),
+        capacity=event_type.capacity,
+        max_bookings_per_day=event_type.maxBookingsPerDay,
+        max_bookings_per_week=event_type.maxBookingsPerWeek,
         is_active=event_type.isActive,
         created_at=event_type.createdAt,
         updated_at=event_type.updatedAt,
-        booking_url=f"/{user.username}/{event_type.slug}"
+        booking_url=f"/{user.username}/{event_type.slug}",
+        host_ids=get_team_host_ids(event_type)[1:]
     )
 
 
@@ -160,6 +226,13 @@ async def create_event_type(event_type_data: EventTypeCreate):
     }
     location_type = location_type_map.get(event_type_data.location_type.lower(), "ZOOM")
     
+    validate_capacity(event_type_data.scheduling_type, event_type_data.capacity)
+    
+    # Team members of a collective or round-robin event type
+    member_ids = []
+    if event_type_data.scheduling_type != "individual":
+        member_ids = await validate_team_hosts(user.id, event_type_data.host_ids)
+    
     # Create event type
     event_type = await prisma.eventtype.create(
         data={
@@ -175,10 +248,21 @@ async def create_event_type(event_type_data: EventTypeCreate):
             "bufferAfterMinutes": event_type_data.buffer_after_minutes,
             "minNoticeHours": event_type_data.min_notice_hours,
             "maxDaysAhead": event_type_data.max_days_ahead,
+            "schedulingType": event_type_data.scheduling_type.upper(),
+            "capacity": event_type_data.capacity,
+            "maxBookingsPerDay": event_type_data.max_bookings_per_day,
+            "maxBookingsPerWeek": event_type_data.max_bookings_per_week,
             "isActive": event_type_data.is_active
         }
     )
     
+    if member_ids:
+        await set_event_type_hosts(event_type.id, member_ids)
+        event_type = await prisma.eventtype.find_unique(
+            where={"id": event_type.id},
+            include={"hosts": True}
+        )
+    
     return EventTypeResponse(
         id=event_type.id,
         user_id=event_type.userId,
@@ -193,10 +277,15 @@ async def create_event_type(event_type_data: EventTypeCreate):
         buffer_after_minutes=event_type.bufferAfterMinutes,
         min_notice_hours=event_type.minNoticeHours,
         max_days_ahead=event_type.maxDaysAhead,
+        scheduling_type=get_scheduling_type_str(event_type.schedulingType),
+        capacity=event_type.capacity,
+        max_bookings_per_day=event_type.maxBookingsPerDay,
+        max_bookings_per_week=event_type.maxBookingsPerWeek,
         is_active=event_type.isActive,
         created_at=event_type.createdAt,
         updated_at=event_type.updatedAt,
-        booking_url=f"/{user.username}/{event_type.slug}"
+        booking_url=f"/{user.username}/{event_type.slug}",
+        host_ids=get_team_host_ids(event_type)[1:]
     )
 
 
@@ -235,13 +324,39 @@ async def update_event_type(event_type_id: str, update_data: EventTypeUpdate):
         update_dict["minNoticeHours"] = update_data.min_notice_hours
     if update_data.max_days_ahead is not None:
         update_dict["maxDaysAhead"] = update_data.max_days_ahead
+    if update_data.scheduling_type is not None:
+        update_dict["schedulingType"] = update_data.scheduling_type.upper()
+    if update_data.capacity is not None:
+        update_dict["capacity"] = update_data.capacity
+    # Booking caps can be removed with an explicit null
+    if "max_bookings_per_day" in update_data.model_fields_set:
+        update_dict["maxBookingsPerDay"] = update_data.max_bookings_per_day
+    if "max_bookings_per_week" in update_data.model_fields_set:
+        update_dict["maxBookingsPerWeek"] = update_data.max_bookings_per_week
+    
+    validate_capacity(
+        update_data.scheduling_type or get_scheduling_type_str(event_type.schedulingType),
+        update_data.capacity or event_type.capacity
+    )
     if update_data.is_active is not None:
         update_dict["isActive"] = update_data.is_active
     
+    # Individual event types have no team members
+    if update_data.scheduling_type == "individual":
+        await set_event_type_hosts(event_type_id, [])
+    elif update_data.host_ids is not None:
+        await set_event_type_hosts(event_type_id, await validate_team_hosts(user.id, update_data.host_ids))
+    
     updated = await prisma.eventtype.update(
         where={"id": event_type_id},
-        data=update_dict
+        data=update_dict,
+        include={"hosts": True}
     )
+    availability_cache.invalidate_host(user.id)
+    
+    # Counters are only kept while a cap is set, so recount them from the bookings
+    if {"max_bookings_per_day", "max_bookings_per_week"} & update_data.model_fields_set:
+        await refresh_counters(event_types=[updated])
     
     return EventTypeResponse(
         id=updated.id,
@@ -257,10 +372,15 @@ async def update_event_type(event_type_id: str, update_data: EventTypeUpdate):
         buffer_after_minutes=updated.bufferAfterMinutes,
         min_notice_hours=updated.minNoticeHours,
         max_days_ahead=updated.maxDaysAhead,
+        scheduling_type=get_scheduling_type_str(updated.schedulingType),
+        capacity=updated.capacity,
+        max_bookings_per_day=updated.maxBookingsPerDay,
+        max_bookings_per_week=updated.maxBookingsPerWeek,
         is_active=updated.isActive,
         created_at=updated.createdAt,
         updated_at=updated.updatedAt,
-        booking_url=f"/{user.username}/{updated.slug}"
+        booking_url=f"/{user.username}/{updated.slug}",
+        host_ids=get_team_host_ids(updated)[1:]
     )
 
 
@@ -270,7 +390,8 @@ async def delete_event_type(event_type_id: str):
     user = await ensure_default_user(prisma)
     
     event_type = await prisma.eventtype.find_first(
-        where={"id": event_type_id, "userId": user.id}
+        where={"id": event_type_id, "userId": user.id},
+        include={"hosts": True}
     )
     
     if not event_type:
@@ -281,6 +402,18 @@ async def delete_event_type(event_type_id: str):
     
     # Now delete the event type
     await prisma.eventtype.delete(where={"id": event_type_id})
+    # Sync tokens and calendar feeds of the hosts must drop the deleted bookings
+    await prisma.user.update_many(
+        where={"id": {"in": get_team_host_ids(event_type)}},
+        data={"bookingsResetAt": datetime.now(dt_timezone.utc)}
+    )
+    # The deleted bookings no longer count towards the hosts' caps
+    await rebuild_counters(EVENT_TYPE_SCOPE, event_type_id, "UTC", capped=False)
+    await refresh_counters(host_ids=get_team_host_ids(event_type))
+    host_load_balancer.invalidate(event_type_id)
+    for host_id in get_team_host_ids(event_type):
+        booking_index.invalidate_host(host_id)
+        availability_cache.invalidate_host(host_id)
     return None
 
 
@@ -299,8 +432,10 @@ async def toggle_event_type(event_type_id: str):
     # Toggle the is_active status
     updated = await prisma.eventtype.update(
         where={"id": event_type_id},
-        data={"isActive": not event_type.isActive}
+        data={"isActive": not event_type.isActive},
+        include={"hosts": True}
     )
+    availability_cache.invalidate_host(user.id)
     
     return EventTypeResponse(
         id=updated.id,
@@ -316,10 +451,15 @@ async def toggle_event_type(event_type_id: str):
         buffer_after_minutes=updated.bufferAfterMinutes,
         min_notice_hours=updated.minNoticeHours,
         max_days_ahead=updated.maxDaysAhead,
+        scheduling_type=get_scheduling_type_str(updated.schedulingType),
+        capacity=updated.capacity,
+        max_bookings_per_day=updated.maxBookingsPerDay,
+        max_bookings_per_week=updated.maxBookingsPerWeek,
         is_active=updated.isActive,
         created_at=updated.createdAt,
         updated_at=updated.updatedAt,
-        booking_url=f"/{user.username}/{updated.slug}"
+        booking_url=f"/{user.username}/{updated.slug}",
+        host_ids=get_team_host_ids(updated)[1:]
     )
 
 
@@ -329,7 +469,8 @@ async def duplicate_event_type(event_type_id: str):
     user = await ensure_default_user(prisma)
     
     original = await prisma.eventtype.find_first(
-        where={"id": event_type_id, "userId": user.id}
+        where={"id": event_type_id, "userId": user.id},
+        include={"hosts": True}
     )
     
     if not original:
@@ -368,10 +509,23 @@ async def duplicate_event_type(event_type_id: str):
             "bufferAfterMinutes": original.bufferAfterMinutes,
             "minNoticeHours": original.minNoticeHours,
             "maxDaysAhead": original.maxDaysAhead,
+            "schedulingType": original.schedulingType,
+            "capacity": original.capacity,
+            "maxBookingsPerDay": original.maxBookingsPerDay,
+            "maxBookingsPerWeek": original.maxBookingsPerWeek,
             "isActive": True  # Duplicates are active by default
         }
     )
     
+    # Copy the team
+    member_ids = get_team_host_ids(original)[1:]
+    if member_ids:
+        await set_event_type_hosts(duplicate.id, member_ids)
+        duplicate = await prisma.eventtype.find_unique(
+            where={"id": duplicate.id},
+            include={"hosts": True}
+        )
+    
     return EventTypeResponse(
         id=duplicate.id,
         user_id=duplicate.userId,
@@ -386,8 +540,13 @@ async def duplicate_event_type(event_type_id: str):
         buffer_after_minutes=duplicate.bufferAfterMinutes,
         min_notice_hours=duplicate.minNoticeHours,
         max_days_ahead=duplicate.maxDaysAhead,
+        scheduling_type=get_scheduling_type_str(duplicate.schedulingType),
+        capacity=duplicate.capacity,
+        max_bookings_per_day=duplicate.maxBookingsPerDay,
+        max_bookings_per_week=duplicate.maxBookingsPerWeek,
         is_active=duplicate.isActive,
         created_at=duplicate.createdAt,
         updated_at=duplicate.updatedAt,
-        booking_url=f"/{user.username}/{duplicate.slug}"
+        booking_url=f"/{user.username}/{duplicate.slug}",
+        host_ids=get_team_host_ids(duplicate)[1:]
     )
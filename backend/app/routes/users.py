@@ -1,26 +1,70 @@
 """
 User API Router - Default user context for MVP (no auth).
 """
-from fastapi import APIRouter
+import secrets
+
+from fastapi import APIRouter, Request
 
 from app.core.database import prisma
 from app.routes.event_types import ensure_default_user
-from app.schemas import UserResponse
+from app.schemas import BookingLimitsUpdate, CalendarFeedResponse, UserResponse
+from app.services.availability_cache import availability_cache
+from app.services.booking_caps import refresh_counters
 
 router = APIRouter(tags=["User"])
 
 
-@router.get("/me", response_model=UserResponse)
-async def get_current_user():
-    """Get current user context (default user for MVP)."""
-    user = await ensure_default_user(prisma)
-    
+def user_response(user) -> UserResponse:
+    """Build the user response from a Prisma user."""
     return UserResponse(
         id=user.id,
         username=user.username,
         name=user.name,
         email=user.email,
         timezone=user.timezone,
+        max_bookings_per_day=user.maxBookingsPerDay,
+        max_bookings_per_week=user.maxBookingsPerWeek,
         created_at=user.createdAt,
         updated_at=user.updatedAt
     )
+
+
+@router.get("/me", response_model=UserResponse)
+async def get_current_user():
+    """Get current user context (default user for MVP)."""
+    user = await ensure_default_user(prisma)
+    
+    return user_response(user)
+
+
+@router.put("/me/booking-limits", response_model=UserResponse)
+async def update_booking_limits(limits: BookingLimitsUpdate):
+    """Set the current user's daily/weekly booking caps across all event types (null removes a cap)."""
+    user = await ensure_default_user(prisma)
+    
+    updated = await prisma.user.update(
+        where={"id": user.id},
+        data={
+            "maxBookingsPerDay": limits.max_bookings_per_day,
+            "maxBookingsPerWeek": limits.max_bookings_per_week
+        }
+    )
+    
+    # Counters are only kept while a cap is set, so recount them from the bookings
+    await refresh_counters(host_ids=[user.id])
+    availability_cache.invalidate_host(user.id)
+    
+    return user_response(updated)
+
+
+@router.get("/me/calendar-feed", response_model=CalendarFeedResponse)
+async def get_calendar_feed_url(request: Request):
+    """Get the current user's subscribable ICS feed URL (created on first use; the URL is the only secret)."""
+    user = await ensure_default_user(prisma)
+    
+    token = user.calendarFeedToken
+    if not token:
+        token = secrets.token_urlsafe(24)
+        await prisma.user.update(where={"id": user.id}, data={"calendarFeedToken": token})
+    
+    return CalendarFeedResponse(url=str(request.url_for("calendar_feed", feed_token=token)))
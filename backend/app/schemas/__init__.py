@@ -4,6 +4,8 @@ from app.schemas.schemas import (
     UserBase,
     UserCreate,
     UserResponse,
+    BookingLimitsUpdate,
+    CalendarFeedResponse,
     EventTypeBase,
     EventTypeCreate,
     EventTypeUpdate,
@@ -20,15 +22,28 @@ from app.schemas.schemas import (
     DateOverrideCreate,
     DateOverrideResponse,
     TimezoneUpdate,
+    FreeBusyResponse,
     MeetingNotesCreate,
     MeetingNotesResponse,
     InviteeInfo,
     BookingCreate,
     BookingResponse,
     BookingListResponse,
+    BookingChangesResponse,
+    SparseBookingListResponse,
+    BookingImportRow,
+    BookingImportReject,
+    BookingImportResponse,
     CancelBookingRequest,
+    CancelRangeRequest,
+    CancelRangeResponse,
+    RescheduleBookingRequest,
     TimeSlot,
     AvailableSlotsResponse,
+    AvailableSlotsRangeResponse,
+    NextAvailableResponse,
+    SlotHoldCreate,
+    SlotHoldResponse,
     AvailableDatesResponse,
     PublicEventTypeResponse,
     PublicHostResponse,
@@ -40,6 +55,8 @@ __all__ = [
     "UserBase",
     "UserCreate", 
     "UserResponse",
+    "BookingLimitsUpdate",
+    "CalendarFeedResponse",
     "EventTypeBase",
     "EventTypeCreate",
     "EventTypeUpdate",
@@ -56,15 +73,28 @@ __all__ = [
     "DateOverrideCreate",
     "DateOverrideResponse",
     "TimezoneUpdate",
+    "FreeBusyResponse",
     "MeetingNotesCreate",
     "MeetingNotesResponse",
     "InviteeInfo",
     "BookingCreate",
     "BookingResponse",
     "BookingListResponse",
+    "BookingChangesResponse",
+    "SparseBookingListResponse",
+    "BookingImportRow",
+    "BookingImportReject",
+    "BookingImportResponse",
     "CancelBookingRequest",
+    "CancelRangeRequest",
+    "CancelRangeResponse",
+    "RescheduleBookingRequest",
     "TimeSlot",
     "AvailableSlotsResponse",
+    "AvailableSlotsRangeResponse",
+    "NextAvailableResponse",
+    "SlotHoldCreate",
+    "SlotHoldResponse",
     "AvailableDatesResponse",
     "PublicEventTypeResponse",
     "PublicHostResponse",
@@ -1,8 +1,8 @@
 """
 Pydantic schemas for request/response validation.
 """
-from datetime import datetime, date
-from typing import List, Optional
+from datetime import datetime, date as dt_date
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from pydantic import BaseModel, EmailStr, Field, field_validator
 import re
 
@@ -31,6 +31,8 @@ class UserCreate(UserBase):
 class UserResponse(UserBase):
     """Schema for user response."""
     id: str
+    max_bookings_per_day: Optional[int] = None
+    max_bookings_per_week: Optional[int] = None
     created_at: datetime
     updated_at: datetime
 
@@ -38,6 +40,17 @@ class UserResponse(UserBase):
         from_attributes = True
 
 
+class BookingLimitsUpdate(BaseModel):
+    """Host-wide booking caps across all event types (null = no cap)."""
+    max_bookings_per_day: Optional[int] = Field(None, ge=1)
+    max_bookings_per_week: Optional[int] = Field(None, ge=1)
+
+
+class CalendarFeedResponse(BaseModel):
+    """Subscribable ICS feed of the user's meetings."""
+    url: str
+
+
 # ============ Event Type Schemas ============
 class EventTypeBase(BaseModel):
     """Base event type schema."""
@@ -51,12 +64,17 @@ class EventTypeBase(BaseModel):
     buffer_after_minutes: int = Field(default=0, ge=0)
     min_notice_hours: int = Field(default=4, ge=0)
     max_days_ahead: int = Field(default=60, ge=1, le=365)
+    scheduling_type: str = Field(default="individual", pattern=r"^(individual|collective|round_robin)$")
+    capacity: int = Field(default=1, ge=1, le=1000)  # invitees per slot (group event types)
+    max_bookings_per_day: Optional[int] = Field(default=None, ge=1)  # None = no cap
+    max_bookings_per_week: Optional[int] = Field(default=None, ge=1)
     is_active: bool = True
 
 
 class EventTypeCreate(EventTypeBase):
     """Schema for creating an event type."""
     slug: Optional[str] = None  # Auto-generated if not provided
+    host_ids: List[str] = []  # Team members besides the owner (collective/round-robin event types)
     
     @field_validator('slug', mode='before')
     @classmethod
@@ -79,6 +97,11 @@ class EventTypeUpdate(BaseModel):
     buffer_after_minutes: Optional[int] = Field(None, ge=0)
     min_notice_hours: Optional[int] = Field(None, ge=0)
     max_days_ahead: Optional[int] = Field(None, ge=1, le=365)
+    scheduling_type: Optional[str] = Field(None, pattern=r"^(individual|collective|round_robin)$")
+    capacity: Optional[int] = Field(None, ge=1, le=1000)
+    max_bookings_per_day: Optional[int] = Field(None, ge=1)  # an explicit null removes the cap
+    max_bookings_per_week: Optional[int] = Field(None, ge=1)
+    host_ids: Optional[List[str]] = None
     is_active: Optional[bool] = None
 
 
@@ -90,6 +113,7 @@ class EventTypeResponse(EventTypeBase):
     created_at: datetime
     updated_at: datetime
     booking_url: Optional[str] = None
+    host_ids: List[str] = []
 
     class Config:
         from_attributes = True
@@ -187,6 +211,13 @@ class TimezoneUpdate(BaseModel):
     timezone: str = Field(..., max_length=50)
 
 
+class FreeBusyResponse(BaseModel):
+    """Merged, buffer-aware busy intervals of a host as [start, end] pairs (UTC)."""
+    start: datetime
+    end: datetime
+    busy: List[Tuple[datetime, datetime]]
+
+
 class MeetingNotesCreate(BaseModel):
     """Schema for creating/updating meeting notes."""
     content: str = Field(..., min_length=1)
@@ -218,6 +249,7 @@ class BookingCreate(BaseModel):
     invitee: InviteeInfo
     guests: List[EmailStr] = []
     answers: dict = {}
+    hold_token: Optional[str] = None  # from POST /public/slots/hold
 
 
 class BookingResponse(BaseModel):
@@ -245,7 +277,71 @@ class BookingResponse(BaseModel):
 class BookingListResponse(BaseModel):
     """Schema for listing bookings."""
     bookings: List[BookingResponse]
-    total: int
+    total: Optional[int] = None  # only with include_total=true (or the legacy page parameter)
+    next_cursor: Optional[str] = None  # pass as `cursor` for the next page; None on the last page
+
+
+class SparseBookingListResponse(BaseModel):
+    """Schema for listing bookings with `fields` or `event_types=sideloaded`."""
+    bookings: List[Dict[str, Any]]  # the requested BookingResponse fields
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+    event_types: Optional[Dict[str, Dict[str, Any]]] = None  # sideloaded: event type id -> requested fields
+
+
+class BookingChangesResponse(BaseModel):
+    """Schema for a /meetings/changes sync."""
+    bookings: List[BookingResponse]  # oldest change first; upsert by id
+    next_token: str  # pass as `since` on the next sync
+    has_more: bool  # more changes are waiting: sync again right away
+    reset: bool = False  # the token was outdated: drop the local copy, this is a full sync
+
+
+class CancelRangeRequest(BaseModel):
+    """Schema for cancelling every meeting that starts in [start, end)."""
+    start: datetime
+    end: datetime
+    reason: Optional[str] = None
+
+
+class CancelRangeResponse(BaseModel):
+    """Result of a range cancel."""
+    cancelled: int
+    booking_ids: List[str]
+
+
+class RescheduleBookingRequest(BaseModel):
+    """Schema for moving a booking to a new start time."""
+    start_time: datetime
+    timezone: Optional[str] = Field(None, max_length=50)  # for a start time without offset; default: the invitee's
+    reason: Optional[str] = None
+
+
+class BookingImportRow(BaseModel):
+    """One booking of a bulk import (NDJSON object or CSV row)."""
+    event_type_id: str
+    start_time: datetime
+    end_time: Optional[datetime] = None  # default: start + event type duration
+    invitee_name: str = Field(..., min_length=1, max_length=100)
+    invitee_email: EmailStr
+    invitee_timezone: str = Field("UTC", max_length=50)
+    guests: List[EmailStr] = []
+    status: Literal["confirmed", "cancelled"] = "confirmed"  # cancelled rows are kept as history
+    cancelled_at: Optional[datetime] = None  # default: now (cancelled rows only)
+    cancel_reason: Optional[str] = None
+
+
+class BookingImportReject(BaseModel):
+    """A row that was not imported, and why."""
+    row: int
+    reason: str
+
+
+class BookingImportResponse(BaseModel):
+    """Result of a bulk booking import."""
+    received: int
+    imported: int
+    rejected: List[BookingImportReject]
 
 
 class CancelBookingRequest(BaseModel):
@@ -258,6 +354,7 @@ class TimeSlot(BaseModel):
     """Available time slot."""
     start_time: str
     end_time: str
+    remaining_seats: Optional[int] = None  # group event types only
 
 
 class AvailableSlotsResponse(BaseModel):
@@ -267,6 +364,36 @@ class AvailableSlotsResponse(BaseModel):
     slots: List[TimeSlot]
 
 
+class AvailableSlotsRangeResponse(BaseModel):
+    """Response for available slots over a range of dates."""
+    timezone: str
+    days: List[AvailableSlotsResponse]
+
+
+class NextAvailableResponse(BaseModel):
+    """Earliest free slot of an event type (only timezone is set when none is free)."""
+    timezone: str
+    date: Optional[str] = None
+    start_time: Optional[datetime] = None  # UTC
+    slot: Optional[TimeSlot] = None
+
+
+class SlotHoldCreate(BaseModel):
+    """Schema for holding a slot while the invitee fills in the form."""
+    event_type_id: str
+    start_time: datetime
+    timezone: str = Field(..., max_length=50)
+
+
+class SlotHoldResponse(BaseModel):
+    """A held slot; pass `token` as `hold_token` when booking it."""
+    token: str
+    event_type_id: str
+    start_time: datetime
+    end_time: datetime
+    expires_at: datetime
+
+
 class AvailableDatesResponse(BaseModel):
     """Response for available dates in a month."""
     year: int
@@ -1,3 +1,32 @@
 """
 Services module for business logic.
 """
+from app.services.slots import (
+    HostAvailability,
+    availability_windows,
+    find_collective_slots_by_day,
+    find_free_slots,
+    find_free_slots_by_day,
+    intersect_intervals,
+    intervals_for_date,
+    merge_busy_intervals,
+    schema_day_of_week,
+    slot_step,
+    union_intervals,
+    union_slots_by_day,
+)
+
+__all__ = [
+    "HostAvailability",
+    "availability_windows",
+    "find_collective_slots_by_day",
+    "find_free_slots",
+    "find_free_slots_by_day",
+    "intersect_intervals",
+    "intervals_for_date",
+    "merge_busy_intervals",
+    "schema_day_of_week",
+    "slot_step",
+    "union_intervals",
+    "union_slots_by_day",
+]
@@ -0,0 +1,142 @@
+"""
+Availability cache - LRU cache for computed slots and available dates.
+
+Entries are tagged with the host's version counter at the time they were
+computed. Any write that can change a host's availability (bookings,
+schedules, date overrides, event types) bumps that counter, which makes
+every cached entry of that host stale at once without scanning the cache.
+
+Team event types depend on several hosts: they pass a tuple of host ids
+and their entries are tagged with the tuple of those hosts' versions, so
+a write by any member makes them stale.
+
+The cache lives in process memory, so each worker keeps its own copy.
+Entries also expire after a short TTL because the minimum-notice cutoff
+moves with the clock.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple, Union
+
+from app.core.config import settings
+
+
+# A host id, or the tuple of host ids of a team event type
+HostKey = Union[str, Tuple[str, ...]]
+
+
+class _CacheEntry(NamedTuple):
+    host_id: HostKey
+    version: Hashable
+    expires_at: float
+    size: int
+    value: Any
+
+
+class AvailabilityCache:
+    """LRU cache with an entry cap, a memory cap and per-host versioning."""
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float, enabled: bool = True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def host_version(self, host_id: HostKey) -> Hashable:
+        """Current availability version of a host (a tuple of versions for a team)."""
+        if isinstance(host_id, tuple):
+            return tuple(self._versions.get(member_id, 0) for member_id in host_id)
+        return self._versions.get(host_id, 0)
+
+    def invalidate_host(self, host_id: str) -> None:
+        """Bump a host's version so all of its cached entries become stale."""
+        self._versions[host_id] = self._versions.get(host_id, 0) + 1
+        self.invalidations += 1
+
+    def get(self, host_id: HostKey, key: Hashable) -> Optional[Any]:
+        """Return a fresh cached value or None on a miss."""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.version != self.host_version(host_id) or entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(self, host_id: HostKey, key: Hashable, value: Any, size: int, version: Hashable) -> None:
+        """
+        Store a value computed at host `version`.
+
+        Pass the version read *before* computing the value: if the host was
+        invalidated in the meantime the entry is stale as soon as it lands.
+        """
+        if not self.enabled or size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = _CacheEntry(
+            host_id=host_id,
+            version=version,
+            expires_at=time.monotonic() + self.ttl_seconds,
+            size=size,
+            value=value
+        )
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters and versions are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size, for sizing the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+# Global cache instance
+availability_cache = AvailabilityCache(
+    max_entries=settings.availability_cache_max_entries,
+    max_bytes=settings.availability_cache_max_bytes,
+    ttl_seconds=settings.availability_cache_ttl_seconds,
+    enabled=settings.availability_cache_enabled
+)
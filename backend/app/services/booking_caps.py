@@ -0,0 +1,315 @@
+"""
+Booking caps - daily and weekly limits on CONFIRMED bookings.
+
+A host (across all event types) and an event type can each cap how many
+bookings they take per day and per week (weeks start on Monday). Host
+caps count the host's days and event type caps the owner's days, in the
+timezone of their default schedule.
+
+Caps are enforced from `booking_counters` rows instead of counting
+bookings: a booking increments the counters of its capped scopes in the
+same transaction that writes it, and the transaction is rolled back if a
+count goes over its cap. Concurrent bookings of the same period queue on
+the counter row's lock, so the cap holds under load. Cancelling and
+rescheduling decrement the counters the same way. Counters are only kept
+for scopes that have a cap; setting a cap (or changing the timezone it is
+counted in) rebuilds the scope's counters from its bookings.
+
+Slot listings load the counters of their date range once (`CapUsage`) and
+drop the slots of capped days with a dictionary lookup per slot.
+"""
+from collections import Counter
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import uuid4
+
+from app.core.database import prisma
+from app.services.timezones import get_zone, is_valid_timezone
+
+Interval = Tuple[datetime, datetime]
+
+# (scope, scope id, period, first day of the period)
+CounterKey = Tuple[str, str, str, date]
+
+HOST_SCOPE = "host"
+EVENT_TYPE_SCOPE = "event_type"
+
+# Booking column each scope counts by
+SCOPE_COLUMNS = {HOST_SCOPE: "host_id", EVENT_TYPE_SCOPE: "event_type_id"}
+
+# Prisma filter for users / event types with at least one cap
+CAPPED = [{"maxBookingsPerDay": {"not": None}}, {"maxBookingsPerWeek": {"not": None}}]
+
+# Add one booking to each counter ({rows}: one VALUES tuple per counter),
+# creating counters at 1; returns the new counts
+COUNT_BOOKING_SQL = """
+INSERT INTO booking_counters (id, scope, scope_id, period, period_start, count, updated_at)
+VALUES {rows}
+ON CONFLICT (scope, scope_id, period, period_start) DO UPDATE
+    SET count = booking_counters.count + 1, updated_at = now()
+RETURNING scope, scope_id, period, period_start::text AS period_start, count
+"""
+
+# Take cancelled bookings off their counters ({rows}: one VALUES tuple per counter)
+UNCOUNT_BOOKINGS_SQL = """
+UPDATE booking_counters AS c
+SET count = GREATEST(c.count - v.n, 0), updated_at = now()
+FROM (VALUES {rows}) AS v(scope, scope_id, period, period_start, n)
+WHERE c.scope = v.scope
+  AND c.scope_id = v.scope_id
+  AND c.period = v.period
+  AND c.period_start = v.period_start
+"""
+
+DELETE_COUNTERS_SQL = """
+DELETE FROM booking_counters WHERE scope = $1 AND scope_id = $2
+"""
+
+# Recount a scope's CONFIRMED bookings per day and per week in zone $3.
+# A collective booking's rows share a group id and count once; periods that
+# ended before the current week are never checked again, so they are skipped.
+REBUILD_COUNTERS_SQL = """
+WITH counted AS (
+    SELECT
+        COALESCE(group_id, id) AS booking_key,
+        (start_time AT TIME ZONE 'UTC') AT TIME ZONE $3::text AS local_start
+    FROM bookings
+    WHERE {column} = $2
+      AND status = 'CONFIRMED'
+      AND start_time >= (now() AT TIME ZONE 'UTC') - interval '8 days'
+)
+INSERT INTO booking_counters (id, scope, scope_id, period, period_start, count, updated_at)
+SELECT gen_random_uuid()::text, $1::text, $2::text, period, period_start, count(DISTINCT booking_key), now()
+FROM (
+    SELECT booking_key, 'day' AS period, local_start::date AS period_start FROM counted
+    UNION ALL
+    SELECT booking_key, 'week' AS period, date_trunc('week', local_start)::date AS period_start FROM counted
+) periods
+GROUP BY period, period_start
+"""
+
+
+class BookingCapReached(Exception):
+    """A booking would take a host or event type over its daily or weekly cap."""
+
+
+class Cap(NamedTuple):
+    """One cap of a host or event type."""
+    scope: str      # "host" or "event_type"
+    scope_id: str
+    period: str     # "day" or "week"
+    limit: int
+    zone: str       # timezone the days are counted in
+
+    def key(self, start: datetime) -> CounterKey:
+        """Counter of the period a booking starting at `start` falls in."""
+        day = start.astimezone(get_zone(self.zone)).date()
+        if self.period == "week":
+            day -= timedelta(days=day.weekday())
+        return (self.scope, self.scope_id, self.period, day)
+
+
+def record_caps(scope: str, record, zone: str) -> List[Cap]:
+    """The caps set on a user or event type record."""
+    caps = []
+    if record.maxBookingsPerDay is not None:
+        caps.append(Cap(scope, record.id, "day", record.maxBookingsPerDay, zone))
+    if record.maxBookingsPerWeek is not None:
+        caps.append(Cap(scope, record.id, "week", record.maxBookingsPerWeek, zone))
+    return caps
+
+
+class BookingCaps(NamedTuple):
+    """Caps of some hosts and event types (only the capped ones are listed)."""
+    hosts: Dict[str, List[Cap]]
+    event_types: Dict[str, List[Cap]]
+
+    def for_booking(self, event_type_id: str, host_ids: Iterable[str]) -> List[Cap]:
+        """Caps a booking of the event type with these hosts counts against."""
+        caps = list(self.event_types.get(event_type_id, []))
+        for host_id in host_ids:
+            caps.extend(self.hosts.get(host_id, []))
+        return caps
+
+    def cancelled_keys(self, bookings: Iterable) -> Counter:
+        """Counter decrements for cancelled booking rows (the rows of one collective booking count once for the event type)."""
+        keys: Counter = Counter()
+        seen = set()
+        for booking in bookings:
+            for cap in self.hosts.get(booking.hostId, []):
+                keys[cap.key(booking.startTime)] += 1
+            booking_key = booking.groupId or booking.id
+            if booking_key not in seen:
+                seen.add(booking_key)
+                for cap in self.event_types.get(booking.eventTypeId, []):
+                    keys[cap.key(booking.startTime)] += 1
+        return keys
+
+
+async def default_zones(user_ids: Iterable[str]) -> Dict[str, str]:
+    """Each user's default schedule timezone (users without one are left out)."""
+    schedules = await prisma.availabilityschedule.find_many(
+        where={"userId": {"in": list(user_ids)}, "isDefault": True}
+    )
+    return {
+        schedule.userId: schedule.timezone if schedule.timezone and is_valid_timezone(schedule.timezone) else "UTC"
+        for schedule in schedules
+    }
+
+
+async def load_caps(host_ids: Iterable[str], event_types: Iterable, zones: Optional[Dict[str, str]] = None) -> BookingCaps:
+    """
+    Caps of the hosts and (already loaded) event types.
+
+    One query for the hosts' caps, plus one for the timezones missing from
+    `zones` (user id -> default schedule timezone) if anything is capped.
+    """
+    users = await prisma.user.find_many(
+        where={"id": {"in": list(host_ids)}, "OR": CAPPED}
+    )
+    capped_types = [
+        event_type for event_type in event_types
+        if event_type.maxBookingsPerDay is not None or event_type.maxBookingsPerWeek is not None
+    ]
+
+    zones = dict(zones or {})
+    missing = ({user.id for user in users} | {event_type.userId for event_type in capped_types}) - zones.keys()
+    if missing:
+        zones.update(await default_zones(missing))
+
+    return BookingCaps(
+        hosts={user.id: record_caps(HOST_SCOPE, user, zones.get(user.id, "UTC")) for user in users},
+        event_types={
+            event_type.id: record_caps(EVENT_TYPE_SCOPE, event_type, zones.get(event_type.userId, "UTC"))
+            for event_type in capped_types
+        }
+    )
+
+
+async def count_booking(client, caps: List[Cap], start: datetime) -> None:
+    """
+    Count a booking starting at `start` against its caps, inside the booking's transaction.
+
+    Raises BookingCapReached when a counter goes over its cap, which rolls
+    the transaction back.
+    """
+    limits = {cap.key(start): cap.limit for cap in caps}
+    # Counters are always locked in the same order, so transactions cannot deadlock on them
+    keys = sorted(limits)
+    rows = ", ".join(
+        f"(${n + 1}, ${n + 2}, ${n + 3}, ${n + 4}, ${n + 5}::date, 1, now())"
+        for n in range(0, 5 * len(keys), 5)
+    )
+    params = [value for key in keys for value in (str(uuid4()), *key[:3], key[3].isoformat())]
+    counts = await client.query_raw(COUNT_BOOKING_SQL.format(rows=rows), *params)
+    for row in counts:
+        key = (row["scope"], row["scope_id"], row["period"], date.fromisoformat(row["period_start"]))
+        if row["count"] > limits[key]:
+            raise BookingCapReached()
+
+
+async def uncount_bookings(client, keys: Counter) -> None:
+    """Take cancelled bookings off their counters (one statement)."""
+    keys = {key: n for key, n in keys.items() if n}
+    if not keys:
+        return
+    ordered = sorted(keys)
+    rows = ", ".join(
+        f"(${n + 1}::text, ${n + 2}::text, ${n + 3}::text, ${n + 4}::date, ${n + 5}::int)"
+        for n in range(0, 5 * len(ordered), 5)
+    )
+    params = [value for key in ordered for value in (*key[:3], key[3].isoformat(), keys[key])]
+    await client.execute_raw(UNCOUNT_BOOKINGS_SQL.format(rows=rows), *params)
+
+
+async def rebuild_counters(scope: str, scope_id: str, zone: str, capped: bool) -> None:
+    """Recount a scope's counters from its bookings, or drop them once it has no cap."""
+    async with prisma.tx() as transaction:
+        await transaction.execute_raw(DELETE_COUNTERS_SQL, scope, scope_id)
+        if capped:
+            await transaction.execute_raw(
+                REBUILD_COUNTERS_SQL.format(column=SCOPE_COLUMNS[scope]),
+                scope,
+                scope_id,
+                zone
+            )
+
+
+async def refresh_counters(host_ids: Iterable[str] = (), event_types: Iterable = ()) -> None:
+    """Rebuild the counters of these hosts and event types after their caps or timezones changed."""
+    host_ids = list(host_ids)
+    event_types = list(event_types)
+    users = await prisma.user.find_many(where={"id": {"in": host_ids}}) if host_ids else []
+    zones = await default_zones({user.id for user in users} | {event_type.userId for event_type in event_types})
+
+    for user in users:
+        await rebuild_counters(HOST_SCOPE, user.id, zones.get(user.id, "UTC"), bool(record_caps(HOST_SCOPE, user, "UTC")))
+    for event_type in event_types:
+        await rebuild_counters(
+            EVENT_TYPE_SCOPE,
+            event_type.id,
+            zones.get(event_type.userId, "UTC"),
+            bool(record_caps(EVENT_TYPE_SCOPE, event_type, "UTC"))
+        )
+
+
+async def refresh_user_counters(user_id: str) -> None:
+    """Rebuild a user's capped counters (as host and as event type owner) after their timezone changed."""
+    user = await prisma.user.find_unique(where={"id": user_id})
+    event_types = await prisma.eventtype.find_many(where={"userId": user_id, "OR": CAPPED})
+    host_ids = [user_id] if user is not None and record_caps(HOST_SCOPE, user, "UTC") else []
+    if host_ids or event_types:
+        await refresh_counters(host_ids, event_types)
+
+
+class CapUsage:
+    """Counters of capped hosts over a date range, for checking many slots."""
+
+    def __init__(self, caps_by_host: Dict[str, List[Cap]], counts: Dict[CounterKey, int]):
+        self.caps_by_host = caps_by_host
+        self.counts = counts
+
+    def full(self, host_id: str, start: datetime) -> bool:
+        """Whether a booking of `host_id` starting at `start` would go over a cap."""
+        return any(self.counts.get(cap.key(start), 0) >= cap.limit for cap in self.caps_by_host.get(host_id, ()))
+
+    def open_slots(self, host_ids: Iterable[str], slots: List[Interval]) -> List[Interval]:
+        """The slots none of the hosts has reached a cap for."""
+        host_ids = [host_id for host_id in host_ids if self.caps_by_host.get(host_id)]
+        return [slot for slot in slots if not any(self.full(host_id, slot[0]) for host_id in host_ids)]
+
+
+async def load_usage(
+    caps: BookingCaps,
+    event_type_id: str,
+    host_ids: List[str],
+    range_start: datetime,
+    range_end: datetime
+) -> Optional[CapUsage]:
+    """
+    The counters slots starting in [range_start, range_end) are checked against (one query).
+
+    None if neither the event type nor any of the hosts is capped.
+    """
+    caps_by_host = {host_id: caps.for_booking(event_type_id, [host_id]) for host_id in host_ids}
+    scopes = {(cap.scope, cap.scope_id) for host_caps in caps_by_host.values() for cap in host_caps}
+    if not scopes:
+        return None
+
+    # Local days can be a day off the UTC range, and weeks start up to 6 days earlier
+    counters = await prisma.bookingcounter.find_many(
+        where={
+            "OR": [{"scope": scope, "scopeId": scope_id} for scope, scope_id in scopes],
+            "periodStart": {
+                "gte": datetime.combine(range_start.date() - timedelta(days=7), time.min, tzinfo=dt_timezone.utc),
+                "lte": datetime.combine(range_end.date() + timedelta(days=1), time.min, tzinfo=dt_timezone.utc)
+            }
+        }
+    )
+    return CapUsage(
+        caps_by_host,
+        {
+            (counter.scope, counter.scopeId, counter.period, counter.periodStart.date()): counter.count
+            for counter in counters
+        }
+    )
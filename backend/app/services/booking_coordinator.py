@@ -0,0 +1,230 @@
+"""
+Booking coordinator - per-host booking queues with group commit.
+
+When many invitees book the same host at once, each `create_booking`
+would otherwise be its own insert racing the others on the database.
+Instead, single-host bookings are queued per host and a worker task
+drains the queue in batches:
+
+1. Requests are checked against the host's booking index and against
+   earlier requests of the same batch, in arrival order. Slots the index
+   reports as taken are confirmed with one query for the whole batch.
+2. The remaining bookings are written in one transaction (one
+   `create_many`), and every waiting request gets its booking back.
+
+While a batch commits, new requests queue up and form the next batch, so
+no latency is added to a lone request. The database's overlap constraint
+stays the final word: if another worker process took one of the slots
+the batch is retried one booking at a time.
+
+Queues live in process memory, so each worker process has its own.
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from app.core.config import settings
+from app.core.database import prisma
+from app.services.booking_index import booking_index
+
+# Exclusion constraint keeping a host's CONFIRMED bookings from overlapping
+# (prisma/sql/booking_no_overlap.sql); Postgres reports violations as SQLSTATE 23P01
+BOOKING_OVERLAP_CONSTRAINT = "bookings_host_no_overlap"
+
+
+CONSTRAINT_EXISTS_SQL = "SELECT 1 FROM pg_constraint WHERE conname = $1"
+
+
+async def require_overlap_constraint(client) -> None:
+    """
+    Refuse to start without the overlap constraint (REQUIRE_OVERLAP_CONSTRAINT=false only warns).
+
+    Bookings are not checked for conflicts before they are written; the
+    constraint is what keeps them from overlapping. It is added by the
+    release step (migrate.sh), never at startup.
+    """
+    if await client.query_raw(CONSTRAINT_EXISTS_SQL, BOOKING_OVERLAP_CONSTRAINT):
+        return
+    message = f"Database constraint {BOOKING_OVERLAP_CONSTRAINT} is missing: run `./migrate.sh`"
+    if settings.require_overlap_constraint:
+        raise RuntimeError(message)
+    print(f"⚠️  {message} (bookings can overlap until then)")
+
+
+class SlotUnavailable(Exception):
+    """The requested time overlaps a CONFIRMED booking of the host."""
+
+
+def is_booking_overlap(error: Exception) -> bool:
+    """Whether a failed write was rejected by the booking overlap constraint."""
+    message = str(error)
+    return BOOKING_OVERLAP_CONSTRAINT in message or "23P01" in message
+
+
+class BookingRequest:
+    """One queued booking and the future its caller is waiting on."""
+    __slots__ = ("start", "end", "data", "future")
+
+    def __init__(self, start: datetime, end: datetime, data: Dict[str, Any], future: asyncio.Future):
+        self.start = start
+        self.end = end
+        self.data = data
+        self.future = future
+
+    def overlaps(self, other: "BookingRequest") -> bool:
+        return self.start < other.end and other.start < self.end
+
+    def resolve(self, booking=None, error: Optional[Exception] = None) -> None:
+        # The caller may have gone away (cancelled request)
+        if self.future.done():
+            return
+        if error is not None:
+            self.future.set_exception(error)
+        else:
+            self.future.set_result(booking)
+
+
+class BookingCoordinator:
+    """Per-host booking queues, each drained by one worker task at a time."""
+
+    def __init__(self, max_batch: int, enabled: bool = True):
+        self.max_batch = max_batch
+        self.enabled = enabled
+        self._pending: Dict[str, List[BookingRequest]] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self.batches = 0
+        self.committed = 0
+        self.rejected = 0
+        self.fallbacks = 0
+
+    async def submit(self, host_id: str, start: datetime, end: datetime, data: Dict[str, Any]):
+        """Queue a CONFIRMED booking of `host_id` and wait for it to be written."""
+        request = BookingRequest(start, end, data, asyncio.get_running_loop().create_future())
+        self._pending.setdefault(host_id, []).append(request)
+        if host_id not in self._workers:
+            self._workers[host_id] = asyncio.create_task(self._drain(host_id))
+        return await request.future
+
+    async def _drain(self, host_id: str) -> None:
+        """Commit the host's queued bookings batch by batch until the queue is empty."""
+        try:
+            while self._pending.get(host_id):
+                pending = self._pending[host_id]
+                batch = pending[:self.max_batch]
+                del pending[:self.max_batch]
+                try:
+                    await self._commit(host_id, batch)
+                except Exception as error:
+                    for request in batch:
+                        request.resolve(error=error)
+        finally:
+            self._workers.pop(host_id, None)
+            if not self._pending.get(host_id):
+                self._pending.pop(host_id, None)
+
+    async def _taken_slots(self, host_id: str, batch: List[BookingRequest]) -> List[bool]:
+        """Per request, whether it overlaps a CONFIRMED booking already in the database."""
+        index = await booking_index.get(host_id)
+        if index is None:
+            return [False] * len(batch)
+
+        flagged = [
+            index.covers(request.start) and index.overlaps(request.start, request.end)
+            for request in batch
+        ]
+        if not any(flagged):
+            return flagged
+
+        # Confirm what the index reports with one query for the whole batch
+        suspects = [request for request, flag in zip(batch, flagged) if flag]
+        rows = await prisma.booking.find_many(
+            where={
+                "hostId": host_id,
+                "status": "CONFIRMED",
+                "startTime": {"lt": max(request.end for request in suspects)},
+                "endTime": {"gt": min(request.start for request in suspects)}
+            }
+        )
+        taken = [
+            flag and any(row.startTime < request.end and row.endTime > request.start for row in rows)
+            for request, flag in zip(batch, flagged)
+        ]
+        if taken != flagged:
+            booking_index.invalidate_host(host_id, mismatch=True)
+        return taken
+
+    async def _commit(self, host_id: str, batch: List[BookingRequest]) -> None:
+        """Reject conflicting requests and write the rest in one transaction."""
+        self.batches += 1
+        # Skip callers that have gone away while queued
+        batch = [request for request in batch if not request.future.done()]
+        accepted: List[BookingRequest] = []
+        for request, taken in zip(batch, await self._taken_slots(host_id, batch)):
+            if taken or any(request.overlaps(other) for other in accepted):
+                self.rejected += 1
+                request.resolve(error=SlotUnavailable())
+            else:
+                accepted.append(request)
+        if not accepted:
+            return
+
+        for request in accepted:
+            request.data = {**request.data, "id": str(uuid4())}
+        try:
+            async with prisma.tx() as transaction:
+                await transaction.booking.create_many(data=[request.data for request in accepted])
+                rows = await transaction.booking.find_many(
+                    where={"id": {"in": [request.data["id"] for request in accepted]}}
+                )
+        except Exception as error:
+            if not is_booking_overlap(error):
+                raise
+            # Another process booked one of these slots: find out which, one insert at a time
+            self.fallbacks += 1
+            await self._commit_each(host_id, accepted)
+            return
+
+        by_id = {row.id: row for row in rows}
+        for request in accepted:
+            self._committed(host_id, request, by_id[request.data["id"]])
+
+    async def _commit_each(self, host_id: str, requests: List[BookingRequest]) -> None:
+        for request in requests:
+            try:
+                booking = await prisma.booking.create(data=request.data)
+            except Exception as error:
+                if not is_booking_overlap(error):
+                    request.resolve(error=error)
+                    continue
+                self.rejected += 1
+                booking_index.booking_rejected(host_id, request.start, request.end)
+                request.resolve(error=SlotUnavailable())
+            else:
+                self._committed(host_id, request, booking)
+
+    def _committed(self, host_id: str, request: BookingRequest, booking) -> None:
+        # Index the booking before the next batch is checked
+        booking_index.add_booking(host_id, booking.id, booking.startTime, booking.endTime)
+        self.committed += 1
+        request.resolve(booking)
+
+    def stats(self) -> dict:
+        """Batch/commit/reject counters and queue depth."""
+        return {
+            "enabled": self.enabled,
+            "max_batch": self.max_batch,
+            "active_hosts": len(self._workers),
+            "queued": sum(len(pending) for pending in self._pending.values()),
+            "batches": self.batches,
+            "committed": self.committed,
+            "rejected": self.rejected,
+            "fallbacks": self.fallbacks,
+        }
+
+
+# Global coordinator instance
+booking_coordinator = BookingCoordinator(
+    max_batch=settings.booking_batch_max,
+    enabled=settings.booking_coordinator_enabled
+)
@@ -0,0 +1,129 @@
+"""
+Bulk booking import - parse NDJSON/CSV rows and find the ones that can be booked.
+
+`POST /meetings/import` streams its body through `read_rows`, which
+yields one dict per line (NDJSON objects, or CSV rows keyed by the header
+line). Once the rows are validated, `split_conflicts` sorts them by start
+time and walks them together with the host's existing CONFIRMED bookings
+(already sorted) in a single merge pass: a row is rejected if it overlaps
+an existing booking or an earlier accepted row. Cancelled rows (as in a
+`GET /meetings/export` file) are imported as cancelled and never conflict.
+"""
+import csv
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from app.services.meeting_export import CSV_TEXT_COLUMNS, csv_unescape
+
+Interval = Tuple[datetime, datetime]
+
+# Rows per `create_many` when inserting accepted bookings
+IMPORT_CHUNK_SIZE = 1000
+
+
+class ImportRow(NamedTuple):
+    """A validated import row (times in UTC)."""
+    row: int                # 1-based data row number in the upload
+    event_type_id: str
+    start: datetime
+    end: datetime
+    invitee_name: str
+    invitee_email: str
+    invitee_timezone: str
+    guests: List[str]
+    cancelled_at: Optional[datetime] = None     # set for cancelled rows
+    cancel_reason: Optional[str] = None
+
+
+class ImportReject(NamedTuple):
+    row: int
+    reason: str
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream into lines without reading it all first."""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8-sig").rstrip("\r")
+    if pending:
+        yield pending.decode("utf-8-sig").rstrip("\r")
+
+
+async def read_rows(
+    chunks: AsyncIterator[bytes],
+    file_format: str
+) -> AsyncIterator[Tuple[int, Union[Dict[str, Any], str]]]:
+    """
+    Yield (row number, fields) per non-blank data line, or (row number, error).
+
+    CSV rows are read line by line (quoted fields cannot span lines); a
+    `guests` column holds `;`-separated emails, and free-text columns drop
+    the `'` an export puts before a formula prefix.
+    """
+    header: Optional[List[str]] = None
+    row = 0
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        if file_format == "csv" and header is None:
+            header = [name.strip() for name in next(csv.reader([line]))]
+            continue
+
+        row += 1
+        if file_format == "ndjson":
+            try:
+                fields = json.loads(line)
+            except ValueError:
+                yield row, "Invalid JSON"
+                continue
+            if not isinstance(fields, dict):
+                yield row, "Expected a JSON object"
+                continue
+        else:
+            values = next(csv.reader([line]))
+            if len(values) != len(header):
+                yield row, f"Expected {len(header)} columns, got {len(values)}"
+                continue
+            fields = {name: value for name, value in zip(header, values) if value != ""}
+            for name in CSV_TEXT_COLUMNS:
+                if name in fields:
+                    fields[name] = csv_unescape(fields[name])
+            if "guests" in fields:
+                fields["guests"] = [email.strip() for email in fields["guests"].split(";") if email.strip()]
+        yield row, fields
+
+
+def split_conflicts(
+    rows: Sequence[ImportRow],
+    existing: Sequence[Interval]
+) -> Tuple[List[ImportRow], List[ImportReject]]:
+    """
+    Accept the rows that overlap neither `existing` nor each other.
+
+    `existing` are the host's CONFIRMED bookings sorted by start. Rows
+    are taken in start order, so of two overlapping rows the earlier one
+    wins.
+    """
+    accepted: List[ImportRow] = []
+    rejects: List[ImportReject] = []
+    position = 0
+    last: Optional[ImportRow] = None
+
+    for row in sorted(rows, key=lambda item: (item.start, item.end, item.row)):
+        # Existing bookings that end before this row cannot overlap any later row either
+        while position < len(existing) and existing[position][1] <= row.start:
+            position += 1
+
+        if position < len(existing) and existing[position][0] < row.end:
+            rejects.append(ImportReject(row.row, "Overlaps an existing booking"))
+        elif last is not None and row.start < last.end:
+            rejects.append(ImportReject(row.row, f"Overlaps row {last.row}"))
+        else:
+            accepted.append(row)
+            last = row
+
+    return accepted, rejects
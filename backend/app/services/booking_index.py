@@ -0,0 +1,222 @@
+"""
+Booking index - per-host in-memory interval index of CONFIRMED bookings.
+
+Conflict checks and slot generation both need a host's bookings around a
+time range. Instead of querying them on every request, each host's
+upcoming CONFIRMED bookings are loaded once into sorted `array`s of epoch
+microseconds, kept up to date on create/cancel, and searched with bisect.
+
+The database stays the source of truth: an index is only trusted for a
+short TTL, it covers bookings ending after its load-time horizon (older
+ranges go to the database), and callers drop it with `invalidate_host`
+(or `booking_rejected`) when they notice it disagrees with the database.
+
+The index lives in process memory, so each worker keeps its own copy.
+"""
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.database import prisma
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch(moment: datetime) -> int:
+    """Epoch microseconds of an aware datetime (naive values are taken as UTC)."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=dt_timezone.utc)
+    return (moment - EPOCH) // MICROSECOND
+
+
+def _from_epoch(value: int) -> datetime:
+    return EPOCH + MICROSECOND * value
+
+
+class HostBookingIndex:
+    """
+    Sorted CONFIRMED bookings of one host.
+
+    `starts`, `ends` and `ids` are parallel and ordered by start time.
+    `max_ends[i]` is the latest end among the first i + 1 bookings, which
+    keeps overlap checks O(log n) even if bookings overlap each other.
+    """
+    __slots__ = ("host_id", "horizon", "loaded_at", "ids", "starts", "ends", "max_ends")
+
+    def __init__(self, host_id: str, horizon: datetime, bookings: List[Tuple[str, datetime, datetime]]):
+        self.host_id = host_id
+        self.horizon = _to_epoch(horizon)
+        self.loaded_at = time.monotonic()
+        bookings = sorted((_to_epoch(start), _to_epoch(end), booking_id) for booking_id, start, end in bookings)
+        self.starts = array("q", (start for start, _, _ in bookings))
+        self.ends = array("q", (end for _, end, _ in bookings))
+        self.ids = [booking_id for _, _, booking_id in bookings]
+        self.max_ends = array("q")
+        self._rebuild_max_ends(0)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _rebuild_max_ends(self, position: int) -> None:
+        del self.max_ends[position:]
+        running = self.max_ends[-1] if self.max_ends else -1 << 62
+        for end in self.ends[position:]:
+            running = max(running, end)
+            self.max_ends.append(running)
+
+    def covers(self, moment: datetime) -> bool:
+        """Whether every booking ending after `moment` is in the index."""
+        return _to_epoch(moment) >= self.horizon
+
+    def add(self, booking_id: str, start: datetime, end: datetime) -> None:
+        """Insert a booking, keeping the arrays sorted."""
+        start_us, end_us = _to_epoch(start), _to_epoch(end)
+        if end_us <= self.horizon:
+            return
+        position = bisect_right(self.starts, start_us)
+        self.starts.insert(position, start_us)
+        self.ends.insert(position, end_us)
+        self.ids.insert(position, booking_id)
+        self._rebuild_max_ends(position)
+
+    def remove(self, booking_id: str) -> bool:
+        """Remove a booking; returns False if it was not indexed."""
+        try:
+            position = self.ids.index(booking_id)
+        except ValueError:
+            return False
+        del self.starts[position]
+        del self.ends[position]
+        del self.ids[position]
+        self._rebuild_max_ends(position)
+        return True
+
+    def _candidates(self, start_us: int, end_us: int) -> range:
+        """Positions of bookings that may overlap [start, end)."""
+        # Bookings starting before `end`, after the first whose running max end passes `start`
+        return range(bisect_right(self.max_ends, start_us), bisect_left(self.starts, end_us))
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        """Whether any indexed booking overlaps [start, end)."""
+        start_us, end_us = _to_epoch(start), _to_epoch(end)
+        position = bisect_left(self.starts, end_us)
+        return position > 0 and self.max_ends[position - 1] > start_us
+
+    def intervals(self, start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+        """The (start, end) of every indexed booking overlapping [start, end), by start."""
+        start_us, end_us = _to_epoch(start), _to_epoch(end)
+        return [
+            (_from_epoch(self.starts[position]), _from_epoch(self.ends[position]))
+            for position in self._candidates(start_us, end_us)
+            if self.ends[position] > start_us
+        ]
+
+
+class BookingIndex:
+    """Lazily loaded `HostBookingIndex` per host, with a TTL and write tracking."""
+
+    def __init__(self, ttl_seconds: float, lookback: timedelta, enabled: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.lookback = lookback
+        self.enabled = enabled
+        self._hosts: Dict[str, HostBookingIndex] = {}
+        self._writes: Dict[str, int] = {}
+        self.loads = 0
+        self.hits = 0
+        self.mismatches = 0
+
+    async def get(self, host_id: str) -> Optional[HostBookingIndex]:
+        """Return the host's index, loading it from the database if missing or expired."""
+        if not self.enabled:
+            return None
+
+        index = self._hosts.get(host_id)
+        if index is not None and time.monotonic() - index.loaded_at < self.ttl_seconds:
+            self.hits += 1
+            return index
+        return await self.rebuild(host_id)
+
+    async def rebuild(self, host_id: str) -> HostBookingIndex:
+        """Load a host's bookings that end after now - lookback."""
+        writes = self._writes.get(host_id, 0)
+        horizon = datetime.now(dt_timezone.utc) - self.lookback
+        bookings = await prisma.booking.find_many(
+            where={
+                "hostId": host_id,
+                "status": "CONFIRMED",
+                "endTime": {"gt": horizon}
+            }
+        )
+        index = HostBookingIndex(
+            host_id,
+            horizon,
+            [(booking.id, booking.startTime, booking.endTime) for booking in bookings]
+        )
+        self.loads += 1
+
+        # A booking written while the query ran may be missing: use the index
+        # for this request only and load again next time
+        if self._writes.get(host_id, 0) == writes:
+            self._hosts[host_id] = index
+        return index
+
+    def add_booking(self, host_id: str, booking_id: str, start: datetime, end: datetime) -> None:
+        """Record a new CONFIRMED booking."""
+        self._writes[host_id] = self._writes.get(host_id, 0) + 1
+        index = self._hosts.get(host_id)
+        if index is not None:
+            index.add(booking_id, start, end)
+
+    def remove_booking(self, host_id: str, booking_id: str, end: datetime) -> None:
+        """Record a cancelled booking; a booking the index should hold but lacks forces a reload."""
+        self._writes[host_id] = self._writes.get(host_id, 0) + 1
+        index = self._hosts.get(host_id)
+        if index is not None and not index.remove(booking_id) and _to_epoch(end) > index.horizon:
+            self.invalidate_host(host_id, mismatch=True)
+
+    def booking_rejected(self, host_id: str, start: datetime, end: datetime) -> None:
+        """
+        Record a booking the database rejected as overlapping.
+
+        An index that saw no overlap missed a booking and is reloaded. For
+        team bookings the conflicting host is not known, so this applies to
+        each host of the booking.
+        """
+        index = self._hosts.get(host_id)
+        if index is not None and index.covers(start) and not index.overlaps(start, end):
+            self.invalidate_host(host_id, mismatch=True)
+
+    def invalidate_host(self, host_id: str, mismatch: bool = False) -> None:
+        """Drop a host's index so the next lookup reloads it from the database."""
+        self._writes[host_id] = self._writes.get(host_id, 0) + 1
+        self._hosts.pop(host_id, None)
+        if mismatch:
+            self.mismatches += 1
+
+    def clear(self) -> None:
+        """Drop every host's index."""
+        self._hosts.clear()
+
+    def stats(self) -> dict:
+        """Load/hit/mismatch counters and index sizes."""
+        return {
+            "enabled": self.enabled,
+            "hosts": len(self._hosts),
+            "bookings": sum(len(index) for index in self._hosts.values()),
+            "ttl_seconds": self.ttl_seconds,
+            "loads": self.loads,
+            "hits": self.hits,
+            "mismatches": self.mismatches,
+        }
+
+
+# Global index instance
+booking_index = BookingIndex(
+    ttl_seconds=settings.booking_index_ttl_seconds,
+    lookback=timedelta(hours=settings.booking_index_lookback_hours),
+    enabled=settings.booking_index_enabled
+)
@@ -0,0 +1,115 @@
+"""
+Calendar feed cache - rendered per-host ICS feeds, updated incrementally.
+
+Calendar apps poll a host's feed (`GET /public/feeds/{token}.ics`) every
+few minutes. The feed's version is the host's latest `Booking.updatedAt`,
+together with the latest update of its event types (their names are in
+the event summaries) and the host's `bookingsResetAt` (moved when an
+event type and its bookings are deleted). It is the ETag and
+Last-Modified of the response, so a poll with an unchanged version gets
+a 304 without rendering or reading any booking.
+
+A transaction can commit a little after a later-stamped one, so a
+version whose latest booking is younger than the settle time is not
+settled: it carries its read time, never matches a conditional GET and
+is never reused. When only the bookings moved, the bookings updated
+since the settle time before the cached version are rendered again and
+swapped into the cached events; any other change renders the whole feed
+again. Feeds live in process memory (at most
+CALENDAR_FEED_CACHE_MAX_ENTRIES hosts, least recently used evicted first),
+so each worker keeps its own.
+"""
+from collections import OrderedDict
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, NamedTuple, Optional
+
+from app.core.config import settings
+from app.services.meeting_export import ICS_FOOTER, ICS_HEADER
+
+
+class FeedVersion(NamedTuple):
+    """Latest booking and event type updates of a host (None: no rows), and its bookings reset."""
+    bookings: Optional[datetime]
+    event_types: Optional[datetime]
+    reset: datetime
+    unsettled_at: Optional[datetime] = None  # read time, while the latest booking is within the settle time
+
+    @property
+    def last_modified(self) -> datetime:
+        return max(stamp for stamp in self[:3] if stamp is not None)
+
+    def etag(self, host_id: str) -> str:
+        parts = [str(int(stamp.timestamp() * 1000)) if stamp else "0" for stamp in self]
+        return f'W/"{host_id}-{"-".join(parts)}"'
+
+    def http_date(self) -> str:
+        return formatdate(self.last_modified.timestamp(), usegmt=True)
+
+    def unchanged_for(self, host_id: str, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+        """Whether a conditional GET already has this version (If-None-Match wins over If-Modified-Since)."""
+        if self.unsettled_at is not None:
+            return False
+        if if_none_match is not None:
+            # Weak comparison: W/"x" matches "x"
+            opaque = self.etag(host_id)[2:]
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return any(tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == opaque for tag in tags)
+
+        if not if_modified_since:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have whole seconds
+        return since.tzinfo is not None and int(self.last_modified.timestamp()) <= since.timestamp()
+
+
+class CachedFeed(NamedTuple):
+    version: FeedVersion
+    events: Dict[str, str]     # booking id -> VEVENT
+    body: bytes
+
+
+def assemble(version: FeedVersion, events: Dict[str, str]) -> CachedFeed:
+    """The full calendar around the rendered events."""
+    body = (ICS_HEADER + "".join(events.values()) + ICS_FOOTER).encode("utf-8")
+    return CachedFeed(version, events, body)
+
+
+class CalendarFeedCache:
+    """LRU map of host id to its last rendered feed."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._feeds: "OrderedDict[str, CachedFeed]" = OrderedDict()
+        self.full_renders = 0
+        self.incremental_renders = 0
+        self.not_modified = 0
+
+    def get(self, host_id: str) -> Optional[CachedFeed]:
+        feed = self._feeds.get(host_id)
+        if feed is not None:
+            self._feeds.move_to_end(host_id)
+        return feed
+
+    def put(self, host_id: str, feed: CachedFeed) -> None:
+        self._feeds[host_id] = feed
+        self._feeds.move_to_end(host_id)
+        while len(self._feeds) > self.max_entries:
+            self._feeds.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Cached feed count and render counters."""
+        return {
+            "entries": len(self._feeds),
+            "max_entries": self.max_entries,
+            "full_renders": self.full_renders,
+            "incremental_renders": self.incremental_renders,
+            "not_modified": self.not_modified,
+        }
+
+
+# Global calendar feed cache instance
+calendar_feed_cache = CalendarFeedCache(max_entries=settings.calendar_feed_cache_max_entries)
@@ -0,0 +1,122 @@
+"""
+Idempotency store - replay the first response of a retried request.
+
+Clients send an `Idempotency-Key` header with `POST /public/bookings`. The
+first request with a key runs and its response is kept for
+IDEMPOTENCY_TTL_SECONDS; retries with the same key get that response back
+instead of booking again (or hitting a 409 for their own booking).
+Duplicates that arrive while the first request is still running wait for
+its outcome rather than running in parallel. Keys are scoped per endpoint,
+so the same key sent to two endpoints names two requests.
+
+Failed requests are not kept: their waiters see the same error, and the
+next retry runs again. If the first request is cancelled (its client went
+away), one waiting duplicate runs in its place. Reusing a key with a
+different request body is rejected.
+
+Entries live in process memory (at most IDEMPOTENCY_MAX_ENTRIES, oldest
+evicted first), so each worker process keeps its own.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, NamedTuple, Tuple
+
+from app.core.config import settings
+
+
+class IdempotencyKeyReused(Exception):
+    """The key was already used for a request with a different body."""
+
+
+class IdempotencyEntry(NamedTuple):
+    fingerprint: str
+    created_at: float
+    future: asyncio.Future
+
+
+class IdempotencyStore:
+    """Bounded, TTL-expiring map of idempotency key to (in-flight or finished) response."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], IdempotencyEntry]" = OrderedDict()
+        self.runs = 0
+        self.replays = 0
+
+    def _evict(self) -> None:
+        """Drop expired entries, and the oldest ones beyond the size limit (in-flight entries stay)."""
+        now = time.monotonic()
+        while self._entries:
+            entry = next(iter(self._entries.values()))
+            expired = now - entry.created_at >= self.ttl_seconds
+            if entry.future.done() and (expired or len(self._entries) > self.max_entries):
+                self._entries.popitem(last=False)
+            else:
+                break
+
+    async def run(
+        self,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        operation: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        Run `operation` once per key of `scope` (the endpoint) and return (result, replayed).
+
+        A retry gets the stored result (replayed=True); a duplicate of an
+        in-flight request waits for it, and runs itself if that request is
+        cancelled.
+        """
+        key = (scope, key)
+        while True:
+            self._evict()
+            entry = self._entries.get(key)
+            if entry is None:
+                break
+            if entry.fingerprint != fingerprint:
+                raise IdempotencyKeyReused()
+            # Unlike awaiting the future, wait() only raises if this request is cancelled
+            await asyncio.wait({entry.future})
+            if not entry.future.cancelled():
+                self.replays += 1
+                return entry.future.result(), True
+            # The owner was cancelled and dropped its entry: take over
+
+        future = asyncio.get_running_loop().create_future()
+        self._entries[key] = IdempotencyEntry(fingerprint, time.monotonic(), future)
+        self.runs += 1
+        try:
+            result = await operation()
+        except BaseException as error:
+            # Not kept: the next retry runs again
+            if key in self._entries and self._entries[key].future is future:
+                del self._entries[key]
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+                future.exception()  # retrieved here, so a request nobody waited on logs no warning
+            raise
+
+        future.set_result(result)
+        return result, False
+
+    def stats(self) -> dict:
+        """Run/replay counters and entry count."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "runs": self.runs,
+            "replays": self.replays,
+        }
+
+
+# Global idempotency store instance
+idempotency_store = IdempotencyStore(
+    ttl_seconds=settings.idempotency_ttl_seconds,
+    max_entries=settings.idempotency_max_entries
+)
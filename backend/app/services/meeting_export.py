@@ -0,0 +1,151 @@
+"""
+Meeting export - CSV rows and iCalendar (RFC 5545) events for bookings.
+
+`GET /meetings/export` reads the host's bookings in keyset-ordered
+batches and streams each batch through these formatters, so an export
+never holds more than one batch in memory. The CSV columns are a
+superset of the `POST /meetings/import` columns, status included, so an
+export can be imported again. Free text that a spreadsheet would
+evaluate as a formula is prefixed with `'`, which the import strips again;
+emails are left as they are so they import unchanged.
+"""
+import csv
+import io
+from datetime import datetime, timezone as dt_timezone
+from typing import Iterable, Optional
+
+# Bookings read per database round trip while exporting
+EXPORT_BATCH_SIZE = 500
+
+CSV_COLUMNS = [
+    "id",
+    "event_type_id",
+    "event_type_name",
+    "start_time",
+    "end_time",
+    "invitee_name",
+    "invitee_email",
+    "invitee_timezone",
+    "guests",
+    "status",
+    "cancelled_at",
+    "cancel_reason",
+    "created_at",
+]
+
+ICS_HEADER = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//Calendly Clone//Meetings//EN\r\n"
+    "CALSCALE:GREGORIAN\r\n"
+    "METHOD:PUBLISH\r\n"
+)
+ICS_FOOTER = "END:VCALENDAR\r\n"
+
+
+def _iso(moment: Optional[datetime]) -> str:
+    return moment.astimezone(dt_timezone.utc).isoformat() if moment else ""
+
+
+def csv_lines(rows: Iterable[list]) -> str:
+    """Rows as CSV text (quoted where needed, CRLF line ends)."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def csv_header() -> str:
+    return csv_lines([CSV_COLUMNS])
+
+
+# Free-text columns, the ones escaped against CSV injection
+CSV_TEXT_COLUMNS = ("event_type_name", "invitee_name", "cancel_reason")
+
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_text(value: str) -> str:
+    """Quote text that a spreadsheet would run as a formula (CSV injection)."""
+    # Text already quoted that way gets one more quote, so the import keeps it
+    return "'" + value if value.lstrip("'").startswith(FORMULA_PREFIXES) else value
+
+
+def csv_unescape(value: str) -> str:
+    """Undo `_csv_text`: drop the `'` it added."""
+    return value[1:] if value.startswith("'") and value.lstrip("'").startswith(FORMULA_PREFIXES) else value
+
+
+def csv_row(booking, status: str, event_type_name: str) -> list:
+    """One booking's CSV values, in CSV_COLUMNS order (guests `;`-separated like the import)."""
+    return [
+        booking.id,
+        booking.eventTypeId,
+        _csv_text(event_type_name),
+        _iso(booking.startTime),
+        _iso(booking.endTime),
+        _csv_text(booking.inviteeName),
+        booking.inviteeEmail,
+        booking.inviteeTimezone,
+        ";".join(booking.guests or []),
+        status,
+        _iso(booking.cancelledAt),
+        _csv_text(booking.cancelReason or ""),
+        _iso(booking.createdAt),
+    ]
+
+
+def _ics_time(moment: datetime) -> str:
+    return moment.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _ics_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _ics_param(value: str) -> str:
+    """A quoted parameter value cannot hold quotes or line breaks."""
+    return value.replace('"', "'").replace("\r", " ").replace("\n", " ")
+
+
+def _ics_line(line: str) -> str:
+    """Fold a content line at 75 octets (continuation lines start with a space)."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Never split a UTF-8 sequence
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def ics_event(booking, status: str, event_type_name: str) -> str:
+    """A VEVENT for one booking; cancelled bookings stay in as STATUS:CANCELLED."""
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{booking.id}",
+        f"DTSTAMP:{_ics_time(booking.updatedAt)}",
+        f"DTSTART:{_ics_time(booking.startTime)}",
+        f"DTEND:{_ics_time(booking.endTime)}",
+        f"SUMMARY:{_ics_text(f'{event_type_name} with {booking.inviteeName}')}",
+        f"ATTENDEE;CN=\"{_ics_param(booking.inviteeName)}\":mailto:{booking.inviteeEmail}",
+    ]
+    lines.extend(f"ATTENDEE:mailto:{guest}" for guest in booking.guests or [])
+    lines.append("STATUS:CANCELLED" if status == "cancelled" else "STATUS:CONFIRMED")
+    if booking.cancelReason:
+        lines.append(f"DESCRIPTION:{_ics_text(f'Cancelled: {booking.cancelReason}')}")
+    lines.append("END:VEVENT")
+    return "".join(_ics_line(line) for line in lines)
@@ -0,0 +1,141 @@
+"""
+Round-robin host assignment - per-pool heap of host booking counts.
+
+A round-robin event type assigns each booking to the eligible (free)
+host with the fewest CONFIRMED bookings of that event type in the
+current window (bookings starting after now - ROUND_ROBIN_WINDOW_DAYS);
+ties go to the host assigned least recently.
+
+Counts are loaded once per pool with a single grouped query and then
+maintained incrementally on create/cancel. The heap uses lazy deletion:
+a changed count pushes a fresh entry and stale entries are skipped when
+they surface. The window start moves with the clock, so pools are
+reloaded after a TTL.
+
+Pools live in process memory, so each worker keeps its own copy.
+"""
+import heapq
+import itertools
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.database import prisma
+
+
+class HostPool:
+    """Booking counts of one round-robin event type's hosts, in a min-heap."""
+    __slots__ = ("event_type_id", "window_start", "loaded_at", "counts", "last_assigned", "heap", "_sequence")
+
+    def __init__(self, event_type_id: str, window_start: datetime, counts: Dict[str, int]):
+        self.event_type_id = event_type_id
+        self.window_start = window_start
+        self.loaded_at = time.monotonic()
+        self.counts = dict(counts)
+        self.last_assigned = {host_id: 0 for host_id in counts}
+        self._sequence = itertools.count(1)
+        self.heap: List[Tuple[int, int, str]] = [(count, 0, host_id) for host_id, count in counts.items()]
+        heapq.heapify(self.heap)
+
+    def _push(self, host_id: str) -> None:
+        heapq.heappush(self.heap, (self.counts[host_id], self.last_assigned[host_id], host_id))
+        # Compact once stale entries dominate
+        if len(self.heap) > 4 * len(self.counts):
+            self.heap = [entry for entry in self.heap if self._is_current(entry)]
+            heapq.heapify(self.heap)
+
+    def _is_current(self, entry: Tuple[int, int, str]) -> bool:
+        count, assigned, host_id = entry
+        return self.counts.get(host_id) == count and self.last_assigned.get(host_id) == assigned
+
+    def choose(self, eligible: Iterable[str]) -> Optional[str]:
+        """Pick the least-loaded eligible host and count the booking against it."""
+        eligible = set(eligible)
+        skipped = []
+        chosen = None
+        while self.heap:
+            entry = heapq.heappop(self.heap)
+            if not self._is_current(entry):
+                continue  # stale entry, a newer one is in the heap
+            if entry[2] in eligible:
+                chosen = entry[2]
+                break
+            skipped.append(entry)
+
+        for entry in skipped:
+            heapq.heappush(self.heap, entry)
+
+        if chosen is not None:
+            self.counts[chosen] += 1
+            self.last_assigned[chosen] = next(self._sequence)
+            self._push(chosen)
+        return chosen
+
+    def peek(self, eligible: Iterable[str]) -> Optional[str]:
+        """The host `choose` would pick now, without counting a booking against it."""
+        candidates = [host_id for host_id in eligible if host_id in self.counts]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda host_id: (self.counts[host_id], self.last_assigned[host_id], host_id))
+
+    def adjust(self, host_id: str, delta: int) -> None:
+        """Change a host's count by `delta` (a cancelled booking, or a failed assignment)."""
+        if host_id in self.counts:
+            self.counts[host_id] = max(0, self.counts[host_id] + delta)
+            self._push(host_id)
+
+
+class HostLoadBalancer:
+    """Lazily loaded `HostPool` per round-robin event type."""
+
+    def __init__(self, window: timedelta, ttl_seconds: float):
+        self.window = window
+        self.ttl_seconds = ttl_seconds
+        self._pools: Dict[str, HostPool] = {}
+
+    async def get_pool(self, event_type_id: str, host_ids: Sequence[str]) -> HostPool:
+        """Return the pool for an event type, (re)loading it if missing, expired or the hosts changed."""
+        pool = self._pools.get(event_type_id)
+        if (
+            pool is not None
+            and time.monotonic() - pool.loaded_at < self.ttl_seconds
+            and pool.counts.keys() == set(host_ids)
+        ):
+            return pool
+
+        window_start = datetime.now(dt_timezone.utc) - self.window
+        groups = await prisma.booking.group_by(
+            ["hostId"],
+            where={
+                "eventTypeId": event_type_id,
+                "hostId": {"in": list(host_ids)},
+                "status": "CONFIRMED",
+                "startTime": {"gte": window_start}
+            },
+            count=True
+        )
+        counts = {host_id: 0 for host_id in host_ids}
+        for group in groups:
+            counts[group["hostId"]] = group["_count"]["_all"]
+
+        pool = HostPool(event_type_id, window_start, counts)
+        self._pools[event_type_id] = pool
+        return pool
+
+    def booking_cancelled(self, event_type_id: str, host_id: str, start_time: datetime) -> None:
+        """Stop counting a cancelled booking (no-op for pools that are not loaded)."""
+        pool = self._pools.get(event_type_id)
+        if pool is not None and start_time >= pool.window_start:
+            pool.adjust(host_id, -1)
+
+    def invalidate(self, event_type_id: str) -> None:
+        """Drop a pool so the next lookup reloads it."""
+        self._pools.pop(event_type_id, None)
+
+
+# Global load balancer instance
+host_load_balancer = HostLoadBalancer(
+    window=timedelta(days=settings.round_robin_window_days),
+    ttl_seconds=settings.round_robin_ttl_seconds
+)
@@ -0,0 +1,117 @@
+"""
+Seats - atomic occupancy counters for group event types (capacity > 1).
+
+Every slot of a group event type that has been booked gets a
+`slot_occupancy` row counting its taken seats. Taking a seat is a single
+statement that creates the row or increments it only while it is below
+the capacity, so concurrent invitees cannot overbook a slot and no
+count() query is needed. Seat bookings carry the row's id (`slot_id`),
+which lets them overlap each other under the booking overlap constraint.
+
+Slot listings read the same counters to hide full slots and report the
+remaining seats.
+"""
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+from app.core.database import prisma
+
+Interval = Tuple[datetime, datetime]
+
+# Slot start -> (slot end, seats taken)
+Seats = Dict[datetime, Tuple[datetime, int]]
+
+# Create the slot's counter at 1, or add a seat while it is below capacity ($5);
+# no row comes back when the slot is full
+TAKE_SEAT_SQL = """
+INSERT INTO slot_occupancy (id, event_type_id, start_time, end_time, booked, created_at, updated_at)
+VALUES ($1, $2, $3::timestamp, $4::timestamp, 1, now(), now())
+ON CONFLICT (event_type_id, start_time) DO UPDATE
+    SET booked = slot_occupancy.booked + 1, updated_at = now()
+    WHERE slot_occupancy.booked < $5
+RETURNING id
+"""
+
+RELEASE_SEATS_SQL = """
+UPDATE slot_occupancy
+SET booked = GREATEST(booked - $2, 0), updated_at = now()
+WHERE id = $1
+"""
+
+
+async def take_seat(client, event_type_id: str, start: datetime, end: datetime, capacity: int) -> Optional[str]:
+    """Take one seat of a slot; returns the slot's occupancy id, or None if it is full."""
+    rows = await client.query_raw(
+        TAKE_SEAT_SQL,
+        str(uuid4()),
+        event_type_id,
+        start.replace(tzinfo=None).isoformat(),
+        end.replace(tzinfo=None).isoformat(),
+        capacity
+    )
+    return rows[0]["id"] if rows else None
+
+
+async def release_seats(client, bookings: Iterable) -> None:
+    """Give back the seats of cancelled bookings (one statement per slot)."""
+    for slot_id, count in Counter(booking.slotId for booking in bookings if booking.slotId).items():
+        await client.execute_raw(RELEASE_SEATS_SQL, slot_id, count)
+
+
+async def load_seats(event_type_id: str, range_start: datetime, range_end: datetime) -> Seats:
+    """Taken seats of the event type's slots starting in [range_start, range_end)."""
+    slots = await prisma.slotoccupancy.find_many(
+        where={
+            "eventTypeId": event_type_id,
+            "startTime": {"gte": range_start, "lt": range_end},
+            "booked": {"gt": 0}
+        }
+    )
+    return {slot.startTime: (slot.endTime, slot.booked) for slot in slots}
+
+
+def open_seat_slots(
+    free_slots: List[Interval],
+    seats: Seats,
+    capacity: int,
+    buffer_before: timedelta = timedelta(0),
+    buffer_after: timedelta = timedelta(0)
+) -> List[Interval]:
+    """
+    Drop free slots that are full, or that overlap a different slot with seats taken.
+
+    Seat bookings are left out of the busy intervals so their own slot stays
+    offered; this puts them back for every other slot, widened by the event
+    type's buffers like any other booking. Slots with seats taken never
+    overlap each other (the overlap constraint), so their ends are in start
+    order and the walk back stops at the first one ending early enough.
+    """
+    if not seats:
+        return free_slots
+
+    taken = sorted((start, end) for start, (end, _) in seats.items())
+    starts = [start for start, _ in taken]
+    result = []
+    for slot_start, slot_end in free_slots:
+        seat = seats.get(slot_start)
+        if seat is not None and seat[1] >= capacity:
+            continue
+        position = bisect_left(starts, slot_end + buffer_before)
+        blocked = False
+        while position and taken[position - 1][1] + buffer_after > slot_start:
+            position -= 1
+            if taken[position][0] != slot_start:
+                blocked = True
+                break
+        if not blocked:
+            result.append((slot_start, slot_end))
+    return result
+
+
+def remaining_seats(slot_start: datetime, seats: Seats, capacity: int) -> int:
+    """Seats left in a slot."""
+    seat = seats.get(slot_start)
+    return capacity - (seat[1] if seat is not None else 0)
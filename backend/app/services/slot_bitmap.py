@@ -0,0 +1,177 @@
+"""
+Bitmap slot engine - NumPy alternative to the sweep-line slot engine.
+
+Each schedule day is a row of minutes (1,440 on ordinary days) laid end
+to end on one UTC minute timeline, so a month is a (days x 1,440) bitmap.
+Weekly intervals are painted onto every row, date overrides replace
+their row's intervals, buffered bookings are subtracted, and slot fit is
+tested for every candidate at once with a sliding-window sum over the
+free minutes.
+
+Output is identical to `app.services.slots.find_free_slots_by_day`.
+NumPy is optional: check `NUMPY_AVAILABLE` before selecting this engine.
+"""
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.services.slots import Interval, day_bounds, intervals_for_date, parse_hhmm, schedule_dates
+from app.services.timezones import local_to_utc, zone_day
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+    NUMPY_AVAILABLE = False
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+MINUTE = timedelta(minutes=1)
+
+
+def _epoch_minute(moment: datetime) -> int:
+    """Whole epoch minute of a minute-aligned UTC instant."""
+    return (moment - EPOCH) // MINUTE
+
+
+def _window_minutes(
+    day: date,
+    intervals: list,
+    zone_name: str,
+    parsed: Dict[int, Tuple[List[int], List[int]]],
+) -> Tuple[List[int], List[int]]:
+    """Epoch minutes of a day's windows; templates are parsed once per interval list."""
+    if id(intervals) not in parsed:
+        parsed[id(intervals)] = (
+            [parse_hhmm(i.get("start_time", "09:00")) // MINUTE for i in intervals],
+            [parse_hhmm(i.get("end_time", "17:00")) // MINUTE for i in intervals],
+        )
+    starts, ends = parsed[id(intervals)]
+
+    entry = zone_day(zone_name, day)
+    if entry.uniform:
+        midnight = _epoch_minute(entry.start)
+        return [midnight + m for m in starts], [midnight + m for m in ends]
+
+    # DST transition day: convert each wall time on its own
+    return (
+        [_epoch_minute(local_to_utc(zone_name, day, MINUTE * m)) for m in starts],
+        [_epoch_minute(local_to_utc(zone_name, day, MINUTE * m)) for m in ends],
+    )
+
+
+def find_free_slots_by_day(
+    dates: Sequence[date],
+    weekly_hours: Dict[int, list],
+    overrides: Dict[date, list],
+    busy: Sequence[Interval],
+    duration: timedelta,
+    step: timedelta,
+    earliest: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    schedule_zone: str = "UTC",
+    invitee_zone: Optional[str] = None,
+) -> List[List[Interval]]:
+    """
+    Free slots for consecutive invitee dates, one list per date.
+
+    Same contract as the sweep-line `find_free_slots_by_day`.
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("The bitmap slot engine requires numpy")
+
+    results: List[List[Interval]] = [[] for _ in dates]
+    if not dates:
+        return results
+
+    bounds = day_bounds(dates, invitee_zone or schedule_zone)
+    range_start, range_end = bounds[0].start, bounds[-1].end
+
+    # Windows of every schedule day as epoch minutes, in schedule-day order
+    parsed: Dict[int, Tuple[List[int], List[int]]] = {}
+    window_starts, window_ends = [], []
+    for day in schedule_dates(range_start, range_end, schedule_zone):
+        intervals = intervals_for_date(day, weekly_hours, overrides)
+        if intervals:
+            starts, ends = _window_minutes(day, intervals, schedule_zone, parsed)
+            window_starts.extend(starts)
+            window_ends.extend(ends)
+
+    if not window_starts:
+        return results
+
+    window_starts = np.asarray(window_starts, dtype=np.int64)
+    window_ends = np.asarray(window_ends, dtype=np.int64)
+    valid = window_ends > window_starts
+    if not valid.any():
+        return results
+
+    # One timeline from the first window start: rows of day minutes end to end
+    origin = int(window_starts[valid].min())
+    width = int(window_ends[valid].max()) - origin
+    window_starts -= origin
+    window_ends -= origin
+
+    # Paint availability
+    painted = np.zeros(width + 1, dtype=np.int32)
+    np.add.at(painted, window_starts[valid], 1)
+    np.add.at(painted, window_ends[valid], -1)
+    free = np.cumsum(painted[:-1]) > 0
+
+    # Subtract buffered bookings: a minute is busy if any booking touches it
+    origin_ts = origin * 60
+    if busy:
+        busy_seconds = np.fromiter(
+            (moment.timestamp() - origin_ts for interval in busy for moment in interval),
+            dtype=np.float64, count=2 * len(busy)
+        ).reshape(-1, 2)
+        busy_starts = np.clip(np.floor(busy_seconds[:, 0] / 60), 0, width).astype(np.int64)
+        busy_ends = np.clip(np.ceil(busy_seconds[:, 1] / 60), 0, width).astype(np.int64)
+        blocked = np.zeros(width + 1, dtype=np.int32)
+        np.add.at(blocked, busy_starts, 1)
+        np.add.at(blocked, busy_ends, -1)
+        free &= np.cumsum(blocked[:-1]) == 0
+
+    # Candidate starts of every window, laid out window after window
+    duration_min = duration // MINUTE
+    step_min = step // MINUTE
+    counts = np.maximum(0, (window_ends - duration_min - window_starts) // step_min + 1)
+    total = int(counts.sum())
+    if not total:
+        return results
+    candidate_window = np.repeat(np.arange(window_starts.size), counts)
+    first_candidate = np.cumsum(counts) - counts
+    candidates = (
+        window_starts[candidate_window]
+        + step_min * (np.arange(total) - first_candidate[candidate_window])
+    )
+
+    # Sliding-window sum: a slot fits when all `duration` minutes are free
+    prefix = np.concatenate(([0], np.cumsum(free, dtype=np.int32)))
+    keep = prefix[candidates + duration_min] - prefix[candidates] == duration_min
+
+    # Only slots starting inside the requested invitee dates and after the cutoff
+    candidate_seconds = candidates * 60 + origin_ts
+    floor = range_start if earliest is None else max(earliest, range_start)
+    keep &= candidate_seconds >= floor.timestamp()
+    keep &= candidate_seconds < range_end.timestamp()
+
+    starts = candidates[keep]
+    day_starts = np.array([bound.start.timestamp() for bound in bounds])
+    days = np.searchsorted(day_starts, candidate_seconds[keep], side="right") - 1
+
+    if limit is not None:
+        # Keep the first `limit` slots of each day in encounter order
+        order = np.argsort(days, kind="stable")
+        sorted_days = days[order]
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size) - np.searchsorted(sorted_days, sorted_days, side="left")
+        starts = starts[rank < limit]
+        days = days[rank < limit]
+
+    base = EPOCH + MINUTE * origin
+    slot_length = MINUTE * duration_min
+    for day_index, minute in zip(days.tolist(), starts.tolist()):
+        slot_start = base + MINUTE * minute
+        results[day_index].append((slot_start, slot_start + slot_length))
+
+    return results
@@ -0,0 +1,165 @@
+"""
+Slot holds - short-lived reservations of a slot while an invitee fills in the form.
+
+`POST /public/slots/hold` reserves a slot for SLOT_HOLD_TTL_SECONDS and
+returns a token. Until it expires, the held time is busy for the held
+hosts (other invitees no longer see the slot, and bookings without the
+token are refused), while a booking that presents the token goes through.
+
+Holds expire lazily: every lookup first pops the holds that are due from
+an expiry heap, and dropping a hold invalidates the hosts' cached
+availability so the slot reappears.
+
+Holds live in process memory, so each worker process keeps its own.
+"""
+import heapq
+from datetime import datetime, timedelta, timezone as dt_timezone
+from secrets import token_urlsafe
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.services.availability_cache import availability_cache
+
+Interval = Tuple[datetime, datetime]
+
+
+class SlotHold(NamedTuple):
+    """A held slot: [start, end) of `host_ids` until `expires_at` (all UTC)."""
+    token: str
+    event_type_id: str
+    host_ids: Tuple[str, ...]
+    start: datetime
+    end: datetime
+    expires_at: datetime
+
+
+class SlotHoldStore:
+    """Active holds by token and by host, with an expiry heap."""
+
+    def __init__(self, ttl_seconds: float, max_holds: int):
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_holds = max_holds
+        self._holds: Dict[str, SlotHold] = {}
+        self._by_host: Dict[str, Dict[str, SlotHold]] = {}
+        self._expiry: List[Tuple[datetime, str]] = []
+        self.placed = 0
+        self.refused = 0
+        self.used = 0
+        self.expired = 0
+
+    def expire(self) -> None:
+        """Drop every hold that has expired."""
+        now = datetime.now(dt_timezone.utc)
+        while self._expiry and self._expiry[0][0] <= now:
+            _, token = heapq.heappop(self._expiry)
+            if self._drop(token):
+                self.expired += 1
+
+    def _drop(self, token: str) -> bool:
+        hold = self._holds.pop(token, None)
+        if hold is None:
+            return False
+        for host_id in hold.host_ids:
+            host_holds = self._by_host.get(host_id)
+            if host_holds is not None:
+                host_holds.pop(token, None)
+                if not host_holds:
+                    del self._by_host[host_id]
+            availability_cache.invalidate_host(host_id)
+        return True
+
+    def is_full(self) -> bool:
+        """Whether no more holds can be placed right now."""
+        self.expire()
+        return len(self._holds) >= self.max_holds
+
+    def conflicts(
+        self,
+        host_ids: Sequence[str],
+        start: datetime,
+        end: datetime,
+        token: Optional[str] = None,
+        buffer_before: timedelta = timedelta(0),
+        buffer_after: timedelta = timedelta(0)
+    ) -> bool:
+        """
+        Whether another hold (not `token`) blocks [start, end) for any of the hosts.
+
+        Held time gets the event type's buffers, as bookings and holds do in
+        slot listings, so a slot that is not offered cannot be taken either.
+        """
+        self.expire()
+        return any(
+            hold.start - buffer_before < end and hold.end + buffer_after > start and hold.token != token
+            for host_id in host_ids
+            for hold in self._by_host.get(host_id, {}).values()
+        )
+
+    def place(
+        self,
+        event_type_id: str,
+        host_ids: Sequence[str],
+        start: datetime,
+        end: datetime,
+        buffer_before: timedelta = timedelta(0),
+        buffer_after: timedelta = timedelta(0)
+    ) -> Optional[SlotHold]:
+        """Hold [start, end) for the hosts; None if another (buffered) hold blocks it."""
+        if self.conflicts(host_ids, start, end, buffer_before=buffer_before, buffer_after=buffer_after):
+            self.refused += 1
+            return None
+
+        hold = SlotHold(
+            token=token_urlsafe(24),
+            event_type_id=event_type_id,
+            host_ids=tuple(host_ids),
+            start=start,
+            end=end,
+            expires_at=datetime.now(dt_timezone.utc) + self.ttl
+        )
+        self._holds[hold.token] = hold
+        for host_id in hold.host_ids:
+            self._by_host.setdefault(host_id, {})[hold.token] = hold
+            availability_cache.invalidate_host(host_id)
+        heapq.heappush(self._expiry, (hold.expires_at, hold.token))
+        self.placed += 1
+        return hold
+
+    def get(self, token: str) -> Optional[SlotHold]:
+        """The active hold for a token, if any."""
+        self.expire()
+        return self._holds.get(token)
+
+    def release(self, token: str) -> None:
+        """Drop a hold once its booking is made."""
+        if self._drop(token):
+            self.used += 1
+
+    def intervals(self, host_id: str, start: datetime, end: datetime) -> List[Interval]:
+        """[start, end) of the host's holds overlapping [start, end)."""
+        self.expire()
+        return [
+            (hold.start, hold.end)
+            for hold in self._by_host.get(host_id, {}).values()
+            if hold.start < end and hold.end > start
+        ]
+
+    def stats(self) -> dict:
+        """Placed/refused/used/expired counters and active holds."""
+        self.expire()
+        return {
+            "active": len(self._holds),
+            "max_holds": self.max_holds,
+            "ttl_seconds": self.ttl.total_seconds(),
+            "placed": self.placed,
+            "refused": self.refused,
+            "used": self.used,
+            "expired": self.expired,
+        }
+
+
+# Global hold store instance
+slot_holds = SlotHoldStore(
+    ttl_seconds=settings.slot_hold_ttl_seconds,
+    max_holds=settings.slot_hold_max
+)
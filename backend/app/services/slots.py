@@ -0,0 +1,337 @@
+"""
+Slot engine - computes free booking slots from availability windows.
+
+Bookings are sorted once and merged into disjoint busy intervals. Each
+availability window is then walked along the slot grid, jumping straight
+past busy intervals instead of testing every slot against every booking.
+"""
+import heapq
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.services.timezones import ZoneDay, get_zone, local_to_utc, zone_day
+
+# (start, end) pair of timezone-aware datetimes, end exclusive
+Interval = Tuple[datetime, datetime]
+
+# Slots start every `min(duration, 30)` minutes inside a window
+MAX_SLOT_STEP_MINUTES = 30
+
+
+class HostAvailability(NamedTuple):
+    """One host's schedule and busy intervals, for team slot generation."""
+    weekly_hours: Dict[int, list]
+    overrides: Dict[date, list]
+    busy: List[Interval]
+    schedule_zone: str = "UTC"
+
+
+def slot_step(duration_minutes: int) -> timedelta:
+    """Distance between two consecutive slot starts."""
+    return timedelta(minutes=min(MAX_SLOT_STEP_MINUTES, duration_minutes))
+
+
+def parse_hhmm(value: str) -> timedelta:
+    """Parse an "HH:MM" string into an offset from midnight ("24:00" allowed)."""
+    hours, minutes = map(int, value.split(":"))
+    return timedelta(hours=hours, minutes=minutes)
+
+
+def schema_day_of_week(day: date) -> int:
+    """Convert a date to the schema's day of week (Sunday=0, Saturday=6)."""
+    # Python Monday(0) -> Schema Monday(1), Python Sunday(6) -> Schema Sunday(0)
+    return (day.weekday() + 1) % 7
+
+
+def intervals_for_date(
+    day: date,
+    weekly_hours: Dict[int, list],
+    overrides: Dict[date, list],
+) -> list:
+    """
+    Resolve the availability intervals for a date.
+
+    `weekly_hours` maps enabled schema days of week to their intervals and
+    `overrides` maps dates to override intervals. A date override takes
+    priority over weekly hours; an empty override means unavailable.
+    """
+    if day in overrides:
+        return overrides[day]
+    return weekly_hours.get(schema_day_of_week(day), [])
+
+
+def availability_windows(slot_date: date, intervals: Iterable[dict], zone_name: str = "UTC") -> List[Interval]:
+    """Turn stored {start_time, end_time} wall-clock intervals of a date into UTC windows."""
+    windows = []
+    for interval in intervals:
+        start = local_to_utc(zone_name, slot_date, parse_hhmm(interval.get("start_time", "09:00")))
+        end = local_to_utc(zone_name, slot_date, parse_hhmm(interval.get("end_time", "17:00")))
+        windows.append((start, end))
+    return windows
+
+
+def day_bounds(dates: Sequence[date], zone_name: str) -> List[ZoneDay]:
+    """UTC bounds of consecutive local dates in a zone."""
+    return [zone_day(zone_name, day) for day in dates]
+
+
+def schedule_dates(range_start: datetime, range_end: datetime, zone_name: str) -> List[date]:
+    """Local dates of a schedule whose slots can start inside [range_start, range_end)."""
+    first = range_start.astimezone(get_zone(zone_name)).date()
+    last = (range_end - timedelta(microseconds=1)).astimezone(get_zone(zone_name)).date()
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+def _coalesce(intervals: Iterable[Interval]) -> List[Interval]:
+    """Merge overlapping or touching intervals of a start-sorted stream."""
+    merged: List[Interval] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def merge_busy_intervals(
+    bookings: Iterable[Interval],
+    buffer_before: timedelta = timedelta(0),
+    buffer_after: timedelta = timedelta(0),
+) -> List[Interval]:
+    """Sort buffered bookings once and merge overlapping ones into busy intervals."""
+    return _coalesce(sorted((start - buffer_before, end + buffer_after) for start, end in bookings))
+
+
+def union_intervals(interval_lists: Sequence[Sequence[Interval]]) -> List[Interval]:
+    """Union of k sorted interval lists, with a k-way heap merge."""
+    return _coalesce(heapq.merge(*interval_lists))
+
+
+def intersect_intervals(interval_lists: Sequence[Sequence[Interval]]) -> List[Interval]:
+    """
+    Intersection of k sorted, non-overlapping interval lists.
+
+    The 2k endpoint streams are k-way merged with a heap and swept once,
+    tracking how many lists cover the current instant: O(n log k).
+    """
+    required = len(interval_lists)
+    if not required or any(not intervals for intervals in interval_lists):
+        return []
+
+    # Ends sort before starts at the same instant, so touching intervals do not intersect
+    events = heapq.merge(*(
+        [point for start, end in intervals for point in ((start, 1), (end, -1))]
+        for intervals in interval_lists
+    ), key=lambda event: (event[0], event[1]))
+
+    common: List[Interval] = []
+    covering = 0
+    opened: Optional[datetime] = None
+    for moment, change in events:
+        if change == 1:
+            covering += 1
+            if covering == required:
+                opened = moment
+        else:
+            if covering == required and moment > opened:
+                common.append((opened, moment))
+            covering -= 1
+    return common
+
+
+def _steps_to_reach(current: datetime, target: datetime, step: timedelta) -> int:
+    """Number of grid steps needed to move `current` to at least `target`."""
+    return -((current - target) // step)
+
+
+def find_free_slots(
+    windows: Sequence[Interval],
+    busy: Sequence[Interval],
+    duration: timedelta,
+    step: timedelta,
+    earliest: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    busy_ends: Optional[Sequence[datetime]] = None,
+) -> List[Interval]:
+    """
+    Walk every window on its slot grid and collect slots that avoid `busy`.
+
+    `busy` must be sorted and non-overlapping (see `merge_busy_intervals`).
+    Slots starting before `earliest` are skipped. When `limit` is given the
+    walk stops as soon as that many slots have been found. Callers walking
+    many days over the same `busy` list can pass its end times precomputed.
+    """
+    if busy_ends is None:
+        busy_ends = [end for _, end in busy]
+    busy_count = len(busy)
+    slots: List[Interval] = []
+
+    for window_start, window_end in windows:
+        current = window_start
+        if earliest is not None and current < earliest:
+            current += step * _steps_to_reach(current, earliest, step)
+
+        # First busy interval that ends after the current slot start
+        index = bisect_right(busy_ends, current)
+
+        while current + duration <= window_end:
+            slot_end = current + duration
+
+            while index < busy_count and busy_ends[index] <= current:
+                index += 1
+
+            if index < busy_count and busy[index][0] < slot_end:
+                # Overlap - jump to the first grid point after this busy interval
+                current += step * _steps_to_reach(current, busy_ends[index], step)
+                continue
+
+            slots.append((current, slot_end))
+            if limit is not None and len(slots) >= limit:
+                return slots
+            current += step
+
+    return slots
+
+
+def find_free_slots_by_day(
+    dates: Sequence[date],
+    weekly_hours: Dict[int, list],
+    overrides: Dict[date, list],
+    busy: Sequence[Interval],
+    duration: timedelta,
+    step: timedelta,
+    earliest: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    schedule_zone: str = "UTC",
+    invitee_zone: Optional[str] = None,
+) -> List[List[Interval]]:
+    """
+    Free slots for consecutive invitee dates, one list per date.
+
+    Weekly hours and overrides are wall-clock times in `schedule_zone`;
+    `dates` are calendar days in `invitee_zone` (defaults to the schedule
+    zone). A slot belongs to the invitee date its start falls on, and
+    `limit` applies per invitee date.
+    """
+    results: List[List[Interval]] = [[] for _ in dates]
+    if not dates:
+        return results
+
+    bounds = day_bounds(dates, invitee_zone or schedule_zone)
+    day_starts = [bound.start for bound in bounds]
+    range_start, range_end = bounds[0].start, bounds[-1].end
+    floor = range_start if earliest is None else max(earliest, range_start)
+    busy_ends = [end for _, end in busy]
+
+    for day in schedule_dates(range_start, range_end, schedule_zone):
+        intervals = intervals_for_date(day, weekly_hours, overrides)
+        if not intervals:
+            continue
+        day_slots = find_free_slots(
+            availability_windows(day, intervals, schedule_zone),
+            busy,
+            duration,
+            step,
+            earliest=floor,
+            busy_ends=busy_ends
+        )
+        _bucket_by_day(day_slots, day_starts, range_end, results, limit)
+
+    return results
+
+
+def _bucket_by_day(
+    slots: Iterable[Interval],
+    day_starts: Sequence[datetime],
+    range_end: datetime,
+    results: List[List[Interval]],
+    limit: Optional[int],
+) -> None:
+    """Append slots to the list of the day their start falls on, up to `limit` per day."""
+    for slot in slots:
+        if slot[0] >= range_end:
+            continue
+        bucket = results[bisect_right(day_starts, slot[0]) - 1]
+        if limit is None or len(bucket) < limit:
+            bucket.append(slot)
+
+
+def schedule_windows(
+    range_start: datetime,
+    range_end: datetime,
+    host: HostAvailability,
+) -> List[Interval]:
+    """A host's availability windows for every schedule date overlapping the range, sorted and merged."""
+    windows: List[Interval] = []
+    for day in schedule_dates(range_start, range_end, host.schedule_zone):
+        intervals = intervals_for_date(day, host.weekly_hours, host.overrides)
+        windows.extend(availability_windows(day, intervals, host.schedule_zone))
+    return _coalesce(sorted(windows))
+
+
+def find_collective_slots_by_day(
+    dates: Sequence[date],
+    hosts: Sequence[HostAvailability],
+    duration: timedelta,
+    step: timedelta,
+    invitee_zone: str,
+    earliest: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> List[List[Interval]]:
+    """
+    Free slots when every host must attend, one list per invitee date.
+
+    The hosts' availability windows are intersected and their busy
+    intervals unioned, each with one k-way merge, so a team of k hosts
+    costs a single slot walk instead of k nested ones.
+    """
+    results: List[List[Interval]] = [[] for _ in dates]
+    if not dates or not hosts:
+        return results
+
+    bounds = day_bounds(dates, invitee_zone)
+    range_start, range_end = bounds[0].start, bounds[-1].end
+    floor = range_start if earliest is None else max(earliest, range_start)
+
+    common = intersect_intervals([schedule_windows(range_start, range_end, host) for host in hosts])
+    if not common:
+        return results
+    busy = union_intervals([host.busy for host in hosts])
+
+    _bucket_by_day(
+        find_free_slots(common, busy, duration, step, earliest=floor),
+        [bound.start for bound in bounds],
+        range_end,
+        results,
+        limit
+    )
+    return results
+
+
+def union_slots_by_day(
+    per_host: Sequence[List[List[Interval]]],
+    limit: Optional[int] = None,
+) -> List[List[Interval]]:
+    """
+    Slots offered by at least one host, one list per date.
+
+    `per_host` holds each host's sorted per-date slots; every date is one
+    k-way heap merge that drops duplicates and stops at `limit`. Each host
+    only needs its own first `limit` slots per date for this to be exact.
+    """
+    if not per_host:
+        return []
+
+    results: List[List[Interval]] = []
+    for day_index in range(len(per_host[0])):
+        day_slots: List[Interval] = []
+        for slot in heapq.merge(*(host_days[day_index] for host_days in per_host)):
+            if day_slots and day_slots[-1] == slot:
+                continue
+            day_slots.append(slot)
+            if limit is not None and len(day_slots) >= limit:
+                break
+        results.append(day_slots)
+    return results
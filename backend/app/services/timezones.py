@@ -0,0 +1,104 @@
+"""
+Timezone helpers - cached per-day UTC offset tables built on zoneinfo.
+
+Slot generation converts many wall-clock times to UTC and back. Instead
+of running every slot through `astimezone`, each zone gets a cached table
+with one row per local day: the UTC instants of its midnight and of the
+next midnight, and its UTC offset. On ordinary days a wall time is just
+`day.start + minutes`; only the few DST transition days fall back to a
+full zoneinfo conversion.
+"""
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+ONE_DAY = timedelta(days=1)
+
+
+class ZoneDay(NamedTuple):
+    """One local calendar day of a zone, expressed in UTC."""
+    start: datetime       # UTC instant of local midnight
+    end: datetime         # UTC instant of the next local midnight
+    offset: timedelta     # UTC offset at local midnight
+    uniform: bool         # False when the offset changes during the day (DST)
+
+
+@lru_cache(maxsize=512)
+def get_zone(name: str) -> ZoneInfo:
+    """Get a (cached) ZoneInfo; raises ZoneInfoNotFoundError for unknown names."""
+    try:
+        return ZoneInfo(name)
+    except (ValueError, IsADirectoryError) as e:
+        # Malformed keys such as "../etc" or "" are reported as ValueError
+        raise ZoneInfoNotFoundError(name) from e
+
+
+def is_valid_timezone(name: str) -> bool:
+    """Check whether `name` is a known IANA timezone."""
+    try:
+        get_zone(name)
+    except ZoneInfoNotFoundError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=256)
+def _year_table(zone_name: str, year: int) -> Tuple[int, Tuple[ZoneDay, ...]]:
+    """
+    Every local day of `year` in `zone_name`, computed once per zone and year.
+
+    Returns the ordinal of January 1st along with the days so a lookup is a
+    subtraction rather than a `timetuple()` call.
+    """
+    zone = get_zone(zone_name)
+    first = date(year, 1, 1)
+    day_count = (date(year + 1, 1, 1) - first).days
+
+    midnights = [
+        datetime.combine(first + timedelta(days=offset), datetime.min.time(), tzinfo=zone)
+        for offset in range(day_count + 1)
+    ]
+    starts = [midnight.astimezone(dt_timezone.utc) for midnight in midnights]
+
+    table = []
+    for index in range(day_count):
+        offset = midnights[index].utcoffset()
+        uniform = (
+            offset == midnights[index + 1].utcoffset()
+            and starts[index + 1] - starts[index] == ONE_DAY
+        )
+        table.append(ZoneDay(start=starts[index], end=starts[index + 1], offset=offset, uniform=uniform))
+    return first.toordinal(), tuple(table)
+
+
+def zone_day(zone_name: str, day: date) -> ZoneDay:
+    """Look up the UTC bounds and offset of a local day."""
+    first_ordinal, table = _year_table(zone_name, day.year)
+    return table[day.toordinal() - first_ordinal]
+
+
+def local_to_utc(zone_name: str, day: date, offset: timedelta) -> datetime:
+    """
+    Convert the wall time `day` + `offset` (e.g. 09:30, or 24:00) to UTC.
+
+    Wall times skipped by a DST gap resolve like zoneinfo's fold=0: they
+    use the offset from before the transition.
+    """
+    entry = zone_day(zone_name, day)
+    if entry.uniform:
+        return entry.start + offset
+    local = datetime.combine(day, datetime.min.time()) + offset
+    return local.replace(tzinfo=get_zone(zone_name)).astimezone(dt_timezone.utc)
+
+
+def utc_to_local(moment: datetime, zone_name: str, day: date) -> datetime:
+    """
+    Convert a UTC instant known to fall on local `day` to naive wall time.
+
+    Uses the day's cached offset unless the day has a DST transition.
+    """
+    entry = zone_day(zone_name, day)
+    if entry.uniform:
+        return (moment + entry.offset).replace(tzinfo=None)
+    return moment.astimezone(get_zone(zone_name)).replace(tzinfo=None)
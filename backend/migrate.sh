@@ -0,0 +1,27 @@
+#!/bin/bash
+# Database Migration (Release) Script
+# Run once per release, before the new build serves traffic (on Render, as
+# the pre-deploy command). build.sh never touches the database.
+#
+# Usage:
+#     cd backend
+#     ./migrate.sh             # stops if existing bookings overlap
+#     ./migrate.sh --cancel    # cancels the later booking of every overlap first
+
+set -e
+
+echo "🗄️  Pushing database schema..."
+prisma db push --skip-generate
+
+echo "🧹 Checking for overlapping bookings..."
+python -m scripts.resolve_booking_overlaps "$@"
+
+echo "🔒 Applying booking overlap constraint..."
+prisma db execute --file prisma/sql/booking_no_overlap.sql --schema prisma/schema.prisma
+
+if [ "$SLOT_ENGINE" = "postgres" ]; then
+    echo "🧮 Applying slot generation function..."
+    prisma db execute --file prisma/sql/free_slots.sql --schema prisma/schema.prisma
+fi
+
+echo "✅ Migration complete!"
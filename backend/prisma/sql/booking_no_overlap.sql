@@ -0,0 +1,55 @@
+-- Booking overlap constraint
+-- No two CONFIRMED bookings of the same host may overlap in time, except
+-- seats of the same slot of a group event type (same slot_id).
+--
+-- Prisma cannot express exclusion constraints, so this runs after
+-- `prisma db push`; migrate.sh does both, with the overlap check in
+-- between (it is safe to re-run, the constraint is rebuilt):
+--
+--     prisma db execute --file prisma/sql/booking_no_overlap.sql --schema prisma/schema.prisma
+--
+-- Bookings that already overlap stop it with an error; cancel the later
+-- ones first with `python -m scripts.resolve_booking_overlaps --cancel`
+-- (or `./migrate.sh --cancel`).
+--
+-- Times are stored as UTC `timestamp(3)` columns, so the range is a
+-- `tsrange`: casting to `tstzrange` depends on the session TimeZone and
+-- is not allowed in an index expression. Ranges are half-open, so
+-- back-to-back bookings do not conflict.
+
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+BEGIN;
+
+ALTER TABLE bookings DROP CONSTRAINT IF EXISTS bookings_host_no_overlap;
+
+DO $$
+DECLARE
+    overlapping int;
+BEGIN
+    SELECT count(*) INTO overlapping
+    FROM bookings a
+    JOIN bookings b
+        ON b.host_id = a.host_id
+        AND a.id < b.id
+        AND COALESCE(a.slot_id, a.id) <> COALESCE(b.slot_id, b.id)
+        AND a.start_time < b.end_time
+        AND b.start_time < a.end_time
+    WHERE a.status = 'CONFIRMED' AND b.status = 'CONFIRMED';
+
+    IF overlapping > 0 THEN
+        RAISE EXCEPTION '% pairs of CONFIRMED bookings overlap; run `python -m scripts.resolve_booking_overlaps --cancel` first', overlapping;
+    END IF;
+END $$;
+
+-- A booking without a slot is keyed by its own id, so it conflicts with every overlapping booking
+ALTER TABLE bookings
+    ADD CONSTRAINT bookings_host_no_overlap
+    EXCLUDE USING gist (
+        host_id WITH =,
+        tsrange(start_time, end_time, '[)') WITH &&,
+        COALESCE(slot_id, id) WITH <>
+    )
+    WHERE (status = 'CONFIRMED');
+
+COMMIT;
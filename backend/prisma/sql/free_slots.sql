@@ -0,0 +1,142 @@
+-- Database-side slot generation (SLOT_ENGINE=postgres)
+-- free_slots() returns one host's free slots for consecutive invitee dates,
+-- the same list the Python engine builds (app/services/slots.py):
+--
+--   1. every schedule date that can hold a slot inside the invitee dates
+--      gets its date override, or else its enabled weekly hours;
+--   2. each interval is walked on the slot grid (generate_series), starting
+--      at the first grid point after the minimum notice;
+--   3. slots overlapping a buffered CONFIRMED booking (NOT EXISTS against the
+--      (host_id, start_time, end_time, status) index) or a held slot are dropped.
+--
+-- Only the final slots leave the database. It is safe to re-run after
+-- `prisma db push`:
+--
+--     prisma db execute --file prisma/sql/free_slots.sql --schema prisma/schema.prisma
+--
+-- Times are UTC `timestamp` values like the booking columns.
+
+-- Wall time -> UTC like Python's zoneinfo with fold=0: a wall time that occurs
+-- twice (DST ends) is the first one, and one skipped by a DST gap uses the
+-- offset from before the gap
+CREATE OR REPLACE FUNCTION local_to_utc(local_time timestamp, zone text)
+RETURNS timestamp
+LANGUAGE sql STABLE STRICT
+AS $$
+    SELECT CASE
+        WHEN (before_change AT TIME ZONE 'UTC') AT TIME ZONE zone = local_time THEN before_change
+        WHEN (after_change AT TIME ZONE 'UTC') AT TIME ZONE zone = local_time THEN after_change
+        ELSE before_change
+    END
+    FROM (
+        SELECT
+            -- Using the offset of the day before
+            local_time - ((local_time - interval '1 day') - (((local_time - interval '1 day') AT TIME ZONE zone) AT TIME ZONE 'UTC')) AS before_change,
+            (local_time AT TIME ZONE zone) AT TIME ZONE 'UTC' AS after_change
+    ) candidates
+$$;
+
+CREATE OR REPLACE FUNCTION free_slots(
+    p_host_id text,
+    p_schedule_id text,
+    p_schedule_zone text,
+    p_invitee_zone text,
+    p_first_date date,
+    p_last_date date,
+    p_duration_minutes int,
+    p_step_minutes int,
+    p_buffer_before_minutes int,
+    p_buffer_after_minutes int,
+    p_earliest timestamp,
+    p_held jsonb DEFAULT '[]'  -- [[start, end], ...] of held slots
+)
+RETURNS TABLE (slot_date date, slot_start timestamp, slot_end timestamp)
+LANGUAGE sql STABLE
+AS $$
+WITH bounds AS (
+    SELECT
+        local_to_utc(p_first_date::timestamp, p_invitee_zone) AS range_start,
+        local_to_utc((p_last_date + 1)::timestamp, p_invitee_zone) AS range_end,
+        make_interval(mins => p_duration_minutes) AS duration,
+        make_interval(mins => p_step_minutes) AS step,
+        make_interval(mins => p_buffer_before_minutes) AS buffer_before,
+        make_interval(mins => p_buffer_after_minutes) AS buffer_after
+),
+-- Schedule dates whose slots can start inside the invitee dates
+schedule_days AS (
+    SELECT d::date AS day
+    FROM bounds, generate_series(
+        ((range_start AT TIME ZONE 'UTC') AT TIME ZONE p_schedule_zone)::date::timestamp,
+        (((range_end - interval '1 microsecond') AT TIME ZONE 'UTC') AT TIME ZONE p_schedule_zone)::date::timestamp,
+        interval '1 day'
+    ) AS d
+),
+-- A date override replaces the weekly hours of its date ([] = unavailable)
+day_intervals AS (
+    SELECT sd.day, iv.value AS wall_times, iv.position
+    FROM schedule_days sd
+    LEFT JOIN date_overrides o
+        ON o.schedule_id = p_schedule_id AND o.specific_date = sd.day
+    LEFT JOIN weekly_hours w
+        ON w.schedule_id = p_schedule_id AND w.day_of_week = EXTRACT(DOW FROM sd.day) AND w.is_enabled
+    CROSS JOIN LATERAL jsonb_array_elements(
+        CASE WHEN o.id IS NOT NULL THEN COALESCE(o.intervals, '[]') ELSE COALESCE(w.intervals, '[]') END
+    ) WITH ORDINALITY AS iv(value, position)
+),
+windows AS (
+    SELECT
+        day,
+        position,
+        local_to_utc(
+            day + make_interval(
+                hours => split_part(COALESCE(wall_times->>'start_time', '09:00'), ':', 1)::int,
+                mins => split_part(COALESCE(wall_times->>'start_time', '09:00'), ':', 2)::int
+            ),
+            p_schedule_zone
+        ) AS window_start,
+        local_to_utc(
+            day + make_interval(
+                hours => split_part(COALESCE(wall_times->>'end_time', '17:00'), ':', 1)::int,
+                mins => split_part(COALESCE(wall_times->>'end_time', '17:00'), ':', 2)::int
+            ),
+            p_schedule_zone
+        ) AS window_end
+    FROM day_intervals
+),
+-- Grid points of each window from the first one at or after the notice cutoff
+candidates AS (
+    SELECT w.day, w.position, s AS slot_start, s + b.duration AS slot_end
+    FROM windows w
+    CROSS JOIN bounds b
+    CROSS JOIN LATERAL generate_series(
+        w.window_start + b.step * GREATEST(0, ceil(
+            EXTRACT(EPOCH FROM GREATEST(p_earliest, b.range_start) - w.window_start)
+            / EXTRACT(EPOCH FROM b.step)
+        ))::int,
+        w.window_end - b.duration,
+        b.step
+    ) AS s
+)
+SELECT
+    ((c.slot_start AT TIME ZONE 'UTC') AT TIME ZONE p_invitee_zone)::date,
+    c.slot_start,
+    c.slot_end
+FROM candidates c
+CROSS JOIN bounds b
+WHERE c.slot_start < b.range_end
+  AND NOT EXISTS (
+      SELECT 1
+      FROM bookings bk
+      WHERE bk.host_id = p_host_id
+        AND bk.status = 'CONFIRMED'
+        AND bk.start_time < c.slot_end + b.buffer_before
+        AND bk.end_time > c.slot_start - b.buffer_after
+  )
+  AND NOT EXISTS (
+      SELECT 1
+      FROM jsonb_array_elements(p_held) AS held(pair)
+      WHERE (held.pair->>0)::timestamp < c.slot_end + b.buffer_before
+        AND (held.pair->>1)::timestamp > c.slot_start - b.buffer_after
+  )
+ORDER BY c.day, c.position, c.slot_start
+$$;
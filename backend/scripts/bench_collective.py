@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Collective Availability Benchmark
+Compares the k-way merge used for collective event types with running
+the single-host engine once per host and intersecting the results, for
+teams of up to 50 hosts over a month, and checks both agree.
+
+Usage:
+    cd backend
+    python -m scripts.bench_collective
+"""
+import random
+import sys
+import timeit
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.slots import (
+    HostAvailability,
+    find_collective_slots_by_day,
+    find_free_slots_by_day,
+    merge_busy_intervals,
+    slot_step,
+)
+
+TEAM_SIZES = [2, 5, 10, 25, 50]
+DURATION_MINUTES = 30
+BOOKINGS_PER_DAY = 3
+FIRST_DAY = date(2030, 3, 1)
+DAYS = 31
+ZONES = ["UTC", "Europe/London", "Europe/Berlin"]
+
+
+def hhmm(minute: int) -> str:
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def make_host(rng: random.Random) -> HostAvailability:
+    """A host with half-hour aligned weekday hours and a few bookings a day."""
+    start = rng.choice(range(6 * 60, 11 * 60, 30))
+    end = rng.choice(range(15 * 60, 20 * 60, 30))
+    intervals = [{"start_time": hhmm(start), "end_time": hhmm(end)}]
+    weekly_hours = {day_of_week: intervals for day_of_week in range(1, 6)}
+
+    midnight = datetime.combine(FIRST_DAY, datetime.min.time(), tzinfo=dt_timezone.utc)
+    bookings = []
+    for day in range(DAYS):
+        for _ in range(BOOKINGS_PER_DAY):
+            booking_start = midnight + timedelta(days=day, minutes=rng.randrange(6 * 60, 20 * 60, 15))
+            bookings.append((booking_start, booking_start + timedelta(minutes=rng.choice([15, 30, 60]))))
+
+    return HostAvailability(
+        weekly_hours=weekly_hours,
+        overrides={},
+        busy=merge_busy_intervals(bookings),
+        schedule_zone=rng.choice(ZONES)
+    )
+
+
+def per_host_slots(hosts, dates, earliest):
+    """Baseline: every host's free slots, intersected day by day."""
+    per_host = [
+        find_free_slots_by_day(
+            dates,
+            host.weekly_hours,
+            host.overrides,
+            host.busy,
+            duration=timedelta(minutes=DURATION_MINUTES),
+            step=slot_step(DURATION_MINUTES),
+            earliest=earliest,
+            schedule_zone=host.schedule_zone,
+            invitee_zone="UTC"
+        )
+        for host in hosts
+    ]
+    result = []
+    for day_index in range(len(dates)):
+        common = set(per_host[0][day_index])
+        for host_days in per_host[1:]:
+            common &= set(host_days[day_index])
+        result.append(sorted(common))
+    return result
+
+
+def collective_slots(hosts, dates, earliest):
+    """k-way intersection of windows and union of busy intervals."""
+    return find_collective_slots_by_day(
+        dates,
+        hosts,
+        duration=timedelta(minutes=DURATION_MINUTES),
+        step=slot_step(DURATION_MINUTES),
+        invitee_zone="UTC",
+        earliest=earliest
+    )
+
+
+def run_benchmark():
+    """Time both approaches for each team size."""
+    rng = random.Random(11)
+    dates = [FIRST_DAY + timedelta(days=offset) for offset in range(DAYS)]
+    earliest = datetime.combine(FIRST_DAY, datetime.min.time(), tzinfo=dt_timezone.utc)
+    all_hosts = [make_host(rng) for _ in range(max(TEAM_SIZES))]
+
+    print(f"{'hosts':>6} {'slots':>6} {'per-host (ms)':>14} {'k-way (ms)':>11} {'speedup':>8}")
+    for size in TEAM_SIZES:
+        hosts = all_hosts[:size]
+
+        expected = per_host_slots(hosts, dates, earliest)
+        actual = collective_slots(hosts, dates, earliest)
+        assert actual == expected, f"collective output differs for {size} hosts"
+
+        runs = 5
+        per_host_ms = min(timeit.repeat(lambda: per_host_slots(hosts, dates, earliest), number=runs, repeat=3)) / runs * 1000
+        kway_ms = min(timeit.repeat(lambda: collective_slots(hosts, dates, earliest), number=runs, repeat=3)) / runs * 1000
+
+        slot_count = sum(len(day_slots) for day_slots in actual)
+        print(f"{size:>6} {slot_count:>6} {per_host_ms:>14.3f} {kway_ms:>11.3f} {per_host_ms / kway_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("⏱️  Calendly Clone - Collective Availability Benchmark")
+    print("="*50)
+    run_benchmark()
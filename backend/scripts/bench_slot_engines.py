@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Slot Engine Comparison Benchmark
+Compares the sweep-line engine with the NumPy minute-bitmap engine on a
+dense schedule (many intervals, many bookings, 15-minute event type) for
+a single day and for a whole month, and checks both give identical output.
+
+Usage:
+    cd backend
+    pip install numpy
+    python -m scripts.bench_slot_engines
+"""
+import random
+import sys
+import timeit
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import slot_bitmap, slots
+from app.services.slots import merge_busy_intervals, slot_step
+
+DURATION_MINUTES = 15
+BUFFER_BEFORE = timedelta(minutes=5)
+BUFFER_AFTER = timedelta(minutes=5)
+FIRST_DAY = date(2030, 3, 1)  # the month with the US/EU spring DST change
+BOOKINGS_PER_DAY = [0, 50, 200, 500]
+# (schedule zone, invitee zone)
+ZONES = [
+    ("UTC", "UTC"),
+    ("America/New_York", "Asia/Kolkata"),
+]
+
+
+def hhmm(minute: int) -> str:
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+# 48 intervals per day: 20 minutes on, 10 minutes off around the clock
+INTERVALS = [{"start_time": hhmm(minute), "end_time": hhmm(minute + 20)} for minute in range(0, 24 * 60, 30)]
+WEEKLY_HOURS = {day_of_week: INTERVALS for day_of_week in range(7)}
+# Every 7th day is overridden with a single long interval
+OVERRIDE_INTERVALS = [{"start_time": "06:00", "end_time": "24:00"}]
+
+
+def make_bookings(days: int, per_day: int, seed: int = 7):
+    """Random 5-30 minute bookings, `per_day` on each day."""
+    rng = random.Random(seed)
+    start_of_range = datetime.combine(FIRST_DAY, datetime.min.time(), tzinfo=dt_timezone.utc)
+    bookings = []
+    for day in range(days):
+        midnight = start_of_range + timedelta(days=day)
+        for _ in range(per_day):
+            start = midnight + timedelta(seconds=rng.randrange(0, 24 * 3600))
+            bookings.append((start, start + timedelta(minutes=rng.choice([5, 10, 15, 30]))))
+    return bookings
+
+
+def run_engine(engine, dates, overrides, busy, earliest, zones, limit=None):
+    """Free slots for every date with the given engine module."""
+    schedule_zone, invitee_zone = zones
+    return engine.find_free_slots_by_day(
+        dates,
+        WEEKLY_HOURS,
+        overrides,
+        busy,
+        duration=timedelta(minutes=DURATION_MINUTES),
+        step=slot_step(DURATION_MINUTES),
+        earliest=earliest,
+        limit=limit,
+        schedule_zone=schedule_zone,
+        invitee_zone=invitee_zone
+    )
+
+
+def run_case(label: str, days: int, per_day: int, zones, limit=None):
+    """Time both engines for one scenario."""
+    dates = [FIRST_DAY + timedelta(days=offset) for offset in range(days)]
+    overrides = {d: OVERRIDE_INTERVALS for d in dates[3::7]}
+    busy = merge_busy_intervals(make_bookings(days, per_day), BUFFER_BEFORE, BUFFER_AFTER)
+    # A cutoff in the middle of the first day, with seconds, like a real "now"
+    earliest = datetime.combine(FIRST_DAY, datetime.min.time(), tzinfo=dt_timezone.utc) + timedelta(hours=9, seconds=17)
+
+    expected = run_engine(slots, dates, overrides, busy, earliest, zones, limit)
+    actual = run_engine(slot_bitmap, dates, overrides, busy, earliest, zones, limit)
+    assert actual == expected, f"bitmap output differs for {label}, {per_day} bookings/day, {zones}"
+
+    runs = 10
+    python_ms = min(timeit.repeat(lambda: run_engine(slots, dates, overrides, busy, earliest, zones, limit), number=runs, repeat=3)) / runs * 1000
+    bitmap_ms = min(timeit.repeat(lambda: run_engine(slot_bitmap, dates, overrides, busy, earliest, zones, limit), number=runs, repeat=3)) / runs * 1000
+
+    slot_count = sum(len(day_slots) for day_slots in actual)
+    print(f"{label:>12} {per_day:>9} {slot_count:>6} {python_ms:>12.3f} {bitmap_ms:>12.3f} {python_ms / bitmap_ms:>7.1f}x")
+
+
+def run_benchmark():
+    """Run every scenario."""
+    for zones in ZONES:
+        print(f"\nschedule {zones[0]}, invitee {zones[1]}")
+        print(f"{'case':>12} {'bookings':>9} {'slots':>6} {'python (ms)':>12} {'bitmap (ms)':>12} {'speedup':>8}")
+        for per_day in BOOKINGS_PER_DAY:
+            run_case("day", 1, per_day, zones)
+        for per_day in BOOKINGS_PER_DAY:
+            run_case("month", 31, per_day, zones)
+        for per_day in BOOKINGS_PER_DAY:
+            run_case("month dates", 31, per_day, zones, limit=1)
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("⏱️  Calendly Clone - Slot Engine Comparison")
+    print("="*50)
+    if not slot_bitmap.NUMPY_AVAILABLE:
+        print("❌ numpy is not installed (pip install numpy)")
+        sys.exit(1)
+    run_benchmark()
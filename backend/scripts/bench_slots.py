@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Slot Engine Benchmark
+Compares the sweep-line slot engine with the old slot x booking loop
+for a single day holding 0 to 1,000 bookings.
+
+Usage:
+    cd backend
+    python -m scripts.bench_slots
+"""
+import random
+import sys
+import timeit
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.slots import availability_windows, find_free_slots, merge_busy_intervals, slot_step
+
+BOOKING_COUNTS = [0, 10, 50, 100, 250, 500, 1000]
+DURATION_MINUTES = 15
+BUFFER_BEFORE = timedelta(minutes=0)
+BUFFER_AFTER = timedelta(minutes=0)
+DAY = date(2030, 1, 7)
+INTERVALS = [{"start_time": "00:00", "end_time": "24:00"}]
+
+
+def make_scattered_bookings(count: int, seed: int = 42):
+    """Random 1-2 minute bookings spread across the whole day."""
+    rng = random.Random(seed)
+    midnight = datetime.combine(DAY, datetime.min.time(), tzinfo=dt_timezone.utc)
+    bookings = []
+    for _ in range(count):
+        start = midnight + timedelta(minutes=rng.randrange(0, 24 * 60 - 30))
+        bookings.append((start, start + timedelta(minutes=rng.choice([1, 2]))))
+    return bookings
+
+
+def make_clustered_bookings(count: int, seed: int = 42):
+    """Bookings packed into the morning, leaving the rest of the day free."""
+    rng = random.Random(seed)
+    midnight = datetime.combine(DAY, datetime.min.time(), tzinfo=dt_timezone.utc)
+    bookings = []
+    for _ in range(count):
+        start = midnight + timedelta(seconds=rng.randrange(0, 6 * 3600))
+        bookings.append((start, start + timedelta(minutes=rng.choice([5, 10, 15]))))
+    rng.shuffle(bookings)
+    return bookings
+
+
+SCENARIOS = {
+    "scattered": make_scattered_bookings,
+    "clustered": make_clustered_bookings,
+}
+
+
+def legacy_slots(bookings, earliest):
+    """The previous nested loop from get_available_slots."""
+    slots = []
+    duration = timedelta(minutes=DURATION_MINUTES)
+    step = slot_step(DURATION_MINUTES)
+    for window_start, window_end in availability_windows(DAY, INTERVALS):
+        current = window_start
+        while current + duration <= window_end:
+            slot_end = current + duration
+            is_available = True
+            for booking_start, booking_end in bookings:
+                if not (slot_end <= booking_start - BUFFER_BEFORE or current >= booking_end + BUFFER_AFTER):
+                    is_available = False
+                    break
+            if current < earliest:
+                is_available = False
+            if is_available:
+                slots.append((current, slot_end))
+            current += step
+    return slots
+
+
+def engine_slots(bookings, earliest):
+    """Sweep-line slot engine."""
+    busy = merge_busy_intervals(bookings, BUFFER_BEFORE, BUFFER_AFTER)
+    return find_free_slots(
+        availability_windows(DAY, INTERVALS),
+        busy,
+        duration=timedelta(minutes=DURATION_MINUTES),
+        step=slot_step(DURATION_MINUTES),
+        earliest=earliest
+    )
+
+
+def run_benchmark():
+    """Time both implementations for each booking count."""
+    earliest = datetime.combine(DAY, datetime.min.time(), tzinfo=dt_timezone.utc)
+
+    for name, make_bookings in SCENARIOS.items():
+        print(f"\n{name} bookings")
+        print(f"{'bookings':>8} {'slots':>6} {'legacy (ms)':>12} {'engine (ms)':>12} {'speedup':>8}")
+        for count in BOOKING_COUNTS:
+            bookings = make_bookings(count)
+
+            expected = legacy_slots(bookings, earliest)
+            actual = engine_slots(bookings, earliest)
+            assert actual == expected, f"engine output differs for {count} {name} bookings"
+
+            runs = 20
+            legacy_ms = min(timeit.repeat(lambda: legacy_slots(bookings, earliest), number=runs, repeat=3)) / runs * 1000
+            engine_ms = min(timeit.repeat(lambda: engine_slots(bookings, earliest), number=runs, repeat=3)) / runs * 1000
+
+            print(f"{count:>8} {len(actual):>6} {legacy_ms:>12.3f} {engine_ms:>12.3f} {legacy_ms / engine_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("⏱️  Calendly Clone - Slot Engine Benchmark")
+    print("="*50)
+    run_benchmark()
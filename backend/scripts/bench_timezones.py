@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Timezone Conversion Benchmark
+Compares the cached per-day offset tables with converting every slot
+through zoneinfo (`astimezone`) over 365 days in a few dozen zones, and
+checks both agree on every wall time, including DST transition days.
+
+Usage:
+    cd backend
+    python -m scripts.bench_timezones
+"""
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.timezones import _year_table, local_to_utc, utc_to_local, zone_day
+
+YEAR = 2030
+# Slot grid of a 30-minute event type, around the clock
+SLOT_OFFSETS = [timedelta(minutes=minute) for minute in range(0, 24 * 60, 30)]
+ZONES = [
+    "UTC", "Europe/London", "Europe/Dublin", "Europe/Lisbon", "Europe/Paris",
+    "Europe/Berlin", "Europe/Helsinki", "Europe/Moscow", "Europe/Istanbul",
+    "Africa/Cairo", "Africa/Casablanca", "Africa/Johannesburg", "Asia/Dubai",
+    "Asia/Tehran", "Asia/Kolkata", "Asia/Kathmandu", "Asia/Dhaka",
+    "Asia/Bangkok", "Asia/Shanghai", "Asia/Tokyo", "Asia/Jerusalem",
+    "Australia/Adelaide", "Australia/Sydney", "Australia/Lord_Howe",
+    "Australia/Eucla", "Pacific/Auckland", "Pacific/Chatham", "Pacific/Apia",
+    "America/St_Johns", "America/Halifax", "America/New_York",
+    "America/Chicago", "America/Denver", "America/Phoenix",
+    "America/Los_Angeles", "America/Anchorage", "Pacific/Honolulu",
+    "America/Santiago", "America/Sao_Paulo", "America/Havana",
+]
+DAYS = [date(YEAR, 1, 1) + timedelta(days=offset) for offset in range(365)]
+
+
+def zoneinfo_slots(zone_name: str):
+    """Every slot of the year converted to UTC and back with zoneinfo."""
+    zone = ZoneInfo(zone_name)
+    result = []
+    for day in DAYS:
+        midnight = datetime.combine(day, datetime.min.time())
+        for offset in SLOT_OFFSETS:
+            start = (midnight + offset).replace(tzinfo=zone).astimezone(dt_timezone.utc)
+            result.append((start, start.astimezone(zone).replace(tzinfo=None)))
+    return result
+
+
+def table_slots(zone_name: str):
+    """Every slot of the year converted with the cached offset tables (one lookup per day)."""
+    result = []
+    for day in DAYS:
+        entry = zone_day(zone_name, day)
+        if entry.uniform:
+            midnight = datetime.combine(day, datetime.min.time())
+            for offset in SLOT_OFFSETS:
+                result.append((entry.start + offset, midnight + offset))
+        else:
+            for offset in SLOT_OFFSETS:
+                start = local_to_utc(zone_name, day, offset)
+                result.append((start, utc_to_local(start, zone_name, day)))
+    return result
+
+
+def timed(function):
+    """Run `function` once for every zone and return (results, seconds)."""
+    began = time.perf_counter()
+    results = {zone_name: function(zone_name) for zone_name in ZONES}
+    return results, time.perf_counter() - began
+
+
+def run_benchmark():
+    """Time both approaches and compare their output."""
+    slot_count = len(ZONES) * len(DAYS) * len(SLOT_OFFSETS)
+    print(f"{len(ZONES)} zones x {len(DAYS)} days x {len(SLOT_OFFSETS)} slots = {slot_count:,} conversions\n")
+
+    expected, zoneinfo_seconds = timed(zoneinfo_slots)
+
+    _year_table.cache_clear()
+    actual, cold_seconds = timed(table_slots)
+    actual, warm_seconds = timed(table_slots)
+
+    for zone_name in ZONES:
+        assert actual[zone_name] == expected[zone_name], f"table output differs for {zone_name}"
+
+    transition_days = sum(
+        1 for zone_name in ZONES for entry in _year_table(zone_name, YEAR)[1] if not entry.uniform
+    )
+    print(f"DST transition days (zoneinfo fallback): {transition_days}")
+    print(f"{'method':>18} {'total (ms)':>11} {'per slot (µs)':>14} {'speedup':>8}")
+    for label, seconds in [("zoneinfo", zoneinfo_seconds), ("tables (cold)", cold_seconds), ("tables (warm)", warm_seconds)]:
+        print(f"{label:>18} {seconds * 1000:>11.1f} {seconds / slot_count * 1e6:>14.3f} {zoneinfo_seconds / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("⏱️  Calendly Clone - Timezone Conversion Benchmark")
+    print("="*50)
+    run_benchmark()
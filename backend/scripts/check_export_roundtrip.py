@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Export Round Trip Check
+Writes sample bookings through the GET /meetings/export CSV formatters,
+reads the file back through the POST /meetings/import parser and row
+validation, and checks every imported field equals the exported booking.
+The samples include names, reasons and emails starting with formula
+prefixes, guests, and a cancelled booking.
+
+Needs no database.
+
+Usage:
+    cd backend
+    python -m scripts.check_export_roundtrip
+"""
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.routes.bookings import validate_import_row
+from app.services.booking_import import ImportRow, read_rows
+from app.services.meeting_export import csv_header, csv_lines, csv_row
+
+EVENT_TYPE = SimpleNamespace(id="et-1", name="=Intro call", durationMinutes=30)
+
+
+def sample_bookings() -> list:
+    start = datetime(2026, 3, 2, 15, 0, tzinfo=dt_timezone.utc)
+    created = datetime(2026, 2, 1, 9, 0, tzinfo=dt_timezone.utc)
+    samples = [
+        ("Ada Lovelace", "ada@example.com", "Europe/London", [], None, None),
+        ("'quoted", "max@example.com", "UTC", [], None, None),
+        ("=HYPERLINK(\"http://x\")", "-dash@example.com", "UTC", ["+plus@example.com", "guest@example.com"], None, None),
+        ("@mention, \"quoted\"", "=eq@example.com", "Asia/Kolkata", ["=guest@example.com"], None, None),
+        ("'=Already quoted", "bob@example.com", "America/New_York", [], created, "-moved to next week"),
+    ]
+    return [
+        SimpleNamespace(
+            id=f"b-{index}",
+            eventTypeId=EVENT_TYPE.id,
+            startTime=start + timedelta(hours=index),
+            endTime=start + timedelta(hours=index, minutes=EVENT_TYPE.durationMinutes),
+            inviteeName=name,
+            inviteeEmail=email,
+            inviteeTimezone=zone,
+            guests=guests,
+            cancelledAt=cancelled_at,
+            cancelReason=reason,
+            createdAt=created,
+        )
+        for index, (name, email, zone, guests, cancelled_at, reason) in enumerate(samples)
+    ]
+
+
+async def single_chunk(data: bytes):
+    yield data
+
+
+def differences(booking, row) -> list:
+    """Names of the fields the imported row got wrong."""
+    expected = {
+        "event_type_id": booking.eventTypeId,
+        "start": booking.startTime,
+        "end": booking.endTime,
+        "invitee_name": booking.inviteeName,
+        "invitee_email": booking.inviteeEmail,
+        "invitee_timezone": booking.inviteeTimezone,
+        "guests": booking.guests,
+        "cancelled_at": booking.cancelledAt,
+        "cancel_reason": booking.cancelReason,
+    }
+    return [name for name, value in expected.items() if getattr(row, name) != value]
+
+
+async def check() -> int:
+    bookings = sample_bookings()
+    exported = csv_header() + csv_lines(
+        csv_row(booking, "cancelled" if booking.cancelledAt else "confirmed", EVENT_TYPE.name)
+        for booking in bookings
+    )
+
+    failures = 0
+    rows = [item async for item in read_rows(single_chunk(exported.encode("utf-8")), "csv")]
+    if len(rows) != len(bookings):
+        print(f"  ❌ {len(bookings)} bookings exported, {len(rows)} rows read")
+        return 1
+
+    for booking, (row_number, fields) in zip(bookings, rows):
+        row = fields if isinstance(fields, str) else validate_import_row(row_number, fields, {EVENT_TYPE.id: EVENT_TYPE})
+        if not isinstance(row, ImportRow):
+            print(f"  ❌ {booking.id}: rejected ({row if isinstance(row, str) else row.reason})")
+            failures += 1
+            continue
+        wrong = differences(booking, row)
+        if wrong:
+            print(f"  ❌ {booking.id}: {', '.join(wrong)} changed")
+            failures += 1
+        else:
+            print(f"  ✅ {booking.id}: {booking.inviteeName!r} <{booking.inviteeEmail}>")
+
+    print("\n" + "="*50)
+    if failures:
+        print(f"❌ {failures} of {len(bookings)} bookings did not survive export and import")
+    else:
+        print(f"✅ All {len(bookings)} bookings imported as exported")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("🔁 Export Round Trip Check")
+    print("="*50)
+    sys.exit(asyncio.run(check()))
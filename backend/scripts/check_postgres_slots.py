@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Postgres Slot Engine Check
+Computes the free slots of individual event types both with the Python
+path used by GET /public/slots (slot context + sweep-line engine) and
+with the database function from prisma/sql/free_slots.sql, day by day,
+and checks both give identical output. Also reports the time each path
+takes.
+
+Needs a database with prisma/sql/free_slots.sql applied.
+
+Usage:
+    cd backend
+    python -m scripts.check_postgres_slots
+    python -m scripts.check_postgres_slots --event-type-id <id> --days 90
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import connect_db, disconnect_db, prisma
+from app.routes.bookings import (
+    free_slots_for_dates,
+    free_slots_in_database,
+    load_host_schedules,
+    load_slot_context,
+    schedule_zone_name,
+)
+from app.routes.event_types import get_scheduling_type_str, get_team_host_ids
+from app.services.timezones import get_zone
+
+# Invitee timezones checked besides the owner's schedule timezone
+INVITEE_ZONES = ["UTC", "America/New_York", "Asia/Kolkata"]
+
+
+async def check_event_type(event_type, days: int) -> int:
+    """Compare both paths for every date of the next `days` days; returns the number of mismatching dates."""
+    schedules = await load_host_schedules(event_type, get_team_host_ids(event_type))
+    if not schedules:
+        print(f"  {event_type.name}: no default schedule, skipped")
+        return 0
+
+    mismatches = 0
+    python_seconds = database_seconds = 0.0
+    zones = [schedule_zone_name(next(iter(schedules.values())))] + INVITEE_ZONES
+    earliest = datetime.now(dt_timezone.utc) + timedelta(hours=event_type.minNoticeHours)
+    for zone in dict.fromkeys(zones):
+        first_date = earliest.astimezone(get_zone(zone)).date()
+        for offset in range(days):
+            slot_date = first_date + timedelta(days=offset)
+
+            started = time.perf_counter()
+            context = await load_slot_context(event_type, schedules, slot_date, slot_date, zone)
+            expected = free_slots_for_dates(event_type, context, [slot_date], earliest)[0]
+            python_seconds += time.perf_counter() - started
+
+            started = time.perf_counter()
+            actual = (await free_slots_in_database(event_type, schedules, [slot_date], earliest, zone))[0]
+            database_seconds += time.perf_counter() - started
+
+            if actual != expected:
+                mismatches += 1
+                print(f"  MISMATCH {event_type.name} {slot_date} ({zone}): python {len(expected)} slots, postgres {len(actual)}")
+                print(f"    only python:   {sorted(set(expected) - set(actual))[:5]}")
+                print(f"    only postgres: {sorted(set(actual) - set(expected))[:5]}")
+
+    checked = days * len(dict.fromkeys(zones))
+    print(
+        f"  {event_type.name}: {checked} dates, {mismatches} mismatches | "
+        f"python {python_seconds * 1000 / checked:.2f} ms/date, "
+        f"postgres {database_seconds * 1000 / checked:.2f} ms/date"
+    )
+    return mismatches
+
+
+async def run_check(event_type_id: str, days: int) -> int:
+    await connect_db()
+    try:
+        where = {"id": event_type_id} if event_type_id else {"isActive": True, "capacity": 1}
+        event_types = [
+            event_type
+            for event_type in await prisma.eventtype.find_many(where=where, include={"hosts": True})
+            if get_scheduling_type_str(event_type.schedulingType) == "individual"
+        ]
+        if not event_types:
+            raise SystemExit("No individual event types to check")
+
+        mismatches = 0
+        for event_type in event_types:
+            mismatches += await check_event_type(event_type, days)
+    finally:
+        await disconnect_db()
+
+    print("\n" + "="*50)
+    print("✅ Identical output" if not mismatches else f"❌ {mismatches} mismatching dates")
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--event-type-id", help="check one event type (default: every active individual event type)")
+    parser.add_argument("--days", type=int, default=60, help="dates to check per timezone (default: 60)")
+    args = parser.parse_args()
+
+    print("="*50)
+    print("🐘 Postgres Slot Engine Check")
+    print("="*50)
+    sys.exit(1 if asyncio.run(run_check(args.event_type_id, args.days)) else 0)
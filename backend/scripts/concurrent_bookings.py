@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Concurrent Booking Test
+Fires hundreds of simultaneous booking requests at one slot of a running
+server and checks that exactly one succeeds and the rest get 409, i.e.
+that the booking overlap constraint (prisma/sql/booking_no_overlap.sql)
+prevents double booking.
+
+Usage:
+    cd backend
+    python -m scripts.concurrent_bookings --event-type-id <id> --date 2030-03-04
+    python -m scripts.concurrent_bookings --event-type-id <id> --date 2030-03-04 --requests 500
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+
+import httpx
+
+DEFAULT_URL = "http://localhost:8000/api/v1"
+
+
+async def first_free_slot(client: httpx.AsyncClient, event_type_id: str, day: str) -> str:
+    """Start time (UTC wall clock) of the first free slot on `day`."""
+    response = await client.get(
+        "/public/slots",
+        params={"event_type_id": event_type_id, "date": day, "timezone": "UTC"}
+    )
+    response.raise_for_status()
+    slots = response.json()["slots"]
+    if not slots:
+        raise SystemExit(f"No free slots on {day} - pick another --date")
+    return f"{day}T{slots[0]['start_time']}:00"
+
+
+async def book(client: httpx.AsyncClient, event_type_id: str, start_time: str, number: int) -> int:
+    """POST one booking and return its status code."""
+    response = await client.post(
+        "/public/bookings",
+        json={
+            "event_type_id": event_type_id,
+            "start_time": start_time,
+            "timezone": "UTC",
+            "invitee": {"name": f"Load Test {number}", "email": f"load-test-{number}@example.com"},
+        }
+    )
+    return response.status_code
+
+
+async def run_test(url: str, event_type_id: str, day: str, requests: int):
+    """Book one slot `requests` times at once and tally the responses."""
+    limits = httpx.Limits(max_connections=requests, max_keepalive_connections=requests)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        start_time = await first_free_slot(client, event_type_id, day)
+        print(f"Slot: {start_time} UTC, {requests} concurrent requests\n")
+
+        began = time.perf_counter()
+        codes = await asyncio.gather(*(book(client, event_type_id, start_time, n) for n in range(requests)))
+        elapsed = time.perf_counter() - began
+
+    tally = Counter(codes)
+    for code, count in sorted(tally.items()):
+        print(f"  HTTP {code}: {count}")
+    print(f"\n  {elapsed * 1000:.0f} ms total, {elapsed / requests * 1000:.2f} ms per request")
+
+    assert tally[201] == 1, f"expected exactly one booking, got {tally[201]}"
+    assert tally[409] == requests - 1, "every other request should be rejected with 409"
+    print("\n✅ Exactly one booking created")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--event-type-id", required=True)
+    parser.add_argument("--date", required=True, help="YYYY-MM-DD with at least one free slot")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--url", default=DEFAULT_URL)
+    args = parser.parse_args()
+
+    print("="*50)
+    print("⏱️  Calendly Clone - Concurrent Booking Test")
+    print("="*50)
+    asyncio.run(run_test(args.url, args.event_type_id, args.date, args.requests))
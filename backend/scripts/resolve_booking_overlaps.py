@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Resolve Booking Overlaps
+Lists CONFIRMED bookings of the same host that overlap in time (seats of
+the same group slot excepted), which keep prisma/sql/booking_no_overlap.sql
+from adding its constraint. With --cancel, the booking made first of each
+conflict is kept and the later ones are cancelled; their seats and booking
+cap counters are updated.
+
+Usage:
+    cd backend
+    python -m scripts.resolve_booking_overlaps            # report only
+    python -m scripts.resolve_booking_overlaps --cancel
+"""
+import argparse
+import asyncio
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import connect_db, disconnect_db, prisma
+from app.services.booking_caps import refresh_counters
+from app.services.seats import release_seats
+
+# Ids of CONFIRMED bookings that overlap another one of their host
+OVERLAPPING_SQL = """
+SELECT DISTINCT b.id
+FROM bookings a
+JOIN bookings b
+    ON b.host_id = a.host_id
+    AND b.id <> a.id
+    AND COALESCE(a.slot_id, a.id) <> COALESCE(b.slot_id, b.id)
+    AND a.start_time < b.end_time
+    AND b.start_time < a.end_time
+WHERE a.status = 'CONFIRMED' AND b.status = 'CONFIRMED'
+"""
+
+CANCEL_REASON = "Overlapped an earlier booking"
+
+
+def later_conflicts(bookings: list) -> list:
+    """Bookings overlapping one made before them, taking bookings in creation order."""
+    by_host = defaultdict(list)
+    for booking in bookings:
+        by_host[booking.hostId].append(booking)
+
+    losers = []
+    for host_bookings in by_host.values():
+        kept = []
+        for booking in sorted(host_bookings, key=lambda item: (item.createdAt, item.id)):
+            slot = booking.slotId or booking.id
+            if any(
+                (other.slotId or other.id) != slot
+                and other.startTime < booking.endTime
+                and booking.startTime < other.endTime
+                for other in kept
+            ):
+                losers.append(booking)
+            else:
+                kept.append(booking)
+    return losers
+
+
+async def resolve(cancel: bool) -> int:
+    await connect_db()
+    try:
+        rows = await prisma.query_raw(OVERLAPPING_SQL)
+        bookings = await prisma.booking.find_many(where={"id": {"in": [row["id"] for row in rows]}}) if rows else []
+        losers = later_conflicts(bookings)
+
+        for booking in losers:
+            print(f"  {booking.hostId} {booking.startTime} - {booking.endTime} {booking.inviteeEmail} ({booking.id})")
+
+        if cancel and losers:
+            async with prisma.tx() as transaction:
+                await transaction.booking.update_many(
+                    where={"id": {"in": [booking.id for booking in losers]}, "status": "CONFIRMED"},
+                    data={
+                        "status": "CANCELLED",
+                        "cancelledAt": datetime.utcnow(),
+                        "cancelReason": CANCEL_REASON,
+                        "cancelledBy": "host"
+                    }
+                )
+                await release_seats(transaction, losers)
+            await refresh_counters(host_ids={booking.hostId for booking in losers})
+    finally:
+        await disconnect_db()
+
+    print("\n" + "="*50)
+    if not losers:
+        print("✅ No overlapping bookings")
+    elif cancel:
+        print(f"✅ Cancelled {len(losers)} overlapping bookings")
+    else:
+        print(f"❌ {len(losers)} bookings overlap an earlier one (run with --cancel to cancel them)")
+    return 0 if cancel or not losers else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cancel", action="store_true", help="cancel the later booking of every overlap")
+    args = parser.parse_args()
+
+    print("="*50)
+    print("🧹 Resolve Booking Overlaps")
+    print("="*50)
+    sys.exit(asyncio.run(resolve(args.cancel)))